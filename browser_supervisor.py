@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Steam Keys Checker - Browser supervisor
+Keep one Chrome healthy for runs of thousands of keys: every check runs
+under a hard timeout, and the driver is transparently restarted (with the
+Steamworks login carried over through its cookies) after N keys, above a
+memory threshold, when checks become much slower than right after start,
+or when the browser crashed.
+
+Memory is measured with psutil over chromedriver and every Chrome process
+it started; the same process tree is killed when the browser hangs.
+"""
+
+import logging
+import statistics
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as CheckTimeout
+
+import psutil
+
+from status_model import INVALID_FORMAT
+
+RECYCLE_EVERY = 500  # Keys checked before a planned restart (None = never)
+MAX_MEMORY_MB = 1500  # Browser memory triggering a restart (None = never)
+MEMORY_SAMPLE_EVERY = 20  # Keys between two memory measurements
+LATENCY_WINDOW = 20  # Checks in the baseline and in the recent latency medians
+LATENCY_FACTOR = 2.0  # Restart when the recent median exceeds the baseline by this factor
+CHECK_TIMEOUT = 90  # Seconds before a hung check is abandoned and the browser killed
+
+# Error texts meaning the browser session is gone: the key is retried once on a new browser
+DEAD_SESSION_MARKERS = (
+    "invalid session id", "tab crashed", "chrome not reachable", "session deleted",
+    "no such window", "target window already closed", "disconnected", "max retries exceeded",
+    "connection refused",
+)
+
+COOKIE_FIELDS = ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite", "expires")
+
+
+def browser_processes(driver):
+    """chromedriver and its Chrome children, as psutil processes (empty once chromedriver is gone)."""
+    try:
+        root = psutil.Process(driver.service.process.pid)
+        return [root] + root.children(recursive=True)
+    except (AttributeError, psutil.Error):
+        return []
+
+
+def browser_memory_mb(driver):
+    """Resident memory of the whole browser in MB, or None when it cannot be measured."""
+    processes = browser_processes(driver)
+    if not processes:
+        return None
+    total = 0
+    for process in processes:
+        try:
+            total += process.memory_info().rss
+        except Exception:
+            pass  # Renderer exited in the meantime
+    return total / (1024 * 1024)
+
+
+def kill_browser(driver):
+    """Kill chromedriver and Chrome without going through the (possibly hung) WebDriver protocol."""
+    processes = browser_processes(driver)
+    for process in reversed(processes):
+        try:
+            process.kill()
+        except Exception:
+            pass
+    if not processes:
+        try:
+            driver.service.process.kill()
+        except Exception:
+            pass
+
+
+def is_dead_session(raw_status):
+    text = str(raw_status).lower()
+    return text.startswith("error") and any(marker in text for marker in DEAD_SESSION_MARKERS)
+
+
+class BrowserSupervisor:
+    """
+    Owns the driver of a run. Use `supervisor.driver` for direct access and
+    `supervisor.check(check_fn, steam_key)` for the checks.
+    """
+
+    def __init__(self, start_driver, login_url, recycle_every=RECYCLE_EVERY, max_memory_mb=MAX_MEMORY_MB,
+                 check_timeout=CHECK_TIMEOUT, on_restart=None, on_login_lost=None):
+        self.logger = logging.getLogger(__name__)
+        self.start_driver = start_driver
+        self.login_url = login_url
+        self.recycle_every = recycle_every
+        self.max_memory_mb = max_memory_mb
+        self.check_timeout = check_timeout
+        self.on_restart = on_restart  # Called with the new driver after every restart
+        self.on_login_lost = on_login_lost  # Called with the new driver if the cookies did not restore the login
+        self.cookies = []
+        self.closed = False
+        self.restarts = 0
+        self.pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="browser-check")
+        self.driver = start_driver()
+        self.reset_counters()
+
+    def reset_counters(self):
+        self.keys_since_start = 0
+        self.baseline = []
+        self.recent = deque(maxlen=LATENCY_WINDOW)
+        self.memory_mb = None
+
+    # --- Login ---
+
+    def save_login(self):
+        """Remember the session cookies (call once logged in; refreshed before each planned restart)."""
+        try:
+            self.cookies = self.driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]
+        except Exception:
+            self.cookies = self.driver.get_cookies()
+
+    def restore_login(self):
+        if self.cookies:
+            params = [{field: cookie[field] for field in COOKIE_FIELDS if field in cookie} for cookie in self.cookies]
+            for cookie in params:
+                if cookie.get("expires", 0) < 0:
+                    del cookie["expires"]  # Session cookie
+            try:
+                self.driver.execute_cdp_cmd("Network.setCookies", {"cookies": params})
+            except Exception:
+                # Without CDP: cookies can only be set for the page currently open
+                self.driver.get(self.login_url)
+                for cookie in self.cookies:
+                    try:
+                        self.driver.add_cookie({k: cookie[k] for k in ("name", "value", "path", "secure", "httpOnly")
+                                                if k in cookie})
+                    except Exception:
+                        pass
+        if not self.is_logged_in():
+            self.logger.warning("Steamworks login not restored after the browser restart")
+            if self.on_login_lost:
+                self.on_login_lost(self.driver)
+
+    def is_logged_in(self):
+        """Open the key form page: Steamworks only shows the cdkey field to a logged-in account."""
+        self.driver.get(self.login_url)
+        return bool(self.driver.find_elements("name", "cdkey"))
+
+    # --- Restarts ---
+
+    def ensure_alive(self):
+        """Restart the browser if it was closed or crashed while idle (long-lived sessions)."""
+        try:
+            self.driver.current_url
+        except Exception:
+            self.restart("browser closed or unreachable", alive=False)
+
+    def recycle_reason(self):
+        """Why the browser should be restarted before the next check, or None."""
+        if self.recycle_every and self.keys_since_start >= self.recycle_every:
+            return f"{self.keys_since_start} keys checked"
+        if self.max_memory_mb and self.memory_mb and self.memory_mb > self.max_memory_mb:
+            return f"{self.memory_mb:.0f} MB used"
+        if len(self.baseline) == LATENCY_WINDOW and len(self.recent) == LATENCY_WINDOW:
+            baseline, recent = statistics.median(self.baseline), statistics.median(self.recent)
+            if recent > baseline * LATENCY_FACTOR:
+                return f"checks slowed down from {baseline:.1f} s to {recent:.1f} s"
+        return None
+
+    def restart(self, reason, alive=True):
+        """Replace the driver by a fresh one, logged in with the saved cookies."""
+        self.logger.info("Restarting the browser: %s", reason)
+        if alive:
+            try:
+                self.save_login()
+            except Exception:
+                pass  # Keep the last saved cookies
+            try:
+                self.driver.quit()
+            except Exception:
+                kill_browser(self.driver)
+        else:
+            kill_browser(self.driver)
+        self.driver = self.start_driver()
+        self.restarts += 1
+        self.reset_counters()
+        self.restore_login()
+        if self.on_restart:
+            self.on_restart(self.driver)
+
+    # --- Checks ---
+
+    def run_with_timeout(self, check, steam_key):
+        future = self.pool.submit(check, self.driver, steam_key)
+        try:
+            return future.result(timeout=self.check_timeout)
+        except CheckTimeout:
+            # The worker thread stays blocked in the hung call until the browser dies
+            kill_browser(self.driver)
+            self.pool.shutdown(wait=False)
+            self.pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="browser-check")
+            if not self.closed:
+                self.restart(f"check hung for more than {self.check_timeout} s", alive=False)
+            return f"Error: check timed out after {self.check_timeout} s"
+
+    def check(self, check, steam_key):
+        """Raw status of `check(driver, steam_key)`, restarting the browser when needed."""
+        reason = self.recycle_reason()
+        if reason:
+            self.restart(reason)
+
+        restarts = self.restarts
+        started = time.monotonic()
+        raw_status = self.run_with_timeout(check, steam_key)
+        if is_dead_session(raw_status) and not self.closed:
+            self.restart(f"browser session lost ({raw_status})", alive=False)
+            restarts = self.restarts
+            started = time.monotonic()
+            raw_status = self.run_with_timeout(check, steam_key)
+
+        # A check cut short by a restart says nothing about the new browser's speed
+        if raw_status != INVALID_FORMAT and self.restarts == restarts:
+            self.record(time.monotonic() - started)
+        return raw_status
+
+    def record(self, latency):
+        self.keys_since_start += 1
+        if len(self.baseline) < LATENCY_WINDOW:
+            self.baseline.append(latency)
+        else:
+            self.recent.append(latency)
+        if self.max_memory_mb and self.keys_since_start % MEMORY_SAMPLE_EVERY == 0:
+            self.memory_mb = browser_memory_mb(self.driver)
+
+    def quit(self):
+        self.closed = True
+        try:
+            self.driver.quit()
+        except Exception:
+            kill_browser(self.driver)
+        self.pool.shutdown(wait=False)
@@ -2,14 +2,61 @@
 """
 Script de packaging pour Steam Keys Checker
 Crée un exécutable distributable de l'application.
+
+Usage:
+    python build_app.py                          # Interactif, profil onefile
+    python build_app.py --profile fast-startup   # Dossier onedir, démarrage rapide
+    python build_app.py --benchmark              # Mesure le démarrage du build existant
 """
 
+import argparse
 import os
+import re
 import sys
 import subprocess
 import shutil
+import statistics
+import tempfile
+import time
 from pathlib import Path
 
+APP_NAME = 'SteamKeysChecker'
+
+# Sous-modules lourds jamais utilisés par l'application (profil fast-startup uniquement).
+# Vérifiés contre le graphe d'import de pandas / pyarrow : pandas.plotting,
+# pydoc (pyarrow.compute) et unittest (numpy.testing) y restent nécessaires.
+EXCLUDES = [
+    'matplotlib',
+    'scipy',
+    'IPython',
+    'jinja2',
+    'notebook',
+    'pytest',
+    'PIL',
+    'pandas.tests',
+    'numpy.tests',
+    'numpy.f2py',
+    'tkinter.test',
+]
+
+# Profils de build
+PROFILES = {
+    # Un seul fichier, décompressé dans un dossier temporaire à chaque lancement
+    'onefile': ['--onefile'],
+    # Dossier onedir (rien à décompresser), sans les modules inutiles,
+    # bytecode précompilé et optimisé (--optimize ajouté si PyInstaller >= 6.6)
+    'fast-startup': ['--onedir', '--noupx']
+                    + [f'--exclude-module={name}' for name in EXCLUDES],
+}
+
+# Options disponibles seulement à partir d'une version de PyInstaller
+VERSIONED_OPTIONS = {
+    'fast-startup': [((6, 6), '--optimize=1')],
+}
+
+BENCHMARK_RUNS = 5
+BENCHMARK_TIMEOUT = 60  # Secondes max pour qu'une fenêtre s'affiche
+
 def install_pyinstaller():
     """Installe PyInstaller si nécessaire."""
     try:
@@ -20,6 +67,25 @@ def install_pyinstaller():
         subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller"])
         print("✅ PyInstaller installé")
 
+def pyinstaller_version():
+    """Version installée de PyInstaller sous forme de tuple, (0,) si inconnue."""
+    try:
+        import PyInstaller
+        return tuple(int(part) for part in re.findall(r'\d+', PyInstaller.__version__)[:3])
+    except (ImportError, AttributeError):
+        return (0,)
+
+def profile_options(profile):
+    """Options du profil, sans celles que la version installée de PyInstaller ne connaît pas."""
+    options = list(PROFILES[profile])
+    version = pyinstaller_version()
+    for minimum, option in VERSIONED_OPTIONS.get(profile, []):
+        if version >= minimum:
+            options.append(option)
+        else:
+            print(f"⚠️  {option} ignoré: PyInstaller {'.'.join(map(str, minimum))}+ requis")
+    return options
+
 def clean_build():
     """Nettoie les dossiers de build précédents."""
     folders_to_clean = ['build', 'dist', '__pycache__']
@@ -90,16 +156,16 @@ exe = EXE(
     
     print("✅ Fichier .spec créé")
 
-def build_executable():
+def build_executable(profile='onefile'):
     """Construit l'exécutable."""
-    print("🔨 Construction de l'exécutable...")
+    print(f"🔨 Construction de l'exécutable (profil {profile})...")
     
     cmd = [
         'pyinstaller',
-        '--onefile',
+        *profile_options(profile),
         '--windowed',
-        '--name=SteamKeysChecker',
-        '--add-data=README.md:.',
+        f'--name={APP_NAME}',
+        f'--add-data=README.md{os.pathsep}.',
         'steam_keys_gui.py'
     ]
     
@@ -112,6 +178,72 @@ def build_executable():
     
     return True
 
+def find_executable():
+    """Retourne le chemin de l'exécutable construit (onefile ou onedir)."""
+    suffix = '.exe' if sys.platform == "win32" else ''
+    candidates = [
+        Path('dist') / APP_NAME / f'{APP_NAME}{suffix}',  # onedir
+        Path('dist') / f'{APP_NAME}{suffix}',  # onefile
+        Path('dist') / f'{APP_NAME}.app' / 'Contents' / 'MacOS' / APP_NAME,
+    ]
+    for candidate in candidates:
+        if candidate.is_file():
+            return candidate
+    return None
+
+def bundle_size(executable):
+    """Taille du build sur disque (dossier complet en onedir)."""
+    root = executable.parent if executable.parent.name == APP_NAME else executable
+    if root.is_file():
+        return root.stat().st_size
+    return sum(f.stat().st_size for f in root.rglob('*') if f.is_file())
+
+def benchmark_launch(executable, runs=BENCHMARK_RUNS):
+    """
+    Mesure le temps entre le lancement du processus et l'affichage de la fenêtre.
+    
+    L'application est lancée avec --startup-bench <fichier> : elle écrit ce
+    fichier dès que la fenêtre est prête, puis se ferme.
+    """
+    print(f"⏱️  Benchmark de démarrage: {executable} ({runs} lancements)")
+    timings = []
+    
+    for run in range(1, runs + 1):
+        with tempfile.TemporaryDirectory() as tmp:
+            ready_file = Path(tmp) / 'ready'
+            started = time.perf_counter()
+            process = subprocess.Popen([str(executable), '--startup-bench', str(ready_file)])
+            try:
+                while not ready_file.exists():
+                    if process.poll() is not None or time.perf_counter() - started > BENCHMARK_TIMEOUT:
+                        break
+                    time.sleep(0.01)
+                elapsed = time.perf_counter() - started if ready_file.exists() else None
+                process.wait(timeout=BENCHMARK_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        
+        if elapsed is None:
+            print(f"   ❌ Lancement {run}: fenêtre non affichée")
+            continue
+        timings.append(elapsed)
+        print(f"   Lancement {run}: {elapsed * 1000:.0f} ms")
+    
+    if not timings:
+        print("❌ Aucun lancement réussi")
+        return None
+    
+    result = {
+        'executable': str(executable),
+        'size_mb': bundle_size(executable) / (1024 * 1024),
+        'first_ms': timings[0] * 1000,  # Démarrage à froid
+        'median_ms': statistics.median(timings) * 1000,
+    }
+    print(f"📦 Taille du build: {result['size_mb']:.1f} Mo")
+    print(f"🧊 Premier lancement: {result['first_ms']:.0f} ms")
+    print(f"📊 Médiane: {result['median_ms']:.0f} ms")
+    return result
+
 def create_installer_script():
     """Crée un script d'installation simple."""
     if sys.platform == "win32":
@@ -223,9 +355,25 @@ En cas de problème :
     print("✅ README desktop créé")
 
 def main():
+    parser = argparse.ArgumentParser(description="Steam Keys Checker - packaging")
+    parser.add_argument('--profile', choices=list(PROFILES), default='onefile',
+                        help="onefile (un seul fichier) ou fast-startup (onedir, démarrage rapide)")
+    parser.add_argument('--benchmark', action='store_true',
+                        help="Mesurer le démarrage du build existant dans dist/")
+    parser.add_argument('--runs', type=int, default=BENCHMARK_RUNS)
+    args = parser.parse_args()
+    
     print("🔑 Steam Keys Checker - Script de Packaging")
     print("=" * 50)
     
+    if args.benchmark:
+        executable = find_executable()
+        if executable is None:
+            print("❌ Aucun exécutable dans dist/ - construisez-le d'abord")
+            return
+        benchmark_launch(executable, args.runs)
+        return
+    
     # Vérifier qu'on est dans le bon répertoire
     if not os.path.exists('steam_keys_gui.py'):
         print("❌ Erreur: steam_keys_gui.py non trouvé!")
@@ -245,14 +393,16 @@ def main():
     # Demander si on veut créer l'exécutable
     response = input("\n🤔 Voulez-vous créer l'exécutable? (y/N): ").lower()
     if response in ['y', 'yes', 'oui']:
-        if build_executable():
+        if build_executable(args.profile):
             print("\n🎉 Packaging terminé avec succès!")
             print(f"📁 Exécutable disponible dans: dist/")
             
-            if os.path.exists('dist/SteamKeysChecker.exe'):
-                print(f"   - Windows: dist/SteamKeysChecker.exe")
-            elif os.path.exists('dist/SteamKeysChecker'):
-                print(f"   - Unix: dist/SteamKeysChecker")
+            executable = find_executable()
+            if executable:
+                print(f"   - {executable}")
+                response = input("\n⏱️  Mesurer le temps de démarrage? (y/N): ").lower()
+                if response in ['y', 'yes', 'oui']:
+                    benchmark_launch(executable, args.runs)
         else:
             print("\n❌ Erreur lors du packaging")
     else:
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Steam Keys Checker - Multi-file campaign mode
+Check the keys of several campaign sheets in one run: one login, one work
+queue over every file, and results written back per file. With --dedup, a
+key present in several cells or files is checked once.
+
+Usage:
+    python campaign.py data/campaigns/
+    python campaign.py "data/campaigns/*.csv" --mapping campaigns.json [--format parquet] [--delta] [--dedup] [--prioritize]
+
+Mapping file (JSON): per file name or glob, the key columns and either the
+"to check" column or full selection rules (see selection_rules.py). Files
+matching no entry use the main.py columns.
+    {
+        "twitch-*.csv": {"key_columns": ["key_1", "key_2"], "to_check": "to check"},
+        "youtube.csv": {"key_columns": ["Steam key"], "rules": {"column": "status", "eq": "Distributed"}}
+    }
+"""
+
+import argparse
+import glob
+import json
+import logging
+import os
+import random
+import time
+from fnmatch import fnmatch
+
+from key_codec import group_duplicates
+from main import (CHECK_KEY_2, KEY_1_COLUMN, KEY_2_COLUMN, MAX_DELAY, MIN_DELAY, PRIORITY_SCORER,
+                  PROGRESS_EVERY, RECORD_HISTORY, STEAMWORKS_URL, TO_CHECK_COLUMN, check_steam_key, setup_logging,
+                  supervised_browser)
+from results_io import (EXTENSION_FORMATS, OUTPUT_DIR, STATUS_SUFFIX, load_keys_file, merge_deltas,
+                        save_results, status_change, write_delta)
+from run_logging import CONSOLE_LOGGER, flush_logging
+from run_stats import RunStats
+from scheduler import SCORERS, RunBudget
+from status_history import StatusHistory, new_run_id
+from selection_rules import check_rule, select_keys, to_check_rule
+from status_model import normalize_status_columns, split_status, write_status
+
+DEFAULT_MAPPING = {
+    "key_columns": [KEY_1_COLUMN, KEY_2_COLUMN] if CHECK_KEY_2 else [KEY_1_COLUMN],
+    "to_check": TO_CHECK_COLUMN,
+}
+
+
+def expand_sources(source):
+    """A directory (every supported key file in it) or a glob pattern."""
+    if os.path.isdir(source):
+        paths = [os.path.join(source, name) for name in os.listdir(source)]
+    else:
+        paths = glob.glob(source)
+    return sorted(path for path in paths
+                  if os.path.isfile(path) and os.path.splitext(path)[1].lower() in EXTENSION_FORMATS)
+
+
+def load_mapping(path):
+    if not path:
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def mapping_for(path, mappings):
+    """First mapping entry whose pattern matches the file name, over the defaults."""
+    name = os.path.basename(path)
+    for pattern, mapping in mappings.items():
+        if fnmatch(name, pattern):
+            return {**DEFAULT_MAPPING, **mapping}
+    return dict(DEFAULT_MAPPING)
+
+
+class CampaignFile:
+    """One campaign sheet, its column mapping and the statuses written to it."""
+
+    def __init__(self, path, mapping, delta_mode=False):
+        self.path = path
+        self.name = os.path.basename(path)
+        self.df = merge_deltas(path) if delta_mode else load_keys_file(path)
+        self.key_columns = [column for column in mapping["key_columns"] if column in self.df.columns]
+        self.rule = mapping.get("rules") or (to_check_rule(mapping["to_check"]) if mapping.get("to_check") else None)
+        # A wrong rule is reported (and the file skipped) now, not in the middle of the campaign
+        check_rule(self.rule, self.df)
+        self.changes = []
+        for column in self.key_columns:
+            if f"{column}{STATUS_SUFFIX}" not in self.df.columns:
+                self.df[f"{column}{STATUS_SUFFIX}"] = None
+        normalize_status_columns(self.df)
+
+    def work_items(self):
+        """(index, column, key) for every unchecked key of the rows selected by the rules."""
+        return select_keys(self.df, self.key_columns, self.rule)
+
+    def set_status(self, index, column, status, detail=None):
+        status_column = f"{column}{STATUS_SUFFIX}"
+        old_status = write_status(self.df, index, status_column, status, detail)
+        self.changes.append(status_change(index, status_column, old_status, status, detail, key=self.df.at[index, column]))
+        return old_status
+
+    def save(self, output_format, delta_mode, output_dir):
+        if delta_mode:
+            return write_delta(self.changes, self.path)
+        if not self.changes:
+            return None
+        basename = f"{os.path.splitext(self.name)[0]}_with_status"
+        return save_results(self.df, output_format, output_dir, basename=basename)
+
+
+def build_queue(files, scorer=PRIORITY_SCORER, deduplicate=False):
+    """
+    One global queue over every file, in file and row order or, with a
+    `scorer` (see scheduler.py), most useful keys first.
+
+    Work items are ((file number, row index), column, key). With
+    `deduplicate`, a key present in several cells (or files) is queued once
+    and the other cells are returned in the duplicates dict.
+    """
+    scored = []
+    for file_no, campaign_file in enumerate(files):
+        items = campaign_file.work_items()
+        if not items:
+            continue
+        scores = SCORERS[scorer](campaign_file.df) if scorer else None
+        for index, column, key in items:
+            score = scores.get(index, 0.0) if scores is not None else 0.0
+            scored.append((-score, len(scored), ((file_no, index), column, key)))
+    scored.sort()
+    queue = [item for _, _, item in scored]
+    if not deduplicate:
+        return queue, {}
+    return group_duplicates(queue)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Steam Keys Checker - multi-file campaign mode")
+    parser.add_argument("source", help="Directory or glob of CSV / Parquet / Feather key files")
+    parser.add_argument("--mapping", help="JSON column mapping per file name or glob")
+    parser.add_argument("--format", default="csv", choices=["csv", "parquet", "feather"])
+    parser.add_argument("--delta", action="store_true", help="Write one delta per file instead of full copies")
+    parser.add_argument("--prioritize", nargs="?", const="default", default=PRIORITY_SCORER, choices=list(SCORERS),
+                        help="Check the most useful keys first (scheduler.py scorer, default: \"default\")")
+    parser.add_argument("--dedup", action="store_true",
+                        help="Check a key present in several cells or files once and copy its status")
+    parser.add_argument("--max-checks", type=int)
+    parser.add_argument("--max-minutes", type=float)
+    args = parser.parse_args()
+
+    logger = setup_logging()
+    print("🚀 Steam Keys Checker - campaign mode")
+    print("=" * 50)
+
+    paths = expand_sources(args.source)
+    if not paths:
+        print(f"❌ No key file found for {args.source}")
+        return
+
+    mappings = load_mapping(args.mapping)
+    files = []
+    for path in paths:
+        try:
+            campaign_file = CampaignFile(path, mapping_for(path, mappings), args.delta)
+        except Exception as e:
+            logger.error(f"Cannot load {path}: {e}")
+            print(f"❌ {path}: {e}")
+            continue
+        if not campaign_file.key_columns:
+            print(f"⚠️  {campaign_file.name}: no key column found, skipped")
+            continue
+        files.append(campaign_file)
+
+    queue, duplicates = build_queue(files, args.prioritize, deduplicate=args.dedup)
+    for file_no, campaign_file in enumerate(files):
+        count = sum(1 for (owner, _), _, _ in queue if owner == file_no)
+        print(f"📄 {campaign_file.name}: {len(campaign_file.df)} rows, {count} keys to check "
+              f"({', '.join(campaign_file.key_columns)})")
+    duplicate_count = sum(len(cells) for cells in duplicates.values())
+    if duplicate_count:
+        print(f"ℹ️  {duplicate_count} duplicate keys will reuse the status of their first occurrence")
+    if not queue:
+        print("ℹ️  All keys have already been verified or no valid keys found")
+        return
+
+    logger.info(f"Campaign: {len(files)} files, {len(queue)} keys to verify")
+    print(f"\n🔍 {len(queue)} keys to verify across {len(files)} files")
+
+    run_id = new_run_id()
+    output_dir = os.path.join(OUTPUT_DIR, f"campaign_{run_id}")
+    history = StatusHistory() if RECORD_HISTORY else None
+    stats = RunStats(min(len(queue), args.max_checks or len(queue)))
+    budget = RunBudget(args.max_checks, args.max_minutes)
+
+    def relogin(driver):
+        print("\n⚠️  The restarted browser is not logged in anymore. Please log in to Steamworks...")
+        input("⏸️  Once logged in, press Enter to continue...")
+
+    browser = supervised_browser(on_login_lost=relogin)
+    console = logging.getLogger(CONSOLE_LOGGER)
+    try:
+        browser.driver.get(STEAMWORKS_URL)
+        print("\n🌐 Browser opened. Please log in to Steamworks...")
+        input("⏸️  Once logged in, press Enter to start the campaign...")
+        browser.save_login()
+
+        checked_count = 0
+        for (file_no, index), column_name, steam_key in queue:
+            if budget.exhausted(checked_count):
+                print(f"\n⏱️  Run budget reached after {checked_count} keys")
+                break
+
+            console.info("\n[%d/%d] %s %s: %s...", checked_count + 1, len(queue), files[file_no].name, column_name, steam_key[:10])
+            check_started = time.monotonic()
+            raw_status = browser.check(check_steam_key, steam_key)
+            latency = time.monotonic() - check_started
+            status, detail = split_status(raw_status)
+
+            cells = [((file_no, index), column_name)] + duplicates.get(((file_no, index), column_name), [])
+            for (cell_file, cell_index), cell_column in cells:
+                old_status = files[cell_file].set_status(cell_index, cell_column, status, detail)
+                status_column = f"{files[cell_file].name}:{cell_column}{STATUS_SUFFIX}"
+                if (cell_file, cell_index, cell_column) == (file_no, index, column_name):
+                    stats.record(status_column, status, latency, old_status)
+                else:
+                    stats.recount(status_column, status, old_status)
+            if history:
+                history.record(steam_key, status, run_id)
+            console.info("   Status: %s", raw_status)
+
+            checked_count += 1
+            if checked_count % PROGRESS_EVERY == 0:
+                summary = stats.summary_line()
+                console.info("\n📈 %s", summary)
+                logger.info("Progress: %s", summary)
+
+            if checked_count < len(queue):
+                time.sleep(random.uniform(MIN_DELAY, MAX_DELAY))
+
+    except KeyboardInterrupt:
+        logger.warning("Campaign interrupted by user")
+        print("\n⏹️  Campaign interrupted by user")
+
+    except Exception as e:
+        logger.error(f"Error during campaign: {e}")
+        print(f"\n❌ Error during campaign: {e}")
+
+    finally:
+        flush_logging()
+        browser.quit()
+        if history:
+            history.close()
+
+        # Results go back to each file separately
+        print("\n💾 Results:")
+        for campaign_file in files:
+            output_file = campaign_file.save(args.format, args.delta, output_dir)
+            if output_file:
+                logger.info(f"{campaign_file.name}: {len(campaign_file.changes)} statuses saved in {output_file}")
+                print(f"   {campaign_file.name}: {len(campaign_file.changes)} statuses -> {output_file}")
+            else:
+                print(f"   {campaign_file.name}: nothing checked")
+        print(f"\n📈 {stats.summary_line()}")
+
+
+if __name__ == "__main__":
+    main()
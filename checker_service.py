@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Steam Keys Checker - Local JSON API service
+Keeps one logged-in browser, a status cache and the rate limiter warm, and
+serves checks to other tools over HTTP on localhost.
+
+Usage:
+    python checker_service.py [--port 8765]
+
+Endpoints:
+    GET  /health
+    GET  /status?key=XXXXX-XXXXX-XXXXX      Cached status (no network)
+    POST /check    {"key": "...", "max_age": 3600}
+    POST /batches  {"keys": ["...", ...], "max_age": 3600}
+    GET  /batches/<id>                      Batch progress and results
+    GET  /batches/<id>/stream               Results as NDJSON, as they complete
+
+Requests must be addressed to 127.0.0.1:<port> or localhost:<port>, and POST
+bodies sent as application/json: a web page open in the operator's browser
+can neither trigger checks on the Steamworks session nor read the results.
+"""
+
+import argparse
+import json
+import logging
+import queue
+import random
+import threading
+import time
+import uuid
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from main import MAX_DELAY, MIN_DELAY, STEAMWORKS_URL, check_steam_key, setup_logging, supervised_browser
+from status_history import StatusHistory, new_run_id, normalize_key
+from status_model import ACTIVATED, ERROR, INVALID_FORMAT, NON_KEY_STATUSES, split_status
+
+DEFAULT_PORT = 8765
+CACHE_TTL = 6 * 3600  # Seconds a non-final status is served from cache
+FINAL_STATUSES = {ACTIVATED, INVALID_FORMAT}  # Never change once observed
+MAX_BATCHES = 100  # Finished batches kept in memory for /batches/<id>
+
+
+class RateLimiter:
+    """Random delay between two network checks, shared by every client."""
+
+    def __init__(self, min_delay=MIN_DELAY, max_delay=MAX_DELAY):
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.next_allowed = 0.0
+        self.lock = threading.Lock()
+
+    def wait(self):
+        with self.lock:
+            pause = self.next_allowed - time.monotonic()
+            if pause > 0:
+                time.sleep(pause)
+            self.next_allowed = time.monotonic() + random.uniform(self.min_delay, self.max_delay)
+
+
+class StatusCache:
+    """In-memory status cache backed by the status history database."""
+
+    def __init__(self, history):
+        self.history = history
+        self.entries = {}  # key -> (status, checked_at epoch)
+        self.lock = threading.Lock()
+
+    def get(self, steam_key, max_age=CACHE_TTL):
+        key = normalize_key(steam_key)
+        with self.lock:
+            entry = self.entries.get(key)
+        if entry is None:
+            row = self.history.latest_status(key)
+            if row is None or row["status"] in NON_KEY_STATUSES:
+                return None
+            entry = (row["status"], datetime.fromisoformat(row["observed_at"]).timestamp())
+            with self.lock:
+                self.entries[key] = entry
+        status, checked_at = entry
+        if status in FINAL_STATUSES or time.time() - checked_at <= max_age:
+            return {"key": key, "status": status, "checked_at": datetime.fromtimestamp(checked_at).isoformat(timespec='seconds'), "cached": True}
+        return None
+
+    def put(self, steam_key, status):
+        if status in NON_KEY_STATUSES:
+            return
+        with self.lock:
+            self.entries[normalize_key(steam_key)] = (status, time.time())
+
+
+class Batch:
+    def __init__(self, keys):
+        self.id = uuid.uuid4().hex[:12]
+        self.keys = keys
+        self.results = []
+        self.done = threading.Event()
+        self.changed = threading.Condition()
+
+    def add_result(self, result):
+        with self.changed:
+            self.results.append(result)
+            if len(self.results) == len(self.keys):
+                self.done.set()
+            self.changed.notify_all()
+
+    def to_dict(self):
+        return {
+            "batch_id": self.id,
+            "total": len(self.keys),
+            "completed": len(self.results),
+            "done": self.done.is_set(),
+            "results": list(self.results),
+        }
+
+
+class CheckerService:
+    """Owns the browser; a single worker thread runs every network check."""
+
+    def __init__(self, browser, history):
+        self.browser = browser
+        self.history = history
+        self.cache = StatusCache(history)
+        self.rate_limiter = RateLimiter()
+        self.run_id = new_run_id()
+        self.batches = {}
+        self.batches_lock = threading.Lock()  # Request handlers run in parallel threads
+        self.work = queue.Queue()
+        self.logger = logging.getLogger(__name__)
+        self.worker = threading.Thread(target=self.work_loop, daemon=True)
+        self.worker.start()
+
+    def check_now(self, steam_key):
+        """Network check, serialized on the worker's browser."""
+        self.rate_limiter.wait()
+        status, detail = split_status(self.browser.check(check_steam_key, steam_key))
+        self.history.record(steam_key, status, self.run_id)
+        self.cache.put(steam_key, status)
+        return {"key": normalize_key(steam_key), "status": status, "detail": detail,
+                "checked_at": datetime.now().isoformat(timespec='seconds'), "cached": False}
+
+    def work_loop(self):
+        while True:
+            steam_key, reply = self.work.get()
+            try:
+                result = self.check_now(steam_key)
+            except Exception as e:
+                self.logger.error(f"Service check failed: {e}")
+                result = {"key": normalize_key(steam_key), "status": ERROR, "detail": str(e), "cached": False}
+            reply(result)
+
+    def submit_batch(self, keys, max_age=CACHE_TTL):
+        batch = Batch(keys)
+        with self.batches_lock:
+            finished = [bid for bid, b in self.batches.items() if b.done.is_set()]
+            for bid in finished[:max(0, len(finished) - MAX_BATCHES + 1)]:
+                del self.batches[bid]
+            self.batches[batch.id] = batch
+        queued = 0
+        for steam_key in keys:
+            cached = self.cache.get(steam_key, max_age)
+            if cached:
+                batch.add_result(cached)
+            else:
+                self.work.put((steam_key, batch.add_result))
+                queued += 1
+        if not keys:
+            batch.done.set()
+        return batch, queued
+
+    def get_batch(self, batch_id):
+        with self.batches_lock:
+            return self.batches.get(batch_id)
+
+    def check_one(self, steam_key, max_age=CACHE_TTL):
+        cached = self.cache.get(steam_key, max_age)
+        if cached:
+            return cached
+        batch, _ = self.submit_batch([steam_key], max_age)
+        batch.done.wait()
+        return batch.results[0]
+
+
+def make_handler(service):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            service.logger.info("API " + format, *args)
+
+        def send_json(self, payload, code=200):
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def host_allowed(self):
+            """
+            Only requests addressed to this loopback port: a DNS-rebound name
+            resolving to 127.0.0.1 still sends its own Host header.
+            """
+            port = self.server.server_address[1]
+            return self.headers.get("Host", "").lower() in {f"127.0.0.1:{port}", f"localhost:{port}"}
+
+        def read_json(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            try:
+                return json.loads(self.rfile.read(length) or b"{}")
+            except json.JSONDecodeError:
+                return None
+
+        def do_GET(self):
+            if not self.host_allowed():
+                self.send_json({"error": "Invalid Host header"}, 403)
+                return
+            url = urlparse(self.path)
+            parts = [p for p in url.path.split("/") if p]
+
+            if parts == ["health"]:
+                self.send_json({"ok": True, "queue_depth": service.work.qsize(), "run_id": service.run_id})
+            elif parts == ["status"]:
+                key = parse_qs(url.query).get("key", [""])[0]
+                if not key:
+                    self.send_json({"error": "Missing key parameter"}, 400)
+                    return
+                cached = service.cache.get(key, max_age=float("inf"))
+                self.send_json(cached or {"key": normalize_key(key), "status": None, "cached": False},
+                               200 if cached else 404)
+            elif len(parts) in (2, 3) and parts[0] == "batches":
+                batch = service.get_batch(parts[1])
+                if batch is None:
+                    self.send_json({"error": "Unknown batch"}, 404)
+                elif len(parts) == 3 and parts[2] == "stream":
+                    self.stream_batch(batch)
+                else:
+                    self.send_json(batch.to_dict())
+            else:
+                self.send_json({"error": "Not found"}, 404)
+
+        def do_POST(self):
+            if not self.host_allowed():
+                self.send_json({"error": "Invalid Host header"}, 403)
+                return
+            # A browser page can only send JSON cross-origin after a CORS preflight, which is never granted
+            content_type = self.headers.get("Content-Type", "").split(";")[0].strip().lower()
+            if content_type != "application/json":
+                self.send_json({"error": "Content-Type must be application/json"}, 415)
+                return
+            payload = self.read_json()
+            if not isinstance(payload, dict):
+                self.send_json({"error": "Body must be a JSON object"}, 400)
+                return
+            max_age = payload.get("max_age", CACHE_TTL)
+            if isinstance(max_age, bool) or not isinstance(max_age, (int, float)) or not max_age >= 0:
+                self.send_json({"error": "max_age must be a non-negative number of seconds"}, 400)
+                return
+
+            if self.path == "/check":
+                key = payload.get("key")
+                if not key or not isinstance(key, str):
+                    self.send_json({"error": "Missing key"}, 400)
+                    return
+                self.send_json(service.check_one(key, max_age))
+            elif self.path == "/batches":
+                keys = payload.get("keys")
+                if not isinstance(keys, list) or not all(isinstance(key, str) for key in keys):
+                    self.send_json({"error": "keys must be a list of strings"}, 400)
+                    return
+                batch, queued = service.submit_batch(keys, max_age)
+                response = batch.to_dict()
+                response["queued"] = queued
+                self.send_json(response, 202 if queued else 200)
+            else:
+                self.send_json({"error": "Not found"}, 404)
+
+        def stream_batch(self, batch):
+            """Send each result as one JSON line as soon as it is known."""
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-ndjson")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            sent = 0
+            while True:
+                with batch.changed:
+                    while sent == len(batch.results) and not batch.done.is_set():
+                        batch.changed.wait()
+                    pending = batch.results[sent:]
+                for result in pending:
+                    self.wfile.write((json.dumps(result) + "\n").encode("utf-8"))
+                self.wfile.flush()
+                sent += len(pending)
+                if batch.done.is_set() and sent == len(batch.results):
+                    break
+            self.close_connection = True
+
+    return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Steam Keys Checker - local JSON API")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    args = parser.parse_args()
+
+    logger = setup_logging()
+    print("🚀 Steam Keys Checker - local service")
+    print("=" * 50)
+
+    browser = supervised_browser()  # Unattended: a lost login is only logged
+    browser.driver.get(STEAMWORKS_URL)
+    print("\n🌐 Browser opened. Please log in to Steamworks...")
+    input("⏸️  Once logged in, press Enter to start the service...")
+    browser.save_login()
+
+    history = StatusHistory()
+    service = CheckerService(browser, history)
+    # Localhost only: the session is an authenticated Steamworks account
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), make_handler(service))
+    logger.info(f"Service listening on http://127.0.0.1:{args.port}")
+    print(f"✅ Listening on http://127.0.0.1:{args.port} (Ctrl+C to stop)")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n⏹️  Service stopped")
+    finally:
+        server.server_close()
+        browser.quit()
+        history.close()
+        logger.info("Service stopped, browser closed")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,10 +3,33 @@
  * Gère la communication entre popup et content script
  */
 
+// Compteurs de statuts tenus à jour clé par clé (évite de recompter au popup)
+function emptyResultCounts() {
+    return { total: 0, activated: 0, notActivated: 0, errors: 0 };
+}
+
+function countResult(counts, status) {
+    counts.total++;
+    if (status === 'Activated') {
+        counts.activated++;
+    } else if (status === 'Not activated') {
+        counts.notActivated++;
+    } else {
+        counts.errors++;
+    }
+}
+
+function countResults(results) {
+    const counts = emptyResultCounts();
+    (results || []).forEach(result => countResult(counts, result.status));
+    return counts;
+}
+
 // État global de l'extension
 let extensionState = {
     isChecking: false,
     currentResults: [],
+    resultCounts: emptyResultCounts(),
     totalKeys: 0,
     checkedKeys: 0,
     csvData: null,
@@ -42,6 +65,7 @@ chrome.runtime.onMessage.addListener((message, sender, sendResponse) => {
             sendResponse({
                 isChecking: extensionState.isChecking,
                 currentResults: extensionState.currentResults,
+                resultCounts: extensionState.resultCounts,
                 totalKeys: extensionState.totalKeys,
                 checkedKeys: extensionState.checkedKeys,
                 csvData: extensionState.csvData,
@@ -55,6 +79,7 @@ chrome.runtime.onMessage.addListener((message, sender, sendResponse) => {
             extensionState.totalKeys = message.total;
             extensionState.checkedKeys = 0;
             extensionState.currentResults = [];
+            extensionState.resultCounts = emptyResultCounts();
             extensionState.startTime = Date.now();
             extensionState.currentKey = '';
             
@@ -77,7 +102,8 @@ chrome.runtime.onMessage.addListener((message, sender, sendResponse) => {
             break;
             
         case 'keyChecked':
-            extensionState.currentResults.push(message.result);
+            extensionState.currentResults.push({ ...message.key, ...message.result });
+            countResult(extensionState.resultCounts, message.result.status);
             
             // Sauvegarder l'état
             saveExtensionState();
@@ -89,6 +115,7 @@ chrome.runtime.onMessage.addListener((message, sender, sendResponse) => {
         case 'checkingCompleted':
             extensionState.isChecking = false;
             extensionState.currentResults = message.results;
+            extensionState.resultCounts = countResults(message.results);
             
             // Sauvegarder l'état final
             saveExtensionState();
@@ -123,6 +150,7 @@ chrome.runtime.onMessage.addListener((message, sender, sendResponse) => {
         case 'checkingStopped':
             extensionState.isChecking = false;
             extensionState.currentResults = message.results;
+            extensionState.resultCounts = countResults(message.results);
             
             // Sauvegarder l'état
             saveExtensionState();
@@ -139,6 +167,7 @@ chrome.runtime.onMessage.addListener((message, sender, sendResponse) => {
             extensionState = {
                 isChecking: false,
                 currentResults: [],
+                resultCounts: emptyResultCounts(),
                 totalKeys: 0,
                 checkedKeys: 0,
                 csvData: null,
@@ -171,6 +200,7 @@ chrome.runtime.onMessage.addListener((message, sender, sendResponse) => {
             extensionState = {
                 isChecking: false,
                 currentResults: [],
+                resultCounts: emptyResultCounts(),
                 totalKeys: 0,
                 checkedKeys: 0,
                 csvData: null,
@@ -0,0 +1,80 @@
+#!/usr/bin/env node
+/**
+ * Micro-benchmark - classification des réponses querycdkey
+ *
+ * Usage:
+ *   node bench/parse-benchmark.js [dossier_reponses] [iterations]
+ *
+ * Le dossier contient des réponses enregistrées (.html), par exemple
+ * sauvegardées depuis l'onglet Réseau de Chrome. Par défaut, les
+ * exemples de bench/responses/ sont utilisés.
+ *
+ * Si le paquet `jsdom` est installé, le coût d'un parsing DOMParser
+ * complet est mesuré en comparaison.
+ */
+
+const fs = require('fs');
+const path = require('path');
+const { performance } = require('perf_hooks');
+const { classifyStatusFast } = require('../status-classifier.js');
+
+const responsesDir = path.resolve(process.argv[2] || path.join(__dirname, 'responses'));
+const iterations = parseInt(process.argv[3] || '2000', 10);
+
+function loadResponses(dir) {
+    return fs.readdirSync(dir)
+        .filter(name => name.endsWith('.html'))
+        .sort()
+        .map(name => ({ name, html: fs.readFileSync(path.join(dir, name), 'utf8') }));
+}
+
+function timeIt(label, responses, fn) {
+    // Échauffement
+    for (const r of responses) fn(r.html);
+
+    const start = performance.now();
+    for (let i = 0; i < iterations; i++) {
+        for (const r of responses) fn(r.html);
+    }
+    const elapsed = performance.now() - start;
+    const perPage = (elapsed * 1000) / (iterations * responses.length);
+    console.log(`${label.padEnd(22)} ${elapsed.toFixed(1).padStart(9)} ms   ${perPage.toFixed(1).padStart(8)} µs/page`);
+    return perPage;
+}
+
+function loadDOMParser() {
+    try {
+        const { JSDOM } = require('jsdom');
+        return new JSDOM('').window.DOMParser;
+    } catch (_) {
+        return null;
+    }
+}
+
+const responses = loadResponses(responsesDir);
+if (responses.length === 0) {
+    console.error(`❌ Aucune réponse .html trouvée dans ${responsesDir}`);
+    process.exit(1);
+}
+
+console.log(`📄 ${responses.length} réponses enregistrées (${responsesDir})`);
+for (const r of responses) {
+    const status = classifyStatusFast(r.html);
+    console.log(`   ${r.name.padEnd(30)} -> ${status === null ? 'non reconnue (repli DOMParser)' : status}`);
+}
+console.log(`\n⏱️  ${iterations} itérations\n`);
+
+const fastCost = timeIt('classifyStatusFast', responses, classifyStatusFast);
+
+const DOMParserImpl = loadDOMParser();
+if (DOMParserImpl) {
+    const parser = new DOMParserImpl();
+    const domCost = timeIt('DOMParser + sélecteurs', responses, html => {
+        const doc = parser.parseFromString(html, 'text/html');
+        doc.querySelectorAll('h2');
+        doc.querySelectorAll('td span[style*="color"], span[style*="color"]');
+    });
+    console.log(`\n⚡ Gain: x${(domCost / fastCost).toFixed(1)}`);
+} else {
+    console.log('\nℹ️  Installez jsdom (npm install jsdom) pour comparer avec DOMParser');
+}
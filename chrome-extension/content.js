@@ -305,6 +305,16 @@ class SteamKeyChecker {
         try {
             console.log(`🔍 Parsing HTML pour ${steamKey}...`);
             
+            // Chemin rapide: classification sans DOM (status-classifier.js)
+            if (typeof classifyStatusFast === 'function') {
+                const fastStatus = classifyStatusFast(htmlText);
+                if (fastStatus) {
+                    console.log(`⚡ Statut détecté sans DOMParser: ${fastStatus}`);
+                    return fastStatus;
+                }
+                console.log(`🔍 Page non reconnue, repli sur DOMParser`);
+            }
+            
             // Créer un parser DOM temporaire
             const parser = new DOMParser();
             const doc = parser.parseFromString(htmlText, 'text/html');
@@ -15,7 +15,9 @@ class SteamKeysPopup {
         };
         this.isChecking = false;
         this.results = [];
+        this.resultCounts = null;
         this.currentStep = 'upload';
+        this.pendingProgress = null;
         
         this.initializeElements();
         this.attachEventListeners();
@@ -72,7 +74,12 @@ class SteamKeysPopup {
         this.resultsSummary = document.getElementById('resultsSummary');
         this.downloadResultsBtn = document.getElementById('downloadResultsBtn');
         this.newCheckBtn = document.getElementById('newCheckBtn');
-        this.resultsTableBody = document.getElementById('resultsTableBody');
+        
+        // Listes virtualisées: seules les lignes visibles sont rendues
+        this.liveResultsList = new VirtualResultsList(document.getElementById('liveResultsList'), {
+            onFrame: (tally) => this.renderFrame(tally)
+        });
+        this.resultsList = new VirtualResultsList(document.getElementById('resultsList'));
         
         // Status elements
         this.statusIndicator = document.getElementById('statusIndicator');
@@ -247,6 +254,7 @@ class SteamKeysPopup {
             if (response && response.currentResults && response.currentResults.length > 0) {
                 // Restaurer les résultats
                 this.results = response.currentResults;
+                this.resultCounts = response.resultCounts || null;
                 this.csvData = response.csvData;
                 this.csvHeaders = response.csvHeaders;
                 this.config = response.config;
@@ -270,6 +278,10 @@ class SteamKeysPopup {
         this.stepResults.style.display = 'none';
         
         // Créer et afficher le message de téléchargement terminé
+        // Compteurs repris du background, sinon calculés en une passe
+        const tally = new ResultsTally();
+        tally.restore(this.results, this.resultCounts);
+        
         const downloadCompletedSection = document.createElement('section');
         downloadCompletedSection.className = 'step-section';
         downloadCompletedSection.id = 'stepDownloadCompleted';
@@ -281,9 +293,9 @@ class SteamKeysPopup {
                     <p>Your Steam keys have been verified and the results are ready.</p>
                     <div class="results-summary">
                         <p><strong>Total keys processed:</strong> ${this.results.length}</p>
-                        <p><strong>Activated:</strong> ${this.results.filter(r => r.status === 'Activated').length}</p>
-                        <p><strong>Not activated:</strong> ${this.results.filter(r => r.status === 'Not activated').length}</p>
-                        <p><strong>Errors:</strong> ${this.results.filter(r => r.status !== 'Activated' && r.status !== 'Not activated').length}</p>
+                        <p><strong>Activated:</strong> ${tally.activated}</p>
+                        <p><strong>Not activated:</strong> ${tally.notActivated}</p>
+                        <p><strong>Errors:</strong> ${tally.errors}</p>
                     </div>
                     <div class="download-actions">
                         <button class="btn btn-primary btn-large" id="downloadResultsBtnOffline">
@@ -422,6 +434,7 @@ class SteamKeysPopup {
                 this.autoDownloadTriggered = false; // Réinitialiser le flag pour une vérification en cours
                 localStorage.setItem('autoDownloadTriggered', 'false'); // Réinitialiser dans localStorage
                 this.results = state.currentResults || [];
+                this.resultCounts = state.resultCounts || null;
                 
                 // Restaurer les données CSV et config
                 if (state.csvData) {
@@ -443,6 +456,7 @@ class SteamKeysPopup {
             // Restaurer les résultats s'ils existent
             if (state.currentResults && state.currentResults.length > 0) {
                 this.results = state.currentResults;
+                this.resultCounts = state.resultCounts || null;
                 
                 // S'assurer que les données CSV sont restaurées avant d'afficher les résultats
                 if (state.csvData) {
@@ -778,7 +792,7 @@ class SteamKeysPopup {
                     // D'abord, injecter le content script au cas où
                     await chrome.scripting.executeScript({
                         target: { tabId: tab.id },
-                        files: ['content.js']
+                        files: ['status-classifier.js', 'content.js']
                     }).catch(() => {
                         console.log('Content script already injected');
                     });
@@ -1022,16 +1036,18 @@ class SteamKeysPopup {
     handleBackgroundMessage(message) {
         switch (message.type) {
             case 'progress':
-                this.updateProgress(message.current, message.total);
-                this.currentKeyText.textContent = `Checking: ${message.currentKey}`;
+                // Appliqué à la prochaine frame avec les autres mises à jour
+                this.pendingProgress = message;
+                this.liveResultsList.scheduleRender();
                 break;
                 
             case 'keyChecked':
-                this.updateCounters(message.result.status);
+                this.liveResultsList.append({ ...message.key, ...message.result });
                 break;
                 
             case 'checkingCompleted':
                 this.results = message.results;
+                this.resultCounts = null;
                 this.showResults();
                 break;
                 
@@ -1042,6 +1058,7 @@ class SteamKeysPopup {
                 
             case 'checkingStopped':
                 this.results = message.results;
+                this.resultCounts = null;
                 this.isChecking = false;
                 
                 // Réinitialiser les boutons
@@ -1067,22 +1084,26 @@ class SteamKeysPopup {
     }
     
     resetCounters() {
-        this.activatedCount.textContent = '0';
-        this.notActivatedCount.textContent = '0';
-        this.errorCount.textContent = '0';
+        this.pendingProgress = null;
+        this.liveResultsList.clear();
+        this.renderCounters(this.liveResultsList.tally);
     }
     
-    updateCounters(status) {
-        if (status === 'Activated') {
-            const count = parseInt(this.activatedCount.textContent) + 1;
-            this.activatedCount.textContent = count.toString();
-        } else if (status === 'Not activated') {
-            const count = parseInt(this.notActivatedCount.textContent) + 1;
-            this.notActivatedCount.textContent = count.toString();
-        } else {
-            const count = parseInt(this.errorCount.textContent) + 1;
-            this.errorCount.textContent = count.toString();
+    renderCounters(tally) {
+        this.activatedCount.textContent = tally.activated.toString();
+        this.notActivatedCount.textContent = tally.notActivated.toString();
+        this.errorCount.textContent = tally.errors.toString();
+    }
+    
+    // Une seule mise à jour du DOM par frame, quel que soit le nombre de messages reçus
+    renderFrame(tally) {
+        if (this.pendingProgress) {
+            const { current, total, currentKey } = this.pendingProgress;
+            this.pendingProgress = null;
+            this.updateProgress(current, total);
+            this.currentKeyText.textContent = `Checking: ${currentKey}`;
         }
+        this.renderCounters(tally);
     }
     
     showResults() {
@@ -1119,6 +1140,10 @@ class SteamKeysPopup {
         }
         
         // Créer et afficher le message de téléchargement terminé avec le même style
+        // Compteurs repris du background, sinon calculés en une passe
+        const tally = new ResultsTally();
+        tally.restore(this.results, this.resultCounts);
+        
         const downloadCompletedSection = document.createElement('section');
         downloadCompletedSection.className = 'step-section';
         downloadCompletedSection.id = 'stepDownloadCompleted';
@@ -1130,9 +1155,9 @@ class SteamKeysPopup {
                     <p>Your Steam keys have been verified and the results are ready.</p>
                     <div class="results-summary">
                         <p><strong>Total keys processed:</strong> ${this.results.length}</p>
-                        <p><strong>Activated:</strong> ${this.results.filter(r => r.status === 'Activated').length}</p>
-                        <p><strong>Not activated:</strong> ${this.results.filter(r => r.status === 'Not activated').length}</p>
-                        <p><strong>Errors:</strong> ${this.results.filter(r => r.status !== 'Activated' && r.status !== 'Not activated').length}</p>
+                        <p><strong>Activated:</strong> ${tally.activated}</p>
+                        <p><strong>Not activated:</strong> ${tally.notActivated}</p>
+                        <p><strong>Errors:</strong> ${tally.errors}</p>
                     </div>
                     <div class="download-actions">
                         <button class="btn btn-primary btn-large" id="downloadResultsBtnOffline">
@@ -1164,9 +1189,9 @@ class SteamKeysPopup {
     }
     
     generateResultsSummary() {
-        const activated = this.results.filter(r => r.status === 'Activated').length;
-        const notActivated = this.results.filter(r => r.status === 'Not activated').length;
-        const errors = this.results.filter(r => r.status !== 'Activated' && r.status !== 'Not activated').length;
+        const tally = new ResultsTally();
+        tally.restore(this.results, this.resultCounts);
+        const { activated, notActivated, errors } = tally;
 
         this.resultsSummary.innerHTML = `
             <div class="result-counters">
@@ -1187,16 +1212,7 @@ class SteamKeysPopup {
     }
     
     populateResultsTable() {
-        this.resultsTableBody.innerHTML = '';
-        
-        this.results.forEach(result => {
-            const row = document.createElement('tr');
-            row.innerHTML = `
-                <td>${result.value.substring(0, 15)}...</td>
-                <td class="status-${result.status.toLowerCase().replace(' ', '-')}">${result.status}</td>
-            `;
-            this.resultsTableBody.appendChild(row);
-        });
+        this.resultsList.setResults(this.results, this.resultCounts);
     }
     
     async downloadResults() {
@@ -1287,7 +1303,10 @@ class SteamKeysPopup {
         this.csvData = null;
         this.csvHeaders = [];
         this.results = [];
+        this.resultCounts = null;
         this.isChecking = false;
+        this.liveResultsList.clear();
+        this.resultsList.clear();
         
         // Masquer toutes les étapes sauf la première
         this.stepConfig.style.display = 'none';
@@ -1347,11 +1366,9 @@ class SteamKeysPopup {
             this.currentKeyText.textContent = `Vérification: ${state.currentKey}`;
         }
         
-        // Mettre à jour les compteurs avec les résultats existants
-        this.resetCounters();
-        this.results.forEach(result => {
-            this.updateCounters(result.status);
-        });
+        // Compteurs repris du background: pas de relecture de tous les résultats
+        this.liveResultsList.setResults(this.results, state.resultCounts);
+        this.renderCounters(this.liveResultsList.tally);
         
         // Calculer le temps écoulé si disponible
         if (state.startTime) {
@@ -1380,6 +1397,7 @@ class SteamKeysPopup {
             
             if (state.currentResults) {
                 this.results = state.currentResults;
+                this.resultCounts = state.resultCounts || null;
             }
             
             return true;
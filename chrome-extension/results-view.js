@@ -0,0 +1,149 @@
+/**
+ * Results View - Steam Keys Checker Extension
+ * Liste de résultats virtualisée et compteurs incrémentaux pour le popup.
+ *
+ * Seules les lignes visibles sont présentes dans le DOM, et les mises à
+ * jour reçues entre deux frames sont regroupées en un seul rendu.
+ */
+
+// Compteurs de statuts tenus à jour résultat par résultat
+class ResultsTally {
+    constructor() {
+        this.reset();
+    }
+
+    reset() {
+        this.total = 0;
+        this.activated = 0;
+        this.notActivated = 0;
+        this.errors = 0;
+    }
+
+    add(status) {
+        this.total++;
+        if (status === 'Activated') {
+            this.activated++;
+        } else if (status === 'Not activated') {
+            this.notActivated++;
+        } else {
+            this.errors++;
+        }
+    }
+
+    // Restaurer depuis les compteurs du background, sinon recompter
+    restore(results, counts) {
+        this.reset();
+        if (counts && counts.total === results.length) {
+            Object.assign(this, counts);
+            return;
+        }
+        results.forEach(result => this.add(result.status));
+    }
+
+    toJSON() {
+        return {
+            total: this.total,
+            activated: this.activated,
+            notActivated: this.notActivated,
+            errors: this.errors
+        };
+    }
+}
+
+class VirtualResultsList {
+    constructor(container, options = {}) {
+        this.container = container;
+        this.rowHeight = options.rowHeight || 28;
+        this.overscan = options.overscan || 6;
+        this.onFrame = options.onFrame || null;
+
+        this.items = [];
+        this.tally = new ResultsTally();
+        this.frameRequested = false;
+        this.renderedRange = null;
+
+        this.container.classList.add('virtual-list');
+        this.container.innerHTML = '';
+
+        this.spacer = document.createElement('div');
+        this.spacer.className = 'virtual-list-spacer';
+        this.rowsLayer = document.createElement('div');
+        this.rowsLayer.className = 'virtual-list-rows';
+        this.container.appendChild(this.spacer);
+        this.container.appendChild(this.rowsLayer);
+
+        this.container.addEventListener('scroll', () => this.scheduleRender(), { passive: true });
+    }
+
+    // Remplace la source (pas de copie) et recalcule les compteurs
+    setResults(results, counts = null) {
+        this.items = results || [];
+        this.tally.restore(this.items, counts);
+        this.renderedRange = null;
+        this.scheduleRender();
+    }
+
+    append(result) {
+        this.items.push(result);
+        this.tally.add(result.status);
+        this.scheduleRender();
+    }
+
+    clear() {
+        this.items = [];
+        this.tally.reset();
+        this.renderedRange = null;
+        this.scheduleRender();
+    }
+
+    scheduleRender() {
+        if (this.frameRequested) return;
+        this.frameRequested = true;
+        requestAnimationFrame(() => {
+            this.frameRequested = false;
+            this.render();
+            if (this.onFrame) this.onFrame(this.tally);
+        });
+    }
+
+    render() {
+        const count = this.items.length;
+        this.spacer.style.height = `${count * this.rowHeight}px`;
+
+        const viewportHeight = this.container.clientHeight || this.rowHeight * 8;
+        const first = Math.max(0, Math.floor(this.container.scrollTop / this.rowHeight) - this.overscan);
+        const last = Math.min(count, Math.ceil((this.container.scrollTop + viewportHeight) / this.rowHeight) + this.overscan);
+
+        // Rien à redessiner si la fenêtre visible n'a pas changé
+        if (this.renderedRange && this.renderedRange.first === first && this.renderedRange.last === last) {
+            return;
+        }
+        this.renderedRange = { first, last };
+
+        const fragment = document.createDocumentFragment();
+        for (let i = first; i < last; i++) {
+            fragment.appendChild(this.createRow(this.items[i]));
+        }
+        this.rowsLayer.style.transform = `translateY(${first * this.rowHeight}px)`;
+        this.rowsLayer.replaceChildren(fragment);
+    }
+
+    createRow(result) {
+        const row = document.createElement('div');
+        row.className = 'virtual-row';
+        row.style.height = `${this.rowHeight}px`;
+
+        const keyCell = document.createElement('span');
+        keyCell.className = 'virtual-cell-key';
+        keyCell.textContent = result.value ? `${result.value.substring(0, 15)}...` : '';
+
+        const status = result.status || '';
+        const statusCell = document.createElement('span');
+        statusCell.className = `virtual-cell-status status-${status.toLowerCase().replace(/ /g, '-')}`;
+        statusCell.textContent = status;
+
+        row.appendChild(keyCell);
+        row.appendChild(statusCell);
+        return row;
+    }
+}
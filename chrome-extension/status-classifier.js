@@ -0,0 +1,163 @@
+/**
+ * Status Classifier - Steam Keys Checker Extension
+ * Classification légère des réponses querycdkey sans construire de DOM.
+ *
+ * Le HTML est parcouru une seule fois par quelques expressions régulières
+ * (cellules du tableau de résultat + tableau "Détails de la plage de clés
+ * CD"). Seules les cellules <td> visibles sont lues : une page sans cellule
+ * de résultat (connexion, formulaire, erreur) n'est pas reconnue, la
+ * fonction retourne null et l'appelant repasse par DOMParser.
+ *
+ * Les couleurs sont testées en premier (indépendantes de la langue), puis
+ * les textes de la langue de la page (<html lang>), ou de toutes les
+ * langues connues si elle n'est pas dans LOCALE_MARKERS. Même table que
+ * status_classifier.py.
+ */
+
+(function (root) {
+    // Couleurs utilisées par Steamworks pour les statuts
+    const ACTIVATED_COLORS = ['#67c1f5', 'rgb(103, 193, 245)'];
+    const NOT_ACTIVATED_COLORS = ['#e24044', 'rgb(226, 64, 68)'];
+
+    // Textes en minuscules ; "notActivated" est toujours testé avant "activated"
+    const LOCALE_MARKERS = {
+        fr: { notActivated: ['non activée'], activated: ['activée'], invalid: ['invalide'],
+              notFound: ['introuvable'], ownershipHeader: ['détails de la plage de clés cd'] },
+        en: { notActivated: ['not activated'], activated: ['activated'], invalid: ['invalid'],
+              notFound: ['not found'], ownershipHeader: ['cd key range details', 'details of cd key range'] },
+        de: { notActivated: ['nicht aktiviert'], activated: ['aktiviert'], invalid: ['ungültig'],
+              notFound: ['nicht gefunden'], ownershipHeader: ['details zum cd-key-bereich'] },
+        es: { notActivated: ['no activada', 'sin activar'], activated: ['activada'], invalid: ['no válida', 'inválida'],
+              notFound: ['no encontrada'], ownershipHeader: ['detalles del rango de claves'] },
+        it: { notActivated: ['non attivata'], activated: ['attivata'], invalid: ['non valida'],
+              notFound: ['non trovata'], ownershipHeader: ["dettagli dell'intervallo di chiavi"] },
+        pt: { notActivated: ['não ativada'], activated: ['ativada'], invalid: ['inválida'],
+              notFound: ['não encontrada'], ownershipHeader: ['detalhes do intervalo de chaves'] },
+        ru: { notActivated: ['не активирован'], activated: ['активирован'], invalid: ['недействител'],
+              notFound: ['не найден'], ownershipHeader: ['сведения о диапазоне'] }
+    };
+
+    // Toutes les langues réunies, pour une page de langue inconnue
+    const ALL_MARKERS = {};
+    Object.keys(LOCALE_MARKERS.fr).forEach(kind => {
+        ALL_MARKERS[kind] = [].concat(...Object.values(LOCALE_MARKERS).map(markers => markers[kind]));
+    });
+
+    const HTML_LANG_RE = /<html\b[^>]*?\blang\s*=\s*["']?([a-z]{2,3})/i;
+
+    const SPAN_RE = /<span\b([^>]*)>([\s\S]*?)<\/span>/gi;
+    const STYLE_RE = /\bstyle\s*=\s*("([^"]*)"|'([^']*)')/i;
+    const H2_RE = /<h2\b[^>]*>([\s\S]*?)<\/h2>/gi;
+    const TAG_RE = /<[^>]*>/g;
+    const CELL_RE = /<td\b[^>]*>([\s\S]*?)<\/td>/gi;
+    // Jamais affichés : leur texte ne doit correspondre à aucun marqueur
+    const HIDDEN_RE = /<head\b[\s\S]*?<\/head>|<script\b[\s\S]*?<\/script>|<style\b[\s\S]*?<\/style>|<!--[\s\S]*?-->/gi;
+
+    const NAMED_ENTITIES = {
+        amp: '&', lt: '<', gt: '>', quot: '"', apos: "'", nbsp: ' ',
+        eacute: 'é', egrave: 'è', ecirc: 'ê', agrave: 'à', ccedil: 'ç',
+        uuml: 'ü', aacute: 'á', atilde: 'ã'
+    };
+
+    function decodeEntities(text) {
+        if (text.indexOf('&') === -1) return text;
+        return text.replace(/&(#x[0-9a-f]+|#\d+|[a-z]+);/gi, (match, entity) => {
+            if (entity[0] === '#') {
+                const code = entity[1] === 'x' || entity[1] === 'X'
+                    ? parseInt(entity.slice(2), 16)
+                    : parseInt(entity.slice(1), 10);
+                return Number.isFinite(code) ? String.fromCodePoint(code) : match;
+            }
+            const decoded = NAMED_ENTITIES[entity.toLowerCase()];
+            return decoded !== undefined ? decoded : match;
+        });
+    }
+
+    // Équivalent de textContent.trim().toLowerCase() pour un fragment HTML
+    function fragmentText(html) {
+        return decodeEntities(html.replace(TAG_RE, '')).trim().toLowerCase();
+    }
+
+    // Langue de la page si elle est dans LOCALE_MARKERS, sinon null
+    function detectLocale(htmlText) {
+        const match = HTML_LANG_RE.exec(htmlText);
+        const locale = match ? match[1].toLowerCase() : null;
+        return locale && LOCALE_MARKERS[locale] ? locale : null;
+    }
+
+    // Tableau vide après le titre "Détails de la plage de clés CD" -> ownership issue
+    function detectOwnershipIssue(htmlText, headers) {
+        H2_RE.lastIndex = 0;
+        let match;
+        while ((match = H2_RE.exec(htmlText)) !== null) {
+            if (!includesAny(fragmentText(match[1]), headers)) continue;
+
+            const afterHeader = htmlText.slice(H2_RE.lastIndex);
+            const tableStart = afterHeader.search(/<table\b/i);
+            if (tableStart === -1) return false;
+            const tableEnd = afterHeader.indexOf('</table', tableStart);
+            const tableHtml = afterHeader.slice(tableStart, tableEnd === -1 ? undefined : tableEnd);
+
+            const rows = tableHtml.split(/<tr\b/i).slice(1);
+            if (rows.length < 2) return true; // pas de ligne de données
+            const cells = rows[1].split(/<td\b/i).slice(1);
+            return cells.every(cell => fragmentText(cell.replace(/^[^>]*>/, '')) === '');
+        }
+        return false;
+    }
+
+    function includesAny(haystack, needles) {
+        return needles.some(needle => haystack.includes(needle));
+    }
+
+    /**
+     * Classe une réponse HTML de querycdkey.
+     * Retourne le statut ("Activated", "Not activated", "Ownership issue",
+     * "Invalid", "Not found") ou null si la page n'est pas reconnue.
+     */
+    function classifyStatusFast(htmlText) {
+        if (typeof htmlText !== 'string' || htmlText.length === 0) return null;
+
+        const markers = LOCALE_MARKERS[detectLocale(htmlText)] || ALL_MARKERS;
+        const visibleHtml = htmlText.replace(HIDDEN_RE, '');
+        const cells = Array.from(visibleHtml.matchAll(CELL_RE), match => match[1]);
+        // Le tableau n'est analysé que pour une clé non activée
+        const notActivated = () =>
+            detectOwnershipIssue(visibleHtml, markers.ownershipHeader) ? 'Ownership issue' : 'Not activated';
+
+        // Méthode 1: spans avec couleur dans une cellule, la couleur avant le texte
+        for (const cell of cells) {
+            SPAN_RE.lastIndex = 0;
+            let match;
+            while ((match = SPAN_RE.exec(cell)) !== null) {
+                const styleMatch = STYLE_RE.exec(match[1]);
+                if (!styleMatch) continue;
+                const style = (styleMatch[2] !== undefined ? styleMatch[2] : styleMatch[3]).toLowerCase();
+                if (!style.includes('color')) continue;
+
+                if (includesAny(style, NOT_ACTIVATED_COLORS)) return notActivated();
+                if (includesAny(style, ACTIVATED_COLORS)) return 'Activated';
+                const text = fragmentText(match[2]);
+                if (includesAny(text, markers.notActivated)) return notActivated();
+                if (includesAny(text, markers.activated)) return 'Activated';
+            }
+        }
+
+        // Méthode 2: texte des cellules, la première reconnue l'emporte
+        for (const cell of cells) {
+            const text = fragmentText(cell);
+            if (includesAny(text, markers.notActivated)) return notActivated();
+            if (includesAny(text, markers.activated)) return 'Activated';
+            if (includesAny(text, markers.invalid)) return 'Invalid';
+            if (includesAny(text, markers.notFound)) return 'Not found';
+        }
+
+        // Page non reconnue: laisser DOMParser trancher
+        return null;
+    }
+
+    root.classifyStatusFast = classifyStatusFast;
+    if (typeof module !== 'undefined' && module.exports) {
+        module.exports = { classifyStatusFast, detectLocale, LOCALE_MARKERS };
+    }
+})(typeof globalThis !== 'undefined' ? globalThis : this);
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Steam Keys Checker - Packed key codec
+Pack Steam keys (15 or 25 alphanumeric characters, dashes ignored) into
+fixed-width uint64 rows, so deduplicating a work list (group_duplicates,
+used when DEDUPLICATE_KEYS / --dedup is on) and the membership tests of the
+compare command run as vectorized sorted-array operations instead of
+Python str sets.
+
+The results cache and the status history are deliberately not routed
+through KeySet: they look keys up one at a time in SQLite (indexed by key)
+or a dict while a run is in progress, so a sorted packed array rebuilt
+per insert would only add cost there.
+
+Each character takes 6 bits, 10 characters per uint64 word: a 15-character
+key fits in 2 words (16 bytes) and a 25-character key in 3 words (24 bytes).
+
+Usage:
+    python key_codec.py compare data/steam-keys.csv other-campaign.csv --column key_1 key_2
+"""
+
+import argparse
+import sys
+
+import numpy as np
+
+ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+KEY_LENGTHS = (15, 25)  # Characters, dashes excluded
+GROUP_SIZE = 5  # Characters between dashes
+CHARS_PER_WORD = 10  # 10 x 6 bits fit in a uint64
+
+# Byte -> 6-bit code; 0 is padding, 255 marks a character outside the alphabet
+_ENCODE = np.full(256, 255, dtype=np.uint8)
+_ENCODE[0] = 0
+for _code, _char in enumerate(ALPHABET, start=1):
+    _ENCODE[ord(_char)] = _code
+_DECODE = np.zeros(64, dtype=np.uint8)
+_DECODE[1:len(ALPHABET) + 1] = np.frombuffer(ALPHABET.encode("ascii"), dtype=np.uint8)
+_SHIFTS = np.arange(CHARS_PER_WORD - 1, -1, -1, dtype=np.uint64) * np.uint64(6)
+
+
+def _normalize(steam_key):
+    """Uppercase, no surrounding spaces, no dashes; '' for missing or non-ASCII keys."""
+    if not isinstance(steam_key, str):
+        return ""
+    text = steam_key.strip().upper().replace("-", "")
+    return text if text.isascii() and len(text) in KEY_LENGTHS else ""
+
+
+def words_for(length):
+    return -(-length // CHARS_PER_WORD)
+
+
+def encode_keys(keys, words=None):
+    """
+    Pack an iterable of keys into a (n, words) uint64 array.
+
+    Returns (codes, valid): rows of invalid keys (missing, wrong length,
+    characters outside 0-9A-Z) are all zeros and flagged False in `valid`.
+    """
+    normalized = [_normalize(key) for key in keys]
+    words = words or words_for(max((len(text) for text in normalized), default=0) or min(KEY_LENGTHS))
+    width = words * CHARS_PER_WORD
+    normalized = [text if len(text) <= width else "" for text in normalized]
+    raw = np.array(normalized, dtype=f"S{width}").view(np.uint8).reshape(len(normalized), width)
+    chars = _ENCODE[raw]
+    valid = (chars != 255).all(axis=1) & (chars[:, 0] != 0)
+    chars[~valid] = 0
+    groups = chars.reshape(len(normalized), words, CHARS_PER_WORD).astype(np.uint64)
+    codes = np.bitwise_or.reduce(groups << _SHIFTS, axis=2)
+    return codes, valid
+
+
+def decode_keys(codes):
+    """Unpack a (n, words) uint64 array back to 'XXXXX-XXXXX-XXXXX' strings ('' for empty rows)."""
+    codes = np.asarray(codes, dtype=np.uint64)
+    chars = ((codes[:, :, None] >> _SHIFTS) & np.uint64(63)).astype(np.uint8)
+    raw = _DECODE[chars].reshape(len(codes), -1)
+    texts = raw.view(f"S{raw.shape[1]}").ravel()
+    return ["-".join(text[i:i + GROUP_SIZE] for i in range(0, len(text), GROUP_SIZE))
+            for text in (value.decode("ascii") for value in texts)]
+
+
+def _rows(codes):
+    """View each packed key as one opaque fixed-size value, sortable and hashable by NumPy."""
+    codes = np.ascontiguousarray(codes)
+    return codes.view(np.dtype((np.void, codes.shape[1] * codes.itemsize))).ravel()
+
+
+def dedup_positions(keys):
+    """
+    For every key, the position of its first occurrence in `keys`.
+
+    Invalid keys are never merged (their own position is returned).
+    """
+    codes, valid = encode_keys(keys)
+    leaders = np.arange(len(codes))
+    if valid.any():
+        positions = leaders[valid]
+        _, first, inverse = np.unique(_rows(codes[valid]), return_index=True, return_inverse=True)
+        leaders[valid] = positions[first[inverse.ravel()]]
+    return leaders
+
+
+def group_duplicates(keys_to_verify):
+    """
+    Collapse (index, column, key) work items that share the same key.
+
+    Returns (unique_items, duplicates): the first item of each key, in the
+    original order, and {(index, column): [(index, column), ...]} listing
+    the other cells holding that key, which get the same status.
+    """
+    leaders = dedup_positions([key for _, _, key in keys_to_verify])
+    unique_items = []
+    duplicates = {}
+    for position, (index, column, steam_key) in enumerate(keys_to_verify):
+        leader = leaders[position]
+        if leader == position:
+            unique_items.append((index, column, steam_key))
+        else:
+            leader_index, leader_column, _ = keys_to_verify[leader]
+            duplicates.setdefault((leader_index, leader_column), []).append((index, column))
+    return unique_items, duplicates
+
+
+class KeySet:
+    """Immutable set of keys stored as a sorted packed array (binary-search membership)."""
+
+    def __init__(self, keys=()):
+        codes, valid = encode_keys(keys)
+        self.words = codes.shape[1]
+        self.codes = np.unique(_rows(codes[valid]))
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __contains__(self, steam_key):
+        return bool(self.contains([steam_key])[0])
+
+    @property
+    def nbytes(self):
+        return self.codes.nbytes
+
+    def contains(self, keys):
+        """Vectorized membership test: one bool per key."""
+        codes, valid = encode_keys(keys, self.words)
+        if len(self.codes) == 0:
+            return np.zeros(len(codes), dtype=bool)
+        rows = _rows(codes)
+        found = np.minimum(np.searchsorted(self.codes, rows), len(self.codes) - 1)
+        return valid & (self.codes[found] == rows)
+
+
+def object_nbytes(keys):
+    """Approximate memory of the same keys held as Python str in an object column."""
+    return sum(sys.getsizeof(key) + 8 for key in keys)
+
+
+def main():
+    from results_io import load_keys_file
+
+    parser = argparse.ArgumentParser(description="Steam Keys Checker - packed key codec")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    compare_parser = subparsers.add_parser("compare", help="Duplicates and overlap between two key files")
+    compare_parser.add_argument("left")
+    compare_parser.add_argument("right")
+    compare_parser.add_argument("--column", nargs="+", default=["key_1", "key_2"], help="Key columns")
+    args = parser.parse_args()
+
+    def read_keys(path):
+        df = load_keys_file(path)
+        columns = [column for column in args.column if column in df.columns]
+        return [key for column in columns for key in df[column].dropna().tolist()]
+
+    left, right = read_keys(args.left), read_keys(args.right)
+    left_set, right_set = KeySet(left), KeySet(right)
+    for path, keys, key_set in ((args.left, left, left_set), (args.right, right, right_set)):
+        print(f"📄 {path}: {len(keys)} keys, {len(key_set)} unique "
+              f"({key_set.nbytes / 1024:.1f} KiB packed vs {object_nbytes(keys) / 1024:.1f} KiB as str)")
+    first_occurrence = dedup_positions(left) == np.arange(len(left))
+    shared = int((right_set.contains(left) & first_occurrence).sum())
+    print(f"🔗 {shared} keys present in both files")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,15 +2,18 @@
 """
 Steam Keys Checker
 Automatically check the status of Steam keys via Steamworks.
+
+Usage:
+    python main.py [--profile]
 """
 
-import pandas as pd
+import argparse
 import time
 import os
 import random
 import logging
 import re
-from datetime import datetime
+from urllib.parse import quote
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -18,10 +21,40 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
+from results_io import has_arrow, load_keys_file, merge_deltas, save_results, status_change, write_delta
+from status_history import StatusHistory, new_run_id
+from run_stats import RunStats
+from scheduler import RunBudget, prioritize
+from key_codec import group_duplicates
+from status_model import STATUS_NOT_FOUND, join_status, normalize_status_columns, split_status, write_status
+from status_classifier import classify_driver_page
+from run_profiler import RunProfiler
+from run_metrics import MetricsExporter, RunMetrics
+from browser_profile import apply_lean_options, enable_resource_blocking, set_timeouts
+from page_archive import PageArchive, should_archive
+from selection_rules import load_rules, select_keys, to_check_rule
+from browser_supervisor import BrowserSupervisor
+from run_logging import CONSOLE_LOGGER, KEY_LOGGER, LOG_MAX_BYTES, flush_logging, start_logging
 
 # Configuration
-CSV_FILE_PATH = "data/steam-keys.csv"
+CSV_FILE_PATH = "data/steam-keys.csv"  # CSV, Parquet (.parquet) or Feather (.feather) file
+OUTPUT_FORMAT = "csv"  # "csv", "parquet" or "feather" (Parquet/Feather require pyarrow)
+OUTPUT_MODE = "full"  # "full" writes the whole sheet, "delta" writes only the statuses changed by this run
+RECORD_HISTORY = True  # Record every observation in output/status_history.sqlite3 (see status_history.py)
+PROGRESS_EVERY = 10  # Print the live summary (counts, keys/min, ETA) every N keys
+DEDUPLICATE_KEYS = False  # Check a key present in several cells once and copy its status to the other cells
+PRIORITY_SCORER = None  # None keeps CSV order; "default" checks the most-likely-to-change keys first (see scheduler.py)
+MAX_CHECKS = None  # Stop the run after N checks (None = no limit)
+MAX_MINUTES = None  # Stop the run after T minutes (None = no limit)
+METRICS_PORT = None  # Serve live metrics on http://127.0.0.1:<port>/metrics (Prometheus), None = off
+METRICS_FILE = None  # Rewrite live metrics as JSON to this path every few seconds, None = off
+ARCHIVE_PAGES = False  # Keep every result page (compressed, deduplicated) for offline re-parsing, see page_archive.py
+LEAN_BROWSER = False  # Eager page loads, no images/fonts/CSS/trackers, no extensions (see browser_profile.py)
+RECYCLE_BROWSER_EVERY = 500  # Restart Chrome, keeping the login, every N keys (None = never, see browser_supervisor.py)
+MAX_BROWSER_MB = 1500  # Restart Chrome above this memory use (None = never)
+CHECK_TIMEOUT = 90  # Seconds before a hung check is abandoned and Chrome restarted
 STEAMWORKS_URL = "https://partner.steamgames.com/querycdkey/"
+NAVIGATION_MODE = "url"  # "url": open querycdkey/cdkey?cdkey=<key> directly; "form": type the key in the form
 MIN_DELAY = 0.5  # Minimum delay in seconds between each verification
 MAX_DELAY = 1.6  # Maximum delay in seconds between each verification
 CHECK_KEY_2 = True  # Also check the key_2 column. Useful if you send 2 keys per content creator.
@@ -30,19 +63,16 @@ CHECK_KEY_2 = True  # Also check the key_2 column. Useful if you send 2 keys per
 KEY_1_COLUMN = "key_1"  # Name of the first key column in your CSV
 KEY_2_COLUMN = "key_2"  # Name of the second key column in your CSV (if CHECK_KEY_2 is True)
 TO_CHECK_COLUMN = "to check"  # Name of the column that determines if a key should be checked
+SELECTION_RULES = None  # JSON rules file selecting the rows to check (see selection_rules.py); None = TO_CHECK_COLUMN only
 
 # Logging configuration
+LOG_JSON = True  # Log file as JSON lines (one object per record); False = plain text
+LOG_ROTATE_BYTES = LOG_MAX_BYTES  # Rotate the log file at this size
+KEY_LOG_LEVEL = "INFO"  # Level of the per-key records: "DEBUG"/"INFO" log every key, "WARNING" only errors
+
 def setup_logging():
-    """Configure the logging system."""
-    log_filename = f"steam_keys_checker_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_filename, encoding='utf-8'),
-            logging.StreamHandler()
-        ]
-    )
+    """Configure the logging system (queued, written by a background thread, see run_logging.py)."""
+    start_logging(key_level=KEY_LOG_LEVEL, json_file=LOG_JSON, max_bytes=LOG_ROTATE_BYTES)
     return logging.getLogger(__name__)
 
 def setup_driver():
@@ -61,17 +91,33 @@ def setup_driver():
     # Headless mode (no GUI) - uncomment if you want
     # chrome_options.add_argument("--headless")
     
+    if LEAN_BROWSER:
+        apply_lean_options(chrome_options)
+    
     service = Service(ChromeDriverManager().install())
     driver = webdriver.Chrome(service=service, options=chrome_options)
+    set_timeouts(driver)
+    if LEAN_BROWSER:
+        enable_resource_blocking(driver)
+        logger.info("Lean browser profile enabled")
     
     # Hide that it's an automated browser
     driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
     
     return driver
 
+def supervised_browser(on_login_lost=None):
+    """Chrome driver restarted when it grows, slows down, hangs or crashes (see browser_supervisor.py)."""
+    return BrowserSupervisor(setup_driver, STEAMWORKS_URL, RECYCLE_BROWSER_EVERY, MAX_BROWSER_MB,
+                             CHECK_TIMEOUT, on_login_lost=on_login_lost)
+
+def result_url(steam_key):
+    """Result page of a key, as requested by the form (and by the Chrome extension)."""
+    return f"{STEAMWORKS_URL}cdkey?cdkey={quote(steam_key.strip())}"
+
 def check_steam_key(driver, steam_key):
     """Check the status of a Steam key on the Steamworks site with an improved method."""
-    logger = logging.getLogger(__name__)
+    logger = logging.getLogger(KEY_LOGGER)
     # --- 1) Validate format BEFORE any network / browser action ---
     def is_valid_format(k: str) -> bool:
         k = k.strip().upper()
@@ -81,11 +127,21 @@ def check_steam_key(driver, steam_key):
         return all(len(p) == 5 and p.isalnum() for p in parts)
 
     if not is_valid_format(steam_key):
-        logger.info(f"Key {steam_key[:10]}... - Invalid format")
+        logger.info("Key %s... - Invalid format", steam_key[:10], extra={"status": "Invalid format"})
         return "Invalid format"
     
     try:
         # --- 2) Continue with verification if format is OK ---
+        if NAVIGATION_MODE == "url":
+            # Open the result page directly: one navigation, no typing, no fixed wait
+            driver.get(result_url(steam_key))
+            status = join_status(*classify_driver_page(driver, result_only=True))
+            if status != STATUS_NOT_FOUND:
+                logger.info("Key %s... - Status: %s", steam_key[:10], status, extra={"status": status})
+                return status
+            # Not on a result page with a status (logged out, redirected, URL changed): try the form below
+            logger.warning("Key %s... - Result page not recognized, falling back to the form", steam_key[:10])
+        
         # Go to the verification page
         driver.get(STEAMWORKS_URL)
         
@@ -157,143 +213,25 @@ def check_steam_key(driver, steam_key):
         except:
             pass  # Don't fail if we can't verify
 
-        # --- Ownership issue detection (table empty) ---
-        def is_ownership_issue():
-            try:
-                header_el = driver.find_element(By.XPATH, "//h2[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'détails de la plage de clés cd')]")
-                # trouver le 1er table après le h2
-                table_el = None
-                sib = header_el
-                while sib is not None:
-                    sib = sib.find_element(By.XPATH, "following-sibling::*[1]")
-                    if sib.tag_name.lower() == 'table':
-                        table_el = sib
-                        break
-                if not table_el:
-                    return False
-                rows = table_el.find_elements(By.XPATH, './/tr')
-                if len(rows) < 2:
-                    return True
-                data_cells = rows[1].find_elements(By.TAG_NAME, 'td')
-                return all(c.text.strip() == '' for c in data_cells)
-            except Exception:
-                return False
-
-        if is_ownership_issue():
-            logger.info(f"Key {steam_key[:10]}... - Ownership issue")
-            return "Ownership issue"
-        
-        # Search for status with an improved method
-        status = "Status not found"
+        # Classify the result page: one page_source read, colors first, then the
+        # markers of the account's language (detected once per browser session)
+        status = join_status(*classify_driver_page(driver))
         
-        try:
-            # Search for status span with color
-            status_span = driver.find_element(By.XPATH, "//td/span[contains(@style, 'color')]")
-            status_text = status_span.text.strip()
-            status_color = status_span.get_attribute('style')
-            
-            # Check if it's "Activated"
-            if ("#67c1f5" in status_color or 
-                "rgb(103, 193, 245)" in status_color or 
-                status_text.lower() == "activée"):
-                status = "Activated"
-            elif ("#e24044" in status_color or 
-                  "rgb(226, 64, 68)" in status_color or 
-                  status_text.lower() == "non activée"):
-                status = "Not activated"
-            else:
-                status = f"Unknown status: {status_text}"
-                
-        except:
-            # Alternative method: search in all content
-            try:
-                # Search for spans with specific colors (hex format)
-                activated_spans = driver.find_elements(By.XPATH, "//span[@style='color: #67c1f5']")
-                for span in activated_spans:
-                    if "activée" in span.text.lower():
-                        status = "Activated"
-                        break
-                
-                if status == "Status not found":
-                    not_activated_spans = driver.find_elements(By.XPATH, "//span[@style='color: #e24044']")
-                    for span in not_activated_spans:
-                        if "non activée" in span.text.lower():
-                            status = "Not activated"
-                            break
-                
-                # If still not found, search by RGB color
-                if status == "Status not found":
-                    rgb_activated_spans = driver.find_elements(By.XPATH, "//span[contains(@style, 'rgb(103, 193, 245)')]")
-                    for span in rgb_activated_spans:
-                        if "activée" in span.text.lower():
-                            status = "Activated"
-                            break
-                
-                if status == "Status not found":
-                    rgb_not_activated_spans = driver.find_elements(By.XPATH, "//span[contains(@style, 'rgb(226, 64, 68)')]")
-                    for span in rgb_not_activated_spans:
-                        if "non activée" in span.text.lower():
-                            status = "Not activated"
-                            break
-                
-                # Last resort: search in table cells
-                if status == "Status not found":
-                    status_cells = driver.find_elements(By.TAG_NAME, "td")
-                    for cell in status_cells:
-                        cell_text = cell.text.strip().lower()
-                        if "non activée" in cell_text:
-                            status = "Not activated"
-                            break
-                        elif "activée" in cell_text:
-                            status = "Activated"
-                            break
-                        elif "invalid" in cell_text or "invalide" in cell_text:
-                            status = "Invalid"
-                            break
-                            
-            except Exception as inner_e:
-                status = f"Error during detection: {str(inner_e)}"
-        
-        logger.info(f"Key {steam_key[:10]}... - Status: {status}")
+        logger.info("Key %s... - Status: %s", steam_key[:10], status, extra={"status": status})
         return status
         
     except Exception as e:
         error_msg = f"Error: {str(e)}"
-        logger.error(f"Key {steam_key[:10]}... - {error_msg}")
+        logger.error("Key %s... - %s", steam_key[:10], error_msg, extra={"status": "Error"})
         return error_msg
 
-def should_check_key(row):
-    """Determines if a row should be checked based on the 'to check' column."""
-    
-    # Check if the 'to check' column exists
-    if TO_CHECK_COLUMN not in row:
-        return True  # If the column doesn't exist, check all keys
-    
-    to_check_value = row[TO_CHECK_COLUMN]
-    
-    # Convert to boolean: True if the value is True, 'True', 'true', 1, or '1'
-    if pd.isna(to_check_value):
-        return False  # If NaN, don't check
-    
-    # Convert string values to boolean
-    if isinstance(to_check_value, str):
-        to_check_value = to_check_value.strip().lower()
-        return to_check_value in ['true', '1', 'yes', 'oui']
-    
-    # For numeric values
-    if isinstance(to_check_value, (int, float)):
-        return bool(to_check_value)
-    
-    # For boolean values
-    return bool(to_check_value)
-
 def main():
     logger = setup_logging()
     logger.info("🚀 Starting Steam Keys Checker")
     print("🚀 Steam Keys Checker")
     print("=" * 50)
     
-    # Check if the CSV file exists
+    # Check if the input file exists
     if not os.path.exists(CSV_FILE_PATH):
         logger.error(f"CSV file not found: {CSV_FILE_PATH}")
         print(f"❌ The file {CSV_FILE_PATH} does not exist.")
@@ -303,9 +241,17 @@ def main():
     logger.info(f"CSV file found: {CSV_FILE_PATH}")
     print(f"✅ CSV file found: {CSV_FILE_PATH}")
     
+    if OUTPUT_FORMAT != "csv" and not has_arrow():
+        logger.warning(f"pyarrow not installed, {OUTPUT_FORMAT} output falls back to CSV")
+        print(f"⚠️  pyarrow is not installed: results will be saved as CSV instead of {OUTPUT_FORMAT}")
+    
     # Load the CSV file
     try:
-        df = pd.read_csv(CSV_FILE_PATH)
+        if OUTPUT_MODE == "delta":
+            # Apply previous deltas so already-checked keys are skipped
+            df = merge_deltas(CSV_FILE_PATH)
+        else:
+            df = load_keys_file(CSV_FILE_PATH)
         logger.info(f"CSV loaded: {len(df)} rows, columns: {list(df.columns)}")
         print(f"✅ CSV loaded successfully: {len(df)} rows")
         print(f"Available columns: {list(df.columns)}")
@@ -330,35 +276,42 @@ def main():
                 df[key2_status_column] = None
                 print(f"✅ Column '{key2_status_column}' created")
         
+        normalize_status_columns(df)
+        
     except Exception as e:
         logger.error(f"CSV loading error: {e}")
         print(f"❌ Error loading CSV: {e}")
         return
     
-    # Prepare the list of keys to verify
-    keys_to_verify = []
-    
-    # Add key_1 keys that are not verified and have non-empty status
-    key1_status_column = f"{KEY_1_COLUMN}_status"
-    key1_to_check = df[(df[KEY_1_COLUMN].notna()) & (df[KEY_1_COLUMN] != '') & (df[key1_status_column].isna())]
-    for index, row in key1_to_check.iterrows():
-        if should_check_key(row):
-            keys_to_verify.append((index, KEY_1_COLUMN, row[KEY_1_COLUMN]))
-    
-    # Add key_2 keys if configured
+    # Prepare the list of keys to verify: unchecked, non-empty keys of the selected rows
+    key_columns = [KEY_1_COLUMN]
     if CHECK_KEY_2 and KEY_2_COLUMN in df.columns:
-        key2_status_column = f"{KEY_2_COLUMN}_status"
-        if key2_status_column in df.columns:
-            key2_to_check = df[(df[KEY_2_COLUMN].notna()) & (df[KEY_2_COLUMN] != '') & (df[key2_status_column].isna())]
-            for index, row in key2_to_check.iterrows():
-                if should_check_key(row):
-                    keys_to_verify.append((index, KEY_2_COLUMN, row[KEY_2_COLUMN]))
+        key_columns.append(KEY_2_COLUMN)
+    try:
+        rule = load_rules(SELECTION_RULES) if SELECTION_RULES else to_check_rule(TO_CHECK_COLUMN)
+        keys_to_verify = select_keys(df, key_columns, rule)
+    except (OSError, ValueError) as e:
+        logger.error(f"Selection rules error: {e}")
+        print(f"❌ {e}")
+        return
     
     if len(keys_to_verify) == 0:
         logger.info("No keys to verify - all already verified or no valid keys")
         print("ℹ️  All keys have already been verified or no valid keys found")
         return
     
+    # Optionally most useful keys first, so a run cut short by its budget still pays off
+    keys_to_verify = prioritize(keys_to_verify, df, PRIORITY_SCORER)
+    
+    # A key present in several cells is checked once; its status is copied to the others
+    duplicates = {}
+    if DEDUPLICATE_KEYS:
+        keys_to_verify, duplicates = group_duplicates(keys_to_verify)
+    duplicate_count = sum(len(cells) for cells in duplicates.values())
+    if duplicate_count:
+        logger.info(f"{duplicate_count} duplicate keys will reuse the status of their first occurrence")
+        print(f"ℹ️  {duplicate_count} duplicate keys will reuse the status of their first occurrence")
+    
     # Count keys by column
     key1_count = sum(1 for _, col, _ in keys_to_verify if col == KEY_1_COLUMN)
     key2_count = sum(1 for _, col, _ in keys_to_verify if col == KEY_2_COLUMN)
@@ -378,9 +331,10 @@ def main():
         key2_status_column = f"{KEY_2_COLUMN}_status"
         total_key2_available = df[(df[KEY_2_COLUMN].notna()) & (df[KEY_2_COLUMN] != '') & (df[key2_status_column].isna())].shape[0]
     
-    print(f"\n📊 Filtering by '{TO_CHECK_COLUMN}' column:")
-    print(f"   - {key1_count}/{total_key1_available} {KEY_1_COLUMN} keys selected (to check = True)")
-    print(f"   - {key2_count}/{total_key2_available} {KEY_2_COLUMN} keys selected (to check = True)")
+    selection = SELECTION_RULES or f"'{TO_CHECK_COLUMN}' column"
+    print(f"\n📊 Filtering by {selection}:")
+    print(f"   - {key1_count}/{total_key1_available} {KEY_1_COLUMN} keys selected")
+    print(f"   - {key2_count}/{total_key2_available} {KEY_2_COLUMN} keys selected")
     
     print("\n⚠️  Instructions:")
     print("1. A Chrome browser will open")
@@ -389,36 +343,88 @@ def main():
     
     input("\n⏸️  Press Enter when you're ready to start...")
     
+    # Statuses written during this run (for the delta output mode)
+    changes = []
+    history = StatusHistory() if RECORD_HISTORY else None
+    archive = PageArchive() if ARCHIVE_PAGES else None
+    run_id = new_run_id()
+    
+    # Live counters, seeded once with the statuses already in the sheet
+    stats = RunStats(min(len(keys_to_verify), MAX_CHECKS or len(keys_to_verify)))
+    for column in (KEY_1_COLUMN, KEY_2_COLUMN):
+        if f"{column}_status" in df.columns and (column == KEY_1_COLUMN or CHECK_KEY_2):
+            stats.seed(f"{column}_status", df[f"{column}_status"])
+    
+    # Optional live metrics for external monitoring (see run_metrics.py)
+    metrics = RunMetrics(stats.total_keys)
+    exporter = MetricsExporter(metrics, METRICS_PORT, METRICS_FILE).start()
+    if METRICS_PORT:
+        print(f"📡 Live metrics on http://127.0.0.1:{METRICS_PORT}/metrics")
+    
     # Initialize the driver
-    driver = setup_driver()
+    def relogin(driver):
+        print("\n⚠️  The restarted browser is not logged in anymore. Please log in to Steamworks...")
+        input("⏸️  Once logged in, press Enter to continue...")
+    
+    supervisor = supervised_browser(on_login_lost=relogin)
+    console = logging.getLogger(CONSOLE_LOGGER)  # Per-key lines, written by the logging thread
     
     try:
         # First visit to allow manual connection
-        driver.get(STEAMWORKS_URL)
+        supervisor.driver.get(STEAMWORKS_URL)
         logger.info("Browser opened, waiting for Steamworks connection")
         print("\n🌐 Browser opened. Please log in to Steamworks...")
         input("⏸️  Once logged in, press Enter to continue...")
+        supervisor.save_login()
         
         checked_count = 0
+        budget = RunBudget(MAX_CHECKS, MAX_MINUTES)
+        if MAX_CHECKS is not None or MAX_MINUTES is not None:
+            print(f"⏱️  Run budget: {budget.describe()}")
         
         for index, column_name, steam_key in keys_to_verify:
-            print(f"\n[{checked_count + 1}/{len(keys_to_verify)}] Checking {column_name}: {steam_key[:10]}...")
+            if budget.exhausted(checked_count):
+                logger.info(f"Run budget reached after {checked_count} keys ({budget.describe()})")
+                print(f"\n⏱️  Run budget reached after {checked_count} keys")
+                break
+            
+            console.info("\n[%d/%d] Checking %s: %s...", checked_count + 1, len(keys_to_verify), column_name, steam_key[:10])
             
             # Check the key
-            status = check_steam_key(driver, steam_key)
+            check_started = time.monotonic()
+            metrics.start_check()
+            raw_status = supervisor.check(check_steam_key, steam_key)
+            latency = time.monotonic() - check_started
+            status, detail = split_status(raw_status)
+            metrics.finish_check(status, latency, queue_depth=len(keys_to_verify) - checked_count - 1)
             
-            # Update the DataFrame in the correct column
-            status_column = f"{column_name}_status"
-            df.loc[index, status_column] = status
+            # Update the DataFrame in the correct column (and in the cells holding the same key)
+            for cell_index, cell_column in [(index, column_name)] + duplicates.get((index, column_name), []):
+                status_column = f"{cell_column}_status"
+                old_status = write_status(df, cell_index, status_column, status, detail)
+                changes.append(status_change(cell_index, status_column, old_status, status, detail,
+                                             key=df.at[cell_index, cell_column]))
+                if cell_index == index and cell_column == column_name:
+                    stats.record(status_column, status, latency, old_status)
+                else:
+                    stats.recount(status_column, status, old_status)
+            if history:
+                history.record(steam_key, status, run_id)
+            if archive and should_archive(status):
+                archive.store(steam_key, supervisor.driver.page_source, status, run_id)
             
-            print(f"   Status: {status}")
+            console.info("   Status: %s", raw_status)
             
             checked_count += 1
+            if checked_count % PROGRESS_EVERY == 0:
+                summary = stats.summary_line()
+                console.info("\n📈 %s", summary)
+                logger.info("Progress: %s", summary)
             
             # Random delay between verifications
             if checked_count < len(keys_to_verify):
                 delay = random.uniform(MIN_DELAY, MAX_DELAY)
-                print(f"   Waiting {delay:.1f} seconds...")
+                console.info("   Waiting %.1f seconds...", delay)
                 time.sleep(delay)
     
     except KeyboardInterrupt:
@@ -430,43 +436,52 @@ def main():
         print(f"\n❌ Error during verification: {e}")
     
     finally:
-        driver.quit()
+        flush_logging()  # Queued per-key lines first, then the summary
+        supervisor.quit()
         logger.info("Browser closed")
+        if supervisor.restarts:
+            print(f"♻️  Browser restarted {supervisor.restarts} time(s) during the run")
+        exporter.stop()
+        if history:
+            history.close()
+        if archive:
+            archive.close()
         
         # Save results
-        os.makedirs('output', exist_ok=True)
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        output_file = f'output/steam_keys_with_status_{timestamp}.csv'
-        df.to_csv(output_file, index=False)
-        logger.info(f"Results saved: {output_file}")
-        print(f"💾 Results saved in: {output_file}")
+        if OUTPUT_MODE == "delta":
+            output_file = write_delta(changes, CSV_FILE_PATH)
+            if output_file:
+                logger.info(f"Delta saved: {output_file} ({len(changes)} changes)")
+                print(f"💾 {len(changes)} status changes saved in: {output_file}")
+                print(f"   Full view: python results_io.py merge {CSV_FILE_PATH}")
+            else:
+                print("ℹ️  No status changed, nothing to save")
+        else:
+            output_file = save_results(df, OUTPUT_FORMAT)
+            logger.info(f"Results saved: {output_file}")
+            print(f"💾 Results saved in: {output_file}")
         
-        # Display summary
+        # Display summary (from the live counters, no pass over the sheet)
         print("\n📊 Status summary:")
-        key1_status_column = f"{KEY_1_COLUMN}_status"
-        if key1_status_column in df.columns:
-            key1_counts = df[key1_status_column].value_counts()
-            print(f"  {KEY_1_COLUMN}:")
-            for status, count in key1_counts.items():
-                if pd.notna(status):
-                    print(f"    {status}: {count}")
-        
-        if CHECK_KEY_2:
-            key2_status_column = f"{KEY_2_COLUMN}_status"
-            if key2_status_column in df.columns:
-                key2_counts = df[key2_status_column].value_counts()
-                print(f"  {KEY_2_COLUMN}:")
-                for status, count in key2_counts.items():
-                    if pd.notna(status):
-                        print(f"    {status}: {count}")
-        
-        # Global summary
         total_verified = 0
-        if key1_status_column in df.columns:
-            total_verified += df[key1_status_column].notna().sum()
-        if CHECK_KEY_2 and key2_status_column in df.columns:
-            total_verified += df[key2_status_column].notna().sum()
+        for status_column, counts in stats.counts.items():
+            print(f"  {status_column[:-len('_status')]}:")
+            for status, count in counts.most_common():
+                if count:
+                    print(f"    {status}: {count}")
+            total_verified += stats.status_total(status_column)
+        print(f"\n📈 {stats.summary_line()}")
         logger.info(f"Verification completed - Total keys verified: {total_verified}")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Steam Keys Checker")
+    parser.add_argument("--profile", action="store_true",
+                        help="Write a CPU (cProfile) and memory (tracemalloc) report in output/")
+    args = parser.parse_args()
+    
+    if args.profile:
+        with RunProfiler(label="main") as profiler:
+            main()
+        print(f"🔬 Profile report saved in: {profiler.report_path}")
+    else:
+        main() 
\ No newline at end of file
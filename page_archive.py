@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Steam Keys Checker - Raw page archive
+Keep the querycdkey result page of every check, compressed and
+content-addressed (identical pages are stored once), so statuses can be
+re-derived offline after a markup change or a parser fix.
+
+Usage:
+    python page_archive.py stats
+    python page_archive.py reparse [--since 2025-07-21] [--workers 4] [--sheet data/steam-keys.csv]
+"""
+
+import argparse
+import gzip
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from status_classifier import classify_page, detect_locale
+from status_history import normalize_key, now_iso
+from status_model import INVALID_FORMAT, NON_KEY_STATUSES, STATUS_NOT_FOUND
+
+ARCHIVE_DIR = os.path.join("output", "page_archive")
+REPARSE_CHUNK = 64  # Pages sent to a worker process at a time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    status TEXT,
+    observed_at TEXT NOT NULL,
+    run_id TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_pages_key_time ON pages (key, observed_at);
+CREATE INDEX IF NOT EXISTS idx_pages_digest ON pages (digest);
+"""
+
+# Statuses whose page is not this key's result page: the check failed or was
+# cut short (the browser still shows the previous result, the form or the
+# login page) or never navigated. Such pages are neither archived nor re-parsed.
+UNARCHIVED_STATUSES = NON_KEY_STATUSES | {INVALID_FORMAT, STATUS_NOT_FOUND}
+
+# Parts of the page that never matter for the status but change on every
+# load (session id, CSRF tokens): dropped so identical results share a blob.
+# page_source is the rendered DOM, so whatever the scripts display is kept;
+# the classifier ignores <head>, <script> and <style> anyway.
+# The key itself is replaced by KEY_PLACEHOLDER for the same reason.
+KEY_PLACEHOLDER = "{{STEAM_KEY}}"
+VOLATILE_RE = re.compile(r"<head\b.*?</head>|<script\b.*?</script>|<style\b.*?</style>", re.I | re.S)
+
+
+def should_archive(status):
+    return status not in UNARCHIVED_STATUSES
+
+
+def archive_body(page_source, steam_key):
+    return VOLATILE_RE.sub("", page_source).replace(normalize_key(steam_key), KEY_PLACEHOLDER)
+
+
+class PageArchive:
+    """Compressed page blobs (objects/ab/cdef....html.gz) plus an SQLite index."""
+
+    def __init__(self, root=ARCHIVE_DIR):
+        self.root = root
+        os.makedirs(os.path.join(root, "objects"), exist_ok=True)
+        self.conn = sqlite3.connect(os.path.join(root, "index.sqlite3"), check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.lock = threading.RLock()
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def blob_path(self, digest):
+        return os.path.join(self.root, "objects", digest[:2], f"{digest[2:]}.html.gz")
+
+    def store(self, steam_key, page_source, status, run_id):
+        """Archive the page that produced `status`; returns its digest."""
+        data = archive_body(page_source, steam_key).encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.blob_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with gzip.open(temp_path, "wb", compresslevel=6) as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT INTO pages (key, digest, status, observed_at, run_id) VALUES (?, ?, ?, ?, ?)",
+                (normalize_key(steam_key), digest, status, now_iso(), run_id),
+            )
+        return digest
+
+    def load(self, digest):
+        with gzip.open(self.blob_path(digest), "rb") as f:
+            return f.read().decode("utf-8")
+
+    def latest_pages(self, since=None):
+        """Latest archived page of every key, unless it is not a result page (UNARCHIVED_STATUSES)."""
+        skipped = sorted(UNARCHIVED_STATUSES)
+        query = f"""
+            SELECT id, key, digest, status, observed_at, run_id FROM (
+                SELECT *, ROW_NUMBER() OVER (PARTITION BY key ORDER BY observed_at DESC, id DESC) AS rn
+                FROM pages
+            ) WHERE rn = 1 AND status NOT IN ({", ".join("?" * len(skipped))})
+        """
+        params = list(skipped)
+        if since:
+            query += " AND observed_at >= ?"
+            params.append(since)
+        with self.lock:
+            return self.conn.execute(query, params).fetchall()
+
+    def stats(self):
+        with self.lock:
+            row = self.conn.execute("SELECT COUNT(*) AS pages, COUNT(DISTINCT digest) AS blobs FROM pages").fetchone()
+        size = sum(entry.stat().st_size for folder in os.scandir(os.path.join(self.root, "objects"))
+                   if folder.is_dir() for entry in os.scandir(folder.path))
+        return row["pages"], row["blobs"], size
+
+    def update_status(self, page_id, status):
+        with self.lock, self.conn:
+            self.conn.execute("UPDATE pages SET status = ? WHERE id = ?", (status, page_id))
+
+
+def classify_blobs(args):
+    """Worker: classify a chunk of blobs (runs in a separate process)."""
+    root, digests = args
+    results = {}
+    for digest in digests:
+        with gzip.open(os.path.join(root, "objects", digest[:2], f"{digest[2:]}.html.gz"), "rb") as f:
+            page = f.read().decode("utf-8")
+        results[digest] = classify_page(page, detect_locale(page))
+    return results
+
+
+def reparse(archive, since=None, workers=None):
+    """
+    Reclassify the latest page of every key, each distinct blob once, in parallel.
+
+    Returns [(page row, new status, detail)] for the keys whose status changed.
+    """
+    rows = archive.latest_pages(since)
+    digests = sorted({row["digest"] for row in rows})
+    chunks = [(archive.root, digests[i:i + REPARSE_CHUNK]) for i in range(0, len(digests), REPARSE_CHUNK)]
+    statuses = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for result in pool.map(classify_blobs, chunks):
+            statuses.update(result)
+    changed = []
+    for row in rows:
+        status, detail = statuses[row["digest"]]
+        if status != row["status"]:
+            changed.append((row, status, detail))
+    return changed
+
+
+def apply_to_sheet(changed, sheet_path):
+    """Write the reclassified statuses of a sheet as a delta (see results_io.py)."""
+    from results_io import STATUS_SUFFIX, load_keys_file, status_change, status_columns, write_delta
+
+    new_status = {row["key"]: (status, detail) for row, status, detail in changed}
+    df = load_keys_file(sheet_path)
+    changes = []
+    for status_column in status_columns(df):
+        key_column = status_column[:-len(STATUS_SUFFIX)]
+        if key_column not in df.columns:
+            continue
+        keys = df[key_column].dropna().map(normalize_key)
+        for index, key in keys[keys.isin(new_status.keys())].items():
+            status, detail = new_status[key]
+            old_status = df.loc[index, status_column]
+            if old_status != status:
+                changes.append(status_change(index, status_column, old_status, status, detail, key=key))
+    return write_delta(changes, sheet_path), len(changes)
+
+
+def main():
+    from status_history import StatusHistory
+
+    parser = argparse.ArgumentParser(description="Steam Keys Checker - raw page archive")
+    parser.add_argument("--archive", default=ARCHIVE_DIR, help="Archive directory")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("stats", help="Pages, distinct blobs and disk usage")
+    reparse_parser = subparsers.add_parser("reparse", help="Reclassify archived pages without network requests")
+    reparse_parser.add_argument("--since", help="Only pages archived since this ISO date")
+    reparse_parser.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    reparse_parser.add_argument("--sheet", help="Also write a delta for this key sheet")
+    reparse_parser.add_argument("--dry-run", action="store_true", help="Only report the changes")
+    args = parser.parse_args()
+
+    with PageArchive(args.archive) as archive:
+        if args.command == "stats":
+            pages, blobs, size = archive.stats()
+            print(f"📦 {pages} pages archived, {blobs} distinct blobs, {size / 1024:.1f} KiB on disk")
+            return
+
+        changed = reparse(archive, args.since, args.workers)
+        for row, status, detail in changed:
+            print(f"  {row['key']}: {row['status']} -> {status}" + (f" ({detail})" if detail else ""))
+        print(f"\n🔁 {len(changed)} status(es) changed after re-parsing")
+        if args.dry_run or not changed:
+            return
+
+        run_id = f"reparse_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        with StatusHistory() as history:
+            # Dated when the page was fetched: re-parsing says nothing about the key's state today
+            history.record_many((row["key"], status, row["observed_at"], run_id) for row, status, _ in changed)
+        for row, status, _ in changed:
+            archive.update_status(row["id"], status)
+        print(f"✅ Status history and archive index updated (run {run_id})")
+
+        if args.sheet:
+            output_file, count = apply_to_sheet(changed, args.sheet)
+            if output_file:
+                print(f"💾 {count} status changes saved in: {output_file}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Steam Keys Checker - Results I/O
+Read and write key sheets as CSV, Parquet or Feather (Arrow IPC), and
+record per-run status deltas that can be merged back into a full view.
+
+Usage:
+    python results_io.py merge data/steam-keys.csv [--format parquet]
+"""
+
+import argparse
+import glob
+import hashlib
+import logging
+import os
+from datetime import datetime
+
+import pandas as pd
+
+from status_history import normalize_key
+from status_model import STATUS_SUFFIX, detail_column, normalize_status_columns
+
+OUTPUT_DIR = "output"
+OUTPUT_BASENAME = "steam_keys_with_status"
+DELTA_DIR = os.path.join(OUTPUT_DIR, "deltas")
+DELTA_COLUMNS = ["row_id", "key", "column", "old_status", "new_status", "detail", "timestamp"]
+
+# Supported formats and their file extensions
+FORMAT_EXTENSIONS = {
+    "csv": ".csv",
+    "parquet": ".parquet",
+    "feather": ".feather",
+}
+EXTENSION_FORMATS = {
+    ".csv": "csv",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".feather": "feather",
+    ".arrow": "feather",
+}
+
+
+def has_arrow():
+    """Return True if pyarrow is available for Parquet/Feather I/O."""
+    try:
+        import pyarrow  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def detect_format(path):
+    """Guess the file format from its extension (defaults to CSV)."""
+    extension = os.path.splitext(path)[1].lower()
+    return EXTENSION_FORMATS.get(extension, "csv")
+
+
+def status_columns(df):
+    """List the `<key column>_status` columns of a DataFrame."""
+    return [col for col in df.columns if str(col).endswith(STATUS_SUFFIX)]
+
+
+def load_keys_file(path, columns=None):
+    """
+    Load a key sheet as a DataFrame.
+
+    `columns` restricts the read to a subset of columns, which is only
+    cheap for the columnar formats (Parquet/Feather).
+    """
+    file_format = detect_format(path)
+    if file_format == "parquet":
+        df = pd.read_parquet(path, columns=columns)
+    elif file_format == "feather":
+        df = pd.read_feather(path, columns=columns)
+    else:
+        df = pd.read_csv(path, usecols=columns)
+
+    # Status columns use the fixed status categories (see status_model.py);
+    # older sheets with free-form error strings are split on load.
+    return normalize_status_columns(df)
+
+
+def to_columnar(df):
+    """Return a copy of df with typed, categorical status columns."""
+    return normalize_status_columns(df.copy())
+
+
+def output_path(output_format="csv", output_dir=OUTPUT_DIR, timestamp=None, basename=OUTPUT_BASENAME):
+    """Build the timestamped output path for a run."""
+    if timestamp is None:
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    extension = FORMAT_EXTENSIONS[output_format]
+    return os.path.join(output_dir, f"{basename}_{timestamp}{extension}")
+
+
+def save_results(df, output_format="csv", output_dir=OUTPUT_DIR, basename=OUTPUT_BASENAME):
+    """
+    Write the results DataFrame to `output_dir` and return the file path.
+
+    Parquet/Feather need pyarrow; without it the results fall back to CSV
+    so a run is never lost.
+    """
+    if output_format not in FORMAT_EXTENSIONS:
+        raise ValueError(f"Unsupported output format: {output_format}")
+    if output_format != "csv" and not has_arrow():
+        output_format = "csv"
+
+    os.makedirs(output_dir, exist_ok=True)
+    path = output_path(output_format, output_dir, basename=basename)
+
+    if output_format == "parquet":
+        to_columnar(df).to_parquet(path, index=False)
+    elif output_format == "feather":
+        to_columnar(df).reset_index(drop=True).to_feather(path)
+    else:
+        df.to_csv(path, index=False)
+    return path
+
+
+def status_change(row_id, status_column, old_status, new_status, detail=None, key=None):
+    """
+    Build one delta record for a status written during this run.
+
+    `key` is the key in the row's key cell: merge_deltas only applies the
+    record while that row still holds the same key.
+    """
+    return {
+        "row_id": row_id,
+        "key": None if key is None or pd.isna(key) else normalize_key(key),
+        "column": status_column,
+        "old_status": None if pd.isna(old_status) else old_status,
+        "new_status": new_status,
+        "detail": detail,
+        "timestamp": datetime.now().isoformat(timespec='seconds'),
+    }
+
+
+def delta_prefix(source_path):
+    """
+    Delta files are named after the input sheet they patch, plus a hash of
+    its absolute path: sheets with the same name in different directories
+    get separate deltas.
+    """
+    path_hash = hashlib.sha1(os.path.normcase(os.path.abspath(source_path)).encode("utf-8")).hexdigest()[:8]
+    return f"{os.path.splitext(os.path.basename(source_path))[0]}_{path_hash}_delta_"
+
+
+def write_delta(changes, source_path, delta_dir=DELTA_DIR):
+    """
+    Write only the statuses touched in this run and return the file path.
+
+    Returns None when nothing changed, so an empty run costs no write.
+    """
+    if not changes:
+        return None
+    os.makedirs(delta_dir, exist_ok=True)
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    path = os.path.join(delta_dir, f"{delta_prefix(source_path)}{timestamp}.csv")
+    pd.DataFrame(changes, columns=DELTA_COLUMNS).to_csv(path, index=False)
+    return path
+
+
+def list_deltas(source_path, delta_dir=DELTA_DIR):
+    """List the delta files of a sheet, oldest first."""
+    pattern = os.path.join(delta_dir, f"{glob.escape(delta_prefix(source_path))}*.csv")
+    return sorted(glob.glob(pattern))
+
+
+def drop_moved_rows(df, deltas):
+    """
+    Keep the delta records whose row still holds the recorded key.
+
+    A re-sorted or edited sheet would otherwise get statuses on the wrong
+    rows; the skipped records are logged.
+    """
+    if "key" not in deltas.columns:
+        return deltas
+    key_columns = deltas["column"].str[:-len(STATUS_SUFFIX)]
+    current = [df.at[row_id, column] if column in df.columns else None
+               for row_id, column in zip(deltas["row_id"], key_columns)]
+    current = pd.Series(current, index=deltas.index).map(lambda key: None if pd.isna(key) else normalize_key(key))
+    keep = deltas["key"].isna() | (current == deltas["key"])
+    if not keep.all():
+        skipped = deltas[~keep]
+        logging.getLogger(__name__).warning(
+            "%d status delta(s) skipped: the row no longer holds the key (e.g. row %s, %s)",
+            len(skipped), skipped["row_id"].iloc[0], skipped["key"].iloc[0])
+    return deltas[keep]
+
+
+def merge_deltas(source_path, delta_paths=None, delta_dir=DELTA_DIR):
+    """Materialize the latest full view: the source sheet with every delta applied."""
+    df = load_keys_file(source_path)
+    if delta_paths is None:
+        delta_paths = list_deltas(source_path, delta_dir)
+    if not delta_paths:
+        return df
+
+    deltas = pd.concat([pd.read_csv(path) for path in delta_paths], ignore_index=True)
+    # Latest observation wins for each (row, column)
+    latest = (deltas.sort_values("timestamp", kind="stable")
+                    .drop_duplicates(["row_id", "column"], keep="last"))
+    latest = latest[latest["row_id"].isin(df.index)]
+    latest = drop_moved_rows(df, latest)
+
+    for column, changes in latest.groupby("column"):
+        if column not in df.columns:
+            df[column] = None
+        rows = changes["row_id"].to_numpy()
+        df[column] = df[column].astype(object)
+        df.loc[rows, column] = changes["new_status"].to_numpy()
+        # Deltas written before the detail column existed have no "detail"
+        if "detail" in changes.columns:
+            target = detail_column(column)
+            if target not in df.columns:
+                df[target] = None
+            df[target] = df[target].astype(object)
+            df.loc[rows, target] = changes["detail"].where(changes["detail"].notna(), None).to_numpy()
+    return normalize_status_columns(df)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Steam Keys Checker - results tools")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    merge_parser = subparsers.add_parser("merge", help="Apply all status deltas to a key sheet")
+    merge_parser.add_argument("source", help="Original key sheet (CSV, Parquet or Feather)")
+    merge_parser.add_argument("--deltas", default=DELTA_DIR, help="Directory containing delta files")
+    merge_parser.add_argument("--format", choices=list(FORMAT_EXTENSIONS), default="csv",
+                              help="Output format of the merged view")
+    merge_parser.add_argument("--output-dir", default=OUTPUT_DIR)
+
+    args = parser.parse_args()
+
+    if args.command == "merge":
+        delta_paths = list_deltas(args.source, args.deltas)
+        print(f"🔗 Merging {len(delta_paths)} delta file(s) into {args.source}")
+        df = merge_deltas(args.source, delta_paths)
+        output_file = save_results(df, args.format, args.output_dir)
+        print(f"💾 Merged results saved in: {output_file}")
+
+
+if __name__ == "__main__":
+    main()
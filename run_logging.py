@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Steam Keys Checker - Non-blocking logging
+A log call only puts the record on a queue; a background QueueListener
+formats it and writes it to a size-rotated JSON-lines file and to the
+console, so the check loop never waits on disk or terminal output.
+
+Records are formatted in the listener thread, not by the caller: use
+%-style arguments (logger.info("Key %s", key)) rather than f-strings, and
+only pass values that are not modified afterwards.
+
+Two dedicated loggers:
+    KEY_LOGGER       One record per checked key; its level is set separately
+                     (e.g. "WARNING" keeps only the run-level records).
+    CONSOLE_LOGGER   Progress lines for the terminal (stdout, message only,
+                     kept out of the log file): queued prints.
+"""
+
+import atexit
+import json
+import logging
+import queue
+import sys
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+LOG_MAX_BYTES = 10 * 1024 * 1024  # Rotate the log file at 10 MB
+LOG_BACKUPS = 5  # Rotated files kept (.log.1 ... .log.5)
+KEY_LOGGER = "steam_keys.keys"
+CONSOLE_LOGGER = "steam_keys.console"
+TEXT_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+# Attributes every LogRecord has; anything else was passed with `extra=`
+RECORD_ATTRIBUTES = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "taskName"}
+
+_queue = None
+_listener = None
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: time, level, logger, message and the `extra` fields."""
+
+    def format(self, record):
+        entry = {
+            "time": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        entry.update((name, value) for name, value in vars(record).items() if name not in RECORD_ATTRIBUTES)
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    Enqueue the record untouched.
+
+    The standard QueueHandler.prepare() formats the message in the calling
+    thread; the listener's handlers do it here instead.
+    """
+
+    def prepare(self, record):
+        return record
+
+
+def start_logging(log_file=None, level=logging.INFO, key_level=logging.INFO, json_file=True,
+                  max_bytes=LOG_MAX_BYTES, backups=LOG_BACKUPS):
+    """
+    Route every log record through the queue; returns the log file path.
+
+    Safe to call more than once: only the first call configures logging.
+    """
+    global _queue, _listener
+    if _listener:
+        return _listener.handlers[0].baseFilename
+
+    log_file = log_file or f"steam_keys_checker_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+    not_console = lambda record: record.name != CONSOLE_LOGGER
+
+    file_handler = RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backups, encoding='utf-8')
+    file_handler.setFormatter(JsonFormatter() if json_file else logging.Formatter(TEXT_FORMAT))
+    file_handler.addFilter(not_console)
+
+    log_console = logging.StreamHandler()
+    log_console.setFormatter(logging.Formatter(TEXT_FORMAT))
+    log_console.addFilter(not_console)
+
+    progress_console = logging.StreamHandler(sys.stdout)
+    progress_console.addFilter(lambda record: record.name == CONSOLE_LOGGER)
+
+    _queue = queue.Queue()  # Unbounded: a log call never waits
+    _listener = QueueListener(_queue, file_handler, log_console, progress_console, respect_handler_level=True)
+    _listener.start()
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(DeferredQueueHandler(_queue))
+    root.setLevel(level)
+    logging.getLogger(KEY_LOGGER).setLevel(key_level)
+    logging.getLogger(CONSOLE_LOGGER).setLevel(logging.INFO)
+
+    atexit.register(stop_logging)
+    return log_file
+
+
+def flush_logging():
+    """Wait until every queued record has been written (before printing directly again)."""
+    if _listener:
+        _queue.join()
+
+
+def stop_logging():
+    """Write the remaining records and stop the listener thread."""
+    global _listener
+    if _listener:
+        _listener.stop()
+        _listener = None
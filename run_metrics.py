@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Steam Keys Checker - Live run metrics
+Counters, gauges and a latency histogram fed by the check loop, exposed as
+a Prometheus text endpoint and/or a JSON file rewritten periodically, so
+existing monitoring can alert when throughput collapses (session expiry,
+throttling).
+
+Endpoints (when a port is configured, localhost only):
+    GET /metrics         Prometheus text format
+    GET /metrics.json    Same values as JSON
+"""
+
+import json
+import os
+import threading
+import time
+from collections import Counter, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from status_model import NON_KEY_STATUSES
+
+LATENCY_BUCKETS = (0.5, 1, 2, 5, 10, 20, 30, 60)  # Seconds, upper bounds of the histogram
+RATE_WINDOW = 120  # Seconds of history used for keys/second
+JSON_INTERVAL = 10  # Seconds between two rewrites of the JSON file
+PREFIX = "steam_keys"
+
+
+class RunMetrics:
+    """Thread-safe metrics of one run; the check loop writes, exporters read."""
+
+    def __init__(self, total_keys=0):
+        self.lock = threading.Lock()
+        self.started_at = time.time()
+        self.total_keys = total_keys
+        self.checked = 0
+        self.in_flight = 0
+        self.queue_depth = total_keys
+        self.status_counts = Counter()
+        self.latency_buckets = [0] * len(LATENCY_BUCKETS)
+        self.latency_sum = 0.0
+        self.latency_count = 0
+        self.completions = deque()
+        self.last_result_at = None
+
+    def start_check(self):
+        with self.lock:
+            self.in_flight += 1
+
+    def finish_check(self, status, latency, queue_depth=None):
+        now = time.time()
+        with self.lock:
+            self.in_flight = max(0, self.in_flight - 1)
+            self.checked += 1
+            self.status_counts[status] += 1
+            self.latency_sum += latency
+            self.latency_count += 1
+            for position, bound in enumerate(LATENCY_BUCKETS):
+                if latency <= bound:
+                    self.latency_buckets[position] += 1
+            if queue_depth is not None:
+                self.queue_depth = queue_depth
+            self.last_result_at = now
+            self.completions.append(now)
+            while self.completions and now - self.completions[0] > RATE_WINDOW:
+                self.completions.popleft()
+
+    def snapshot(self):
+        """Consistent copy of every value, computed once per export."""
+        now = time.time()
+        with self.lock:
+            window = min(RATE_WINDOW, now - self.started_at)
+            recent = sum(1 for t in self.completions if now - t <= RATE_WINDOW)
+            errors = sum(count for status, count in self.status_counts.items() if status in NON_KEY_STATUSES)
+            return {
+                "started_at": self.started_at,
+                "uptime_seconds": now - self.started_at,
+                "total_keys": self.total_keys,
+                "keys_checked": self.checked,
+                "keys_per_second": recent / window if window > 0 else 0.0,
+                "in_flight": self.in_flight,
+                "queue_depth": self.queue_depth,
+                "status_counts": dict(self.status_counts),
+                "errors": errors,
+                "error_rate": errors / self.checked if self.checked else 0.0,
+                "seconds_since_last_result": now - self.last_result_at if self.last_result_at else None,
+                "latency": {
+                    "buckets": dict(zip((str(b) for b in LATENCY_BUCKETS), self.latency_buckets)),
+                    "sum": self.latency_sum,
+                    "count": self.latency_count,
+                },
+            }
+
+    def to_prometheus(self):
+        values = self.snapshot()
+        lines = [
+            f"# HELP {PREFIX}_checked_total Keys checked in this run.",
+            f"# TYPE {PREFIX}_checked_total counter",
+            f"{PREFIX}_checked_total {values['keys_checked']}",
+            f"# HELP {PREFIX}_status_total Keys checked, by status.",
+            f"# TYPE {PREFIX}_status_total counter",
+        ]
+        lines.extend(f'{PREFIX}_status_total{{status="{status}"}} {count}'
+                     for status, count in sorted(values["status_counts"].items()))
+        gauges = [
+            ("keys_per_second", "Keys checked per second over the last window."),
+            ("in_flight", "Checks currently running."),
+            ("queue_depth", "Keys still waiting in the queue."),
+            ("error_rate", "Share of checks that ended in Error or Stopped."),
+            ("total_keys", "Keys queued at the start of the run."),
+            ("uptime_seconds", "Seconds since the run started."),
+        ]
+        for name, help_text in gauges:
+            lines += [f"# HELP {PREFIX}_{name} {help_text}", f"# TYPE {PREFIX}_{name} gauge",
+                      f"{PREFIX}_{name} {values[name]}"]
+        if values["seconds_since_last_result"] is not None:
+            lines += [f"# HELP {PREFIX}_seconds_since_last_result Seconds since the last key finished (stall detector).",
+                      f"# TYPE {PREFIX}_seconds_since_last_result gauge",
+                      f"{PREFIX}_seconds_since_last_result {values['seconds_since_last_result']}"]
+        lines += [f"# HELP {PREFIX}_check_latency_seconds Duration of one key check.",
+                  f"# TYPE {PREFIX}_check_latency_seconds histogram"]
+        lines.extend(f'{PREFIX}_check_latency_seconds_bucket{{le="{bound}"}} {count}'
+                     for bound, count in values["latency"]["buckets"].items())
+        lines += [f'{PREFIX}_check_latency_seconds_bucket{{le="+Inf"}} {values["latency"]["count"]}',
+                  f"{PREFIX}_check_latency_seconds_sum {values['latency']['sum']}",
+                  f"{PREFIX}_check_latency_seconds_count {values['latency']['count']}"]
+        return "\n".join(lines) + "\n"
+
+
+class MetricsExporter:
+    """Serve the metrics over HTTP and/or rewrite them to a JSON file, in background threads."""
+
+    def __init__(self, metrics, port=None, json_path=None, interval=JSON_INTERVAL):
+        self.metrics = metrics
+        self.port = port
+        self.json_path = json_path
+        self.interval = interval
+        self.server = None
+        self.stopped = threading.Event()
+
+    def start(self):
+        if self.port:
+            # Localhost only, like checker_service.py
+            self.server = ThreadingHTTPServer(("127.0.0.1", self.port), make_handler(self.metrics))
+            threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        if self.json_path:
+            threading.Thread(target=self.json_loop, daemon=True).start()
+        return self
+
+    def write_json(self):
+        directory = os.path.dirname(self.json_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = self.json_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self.metrics.snapshot(), f, indent=2)
+        os.replace(temp_path, self.json_path)  # Readers never see a half-written file
+
+    def json_loop(self):
+        while not self.stopped.wait(self.interval):
+            self.write_json()
+
+    def stop(self):
+        self.stopped.set()
+        if self.json_path:
+            self.write_json()  # Final values
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+
+
+def make_handler(metrics):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass  # Scraped every few seconds: keep the run log clean
+
+        def do_GET(self):
+            if self.path == "/metrics":
+                body, content_type = metrics.to_prometheus().encode("utf-8"), "text/plain; version=0.0.4"
+            elif self.path == "/metrics.json":
+                body, content_type = json.dumps(metrics.snapshot()).encode("utf-8"), "application/json"
+            else:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    return Handler
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Steam Keys Checker - Run profiler
+Wrap a verification run in cProfile and tracemalloc, and write one
+self-contained report (plus the raw .prof for snakeviz / pstats) in output/.
+
+Usage:
+    python main.py --profile
+    python run_profiler.py output/profile_20250729_171028.prof   # Re-print a saved profile
+"""
+
+import argparse
+import cProfile
+import io
+import os
+import pstats
+import time
+import tracemalloc
+from datetime import datetime
+
+OUTPUT_DIR = "output"
+TOP_FUNCTIONS = 30  # Functions listed per sort order in the report
+TOP_ALLOCATIONS = 20  # Source lines listed in the memory sections
+TRACEMALLOC_FRAMES = 5  # Stack depth kept per allocation
+
+
+class RunProfiler:
+    """
+    Context manager profiling the calling thread (CPU) and the whole process (memory).
+
+    cProfile only sees the thread that entered the context, so in the GUI the
+    report covers the verification thread, not Tk redraws.
+    """
+
+    def __init__(self, output_dir=OUTPUT_DIR, label="run"):
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        self.prof_path = os.path.join(output_dir, f"profile_{label}_{timestamp}.prof")
+        self.report_path = os.path.join(output_dir, f"profile_{label}_{timestamp}.txt")
+        self.profiler = cProfile.Profile()
+        self.baseline = None
+        self.started_at = None
+
+    def __enter__(self):
+        os.makedirs(os.path.dirname(self.report_path) or ".", exist_ok=True)
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        self.baseline = tracemalloc.take_snapshot()
+        self.started_at = time.perf_counter()
+        self.profiler.enable()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.disable()
+        elapsed = time.perf_counter() - self.started_at
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        self.profiler.dump_stats(self.prof_path)
+        with open(self.report_path, "w", encoding="utf-8") as f:
+            f.write(f"Steam Keys Checker - run profile ({datetime.now().isoformat(timespec='seconds')})\n")
+            f.write(f"Wall time: {elapsed:.1f}s | Traced memory: {current / 1e6:.1f} MB, peak {peak / 1e6:.1f} MB\n")
+            f.write(f"Raw profile: {self.prof_path}\n\n")
+            f.write(cpu_report(self.prof_path))
+            f.write(memory_report(self.baseline, snapshot))
+        return False
+
+
+def cpu_report(prof_path, limit=TOP_FUNCTIONS):
+    """Top functions by cumulative and by own time."""
+    out = io.StringIO()
+    for sort_key, title in (("cumulative", "CPU - cumulative time"), ("tottime", "CPU - own time")):
+        out.write(f"=== {title} (top {limit}) ===\n")
+        pstats.Stats(prof_path, stream=out).strip_dirs().sort_stats(sort_key).print_stats(limit)
+    return out.getvalue()
+
+
+def memory_report(baseline, snapshot, limit=TOP_ALLOCATIONS):
+    """Live allocations at the end of the run, and growth since it started."""
+    filters = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, "<frozen importlib._bootstrap>")]
+    snapshot = snapshot.filter_traces(filters)
+    lines = [f"=== Memory - live allocations by line (top {limit}) ==="]
+    lines.extend(str(stat) for stat in snapshot.statistics("lineno")[:limit])
+    lines.append(f"\n=== Memory - growth since start (top {limit}) ===")
+    lines.extend(str(stat) for stat in snapshot.compare_to(baseline.filter_traces(filters), "lineno")[:limit])
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Steam Keys Checker - print a saved run profile")
+    parser.add_argument("prof_path")
+    parser.add_argument("--limit", type=int, default=TOP_FUNCTIONS)
+    args = parser.parse_args()
+    print(cpu_report(args.prof_path, args.limit))
+
+
+if __name__ == "__main__":
+    main()
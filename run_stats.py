@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Steam Keys Checker - Live run statistics
+Incremental status counters, throughput and ETA, updated on every result.
+"""
+
+import time
+from collections import Counter, deque
+
+import pandas as pd
+
+THROUGHPUT_WINDOW = 300  # Seconds of history used for the rolling keys/minute
+EWMA_ALPHA = 0.2  # Weight of the latest key in the per-key duration average
+
+
+def format_duration(seconds):
+    """Format a duration in seconds as '1h02m', '3m05s' or '12s'."""
+    if seconds is None:
+        return "?"
+    seconds = int(seconds)
+    hours, remainder = divmod(seconds, 3600)
+    minutes, secs = divmod(remainder, 60)
+    if hours:
+        return f"{hours}h{minutes:02d}m"
+    if minutes:
+        return f"{minutes}m{secs:02d}s"
+    return f"{secs}s"
+
+
+class RunStats:
+    """Running counters for a verification run, updated in O(1) per key."""
+
+    def __init__(self, total_keys=0):
+        self.total_keys = total_keys
+        self.checked = 0
+        self.counts = {}  # status column -> Counter of statuses
+        self.run_counts = Counter()  # statuses produced by this run only
+        self.started_at = time.monotonic()
+        self.last_result_at = self.started_at
+        self.completions = deque()
+        self.ewma_cycle = None  # seconds per key, including delays
+        self.ewma_latency = None  # seconds per check_steam_key call
+
+    def seed(self, status_column, series):
+        """Start from the statuses already present in the sheet (one pass, at load time)."""
+        self.counts[status_column] = Counter({status: count for status, count in series.value_counts().items() if count})
+
+    def recount(self, status_column, status, old_status=None):
+        """Move one cell from its old status to its new one (no throughput accounting)."""
+        column_counts = self.counts.setdefault(status_column, Counter())
+        if old_status is not None and not pd.isna(old_status) and column_counts[old_status] > 0:
+            column_counts[old_status] -= 1
+        column_counts[status] += 1
+
+    def record(self, status_column, status, latency=None, old_status=None):
+        """Account for one result."""
+        now = time.monotonic()
+        self.recount(status_column, status, old_status)
+        self.run_counts[status] += 1
+        self.checked += 1
+
+        cycle = now - self.last_result_at
+        self.last_result_at = now
+        self.ewma_cycle = cycle if self.ewma_cycle is None else (
+            EWMA_ALPHA * cycle + (1 - EWMA_ALPHA) * self.ewma_cycle)
+        if latency is not None:
+            self.ewma_latency = latency if self.ewma_latency is None else (
+                EWMA_ALPHA * latency + (1 - EWMA_ALPHA) * self.ewma_latency)
+
+        self.completions.append(now)
+        while self.completions and now - self.completions[0] > THROUGHPUT_WINDOW:
+            self.completions.popleft()
+
+    def keys_per_minute(self):
+        """Rolling throughput over the last THROUGHPUT_WINDOW seconds."""
+        if not self.completions:
+            return 0.0
+        window = min(THROUGHPUT_WINDOW, time.monotonic() - self.started_at)
+        return len(self.completions) * 60 / window if window > 0 else 0.0
+
+    def eta_seconds(self):
+        remaining = self.total_keys - self.checked
+        if remaining <= 0:
+            return 0
+        if self.ewma_cycle is None:
+            return None
+        return remaining * self.ewma_cycle
+
+    def activation_rate(self):
+        """Activated share of the keys that got a definitive answer in this run."""
+        activated = self.run_counts["Activated"]
+        decided = activated + self.run_counts["Not activated"]
+        return activated / decided if decided else None
+
+    def status_total(self, status_column):
+        return sum(self.counts.get(status_column, Counter()).values())
+
+    def summary_line(self):
+        """One-line live summary for the console or the GUI progress area."""
+        activated = self.run_counts["Activated"]
+        not_activated = self.run_counts["Not activated"]
+        others = self.checked - activated - not_activated
+        rate = self.activation_rate()
+        rate_text = f"{rate:.0%}" if rate is not None else "-"
+        return (f"{self.checked}/{self.total_keys} | Activated: {activated} | "
+                f"Not activated: {not_activated} | Other: {others} | "
+                f"Activation rate: {rate_text} | {self.keys_per_minute():.1f} keys/min | "
+                f"ETA: {format_duration(self.eta_seconds())}")
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Steam Keys Checker - Sampling audit
+Estimate a campaign's activation rate from a stratified random sample of
+its keys instead of checking every row, and stop as soon as the confidence
+interval is narrow enough.
+
+Usage:
+    python sampling_audit.py data/steam-keys.csv [--strata type lang] [--margin 0.05] [--confidence 0.95]
+    python sampling_audit.py data/steam-keys.csv --strata column    # Stratify by key column
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import time
+from statistics import NormalDist
+
+from campaign import CampaignFile, mapping_for
+from main import MAX_DELAY, MIN_DELAY, STEAMWORKS_URL, check_steam_key, setup_logging, supervised_browser
+from results_io import OUTPUT_DIR
+from status_history import StatusHistory, new_run_id
+from status_model import ACTIVATED, NOT_ACTIVATED, OWNERSHIP_ISSUE, split_status
+
+DEFAULT_STRATA = ["type"]
+KEY_COLUMN_STRATUM = "column"  # Pseudo-column: stratify by key_1 / key_2
+MARGIN = 0.05  # Stop when the interval half-width is below this (5 points)
+CONFIDENCE = 0.95
+MIN_SAMPLE = 30  # Decided keys required before the interval is trusted
+MIN_PER_STRATUM = 2  # Decided keys required in every stratum (that still has keys) before stopping
+MAX_SAMPLE = 1000  # Hard cap on network checks
+
+
+class StratifiedSampler:
+    """
+    Draw keys one at a time, keeping every stratum's share of the sample
+    proportional to its share of the population.
+    """
+
+    def __init__(self, items, labels, seed=None):
+        rng = random.Random(seed)
+        self.pending = {}
+        for item, label in zip(items, labels):
+            self.pending.setdefault(label, []).append(item)
+        for group in self.pending.values():
+            rng.shuffle(group)
+        self.population = {label: len(group) for label, group in self.pending.items()}
+        self.total = sum(self.population.values())
+        self.drawn = {label: 0 for label in self.population}
+        self.activated = {label: 0 for label in self.population}
+        self.decided = {label: 0 for label in self.population}
+
+    def draw(self):
+        """Next (label, item) from the most under-sampled stratum, or None when exhausted."""
+        candidates = [label for label, group in self.pending.items() if group]
+        if not candidates:
+            return None
+        label = min(candidates, key=lambda l: self.drawn[l] / self.population[l])
+        self.drawn[label] += 1
+        return label, self.pending[label].pop()
+
+    def record(self, label, status):
+        """
+        Only definitive answers count; errors and invalid keys are left out.
+
+        OWNERSHIP_ISSUE is a not-activated key (red status, range hidden from
+        this account): it counts as decided and not activated.
+        """
+        if status in (ACTIVATED, NOT_ACTIVATED, OWNERSHIP_ISSUE):
+            self.decided[label] += 1
+            self.activated[label] += status == ACTIVATED
+
+    def sample_size(self):
+        return sum(self.decided.values())
+
+    def represented(self, minimum=MIN_PER_STRATUM):
+        """Every stratum has `minimum` decided keys, or no key left to draw."""
+        return all(self.decided[label] >= minimum or not self.pending[label] for label in self.population)
+
+    def unrepresented_weight(self):
+        """Share of the population in strata without any decided key."""
+        return sum(self.population[label] for label in self.population if not self.decided[label]) / self.total
+
+    def estimate(self, confidence=CONFIDENCE):
+        """
+        Stratified activation rate with a normal-approximation interval.
+
+        Returns (rate, low, high). Strata without a decided key yet are left
+        out of the rate, with their weight spread over the others, and the
+        interval is widened to cover any rate in them (0 to 100%).
+        """
+        strata = [label for label in self.population if self.decided[label]]
+        if not strata:
+            return None
+        weight_total = sum(self.population[label] for label in strata)
+        rate = variance = 0.0
+        for label in strata:
+            weight = self.population[label] / weight_total
+            n, big_n = self.decided[label], self.population[label]
+            p = self.activated[label] / n
+            # Smoothed proportion for the variance, so 0/n or n/n strata still count
+            p_var = (self.activated[label] + 1) / (n + 2)
+            fpc = max(0.0, 1 - n / big_n)  # Finite population correction
+            rate += weight * p
+            variance += weight ** 2 * p_var * (1 - p_var) / n * fpc
+        half_width = NormalDist().inv_cdf((1 + confidence) / 2) * math.sqrt(variance)
+        missing = 1 - weight_total / self.total
+        low = (1 - missing) * max(0.0, rate - half_width)
+        high = (1 - missing) * min(1.0, rate + half_width) + missing
+        return rate, low, high
+
+    def per_stratum(self):
+        return {str(label): {"population": self.population[label], "checked": self.drawn[label],
+                             "decided": self.decided[label], "activated": self.activated[label]}
+                for label in self.population}
+
+
+def stratum_labels(df, items, strata):
+    """One label per (index, column, key) work item."""
+    labels = []
+    for index, column, _ in items:
+        parts = [column if name == KEY_COLUMN_STRATUM else
+                 (str(df.at[index, name]) if name in df.columns else "-") for name in strata]
+        labels.append(" / ".join(parts))
+    return labels
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Steam Keys Checker - sampling audit")
+    parser.add_argument("path", help="Key sheet (CSV / Parquet / Feather)")
+    parser.add_argument("--strata", nargs="+", default=DEFAULT_STRATA,
+                        help=f"Columns to stratify by (e.g. type lang medium, or '{KEY_COLUMN_STRATUM}')")
+    parser.add_argument("--margin", type=float, default=MARGIN, help="Target half-width of the interval")
+    parser.add_argument("--confidence", type=float, default=CONFIDENCE)
+    parser.add_argument("--max-sample", type=int, default=MAX_SAMPLE)
+    parser.add_argument("--seed", type=int, help="Random seed, for a reproducible sample")
+    args = parser.parse_args()
+
+    logger = setup_logging()
+    print("🚀 Steam Keys Checker - sampling audit")
+    print("=" * 50)
+
+    sheet = CampaignFile(args.path, mapping_for(args.path, {}))
+    items = sheet.work_items()
+    if not items:
+        print("ℹ️  No key to sample")
+        return
+    sampler = StratifiedSampler(items, stratum_labels(sheet.df, items, args.strata), args.seed)
+    print(f"📄 {sheet.name}: {sampler.total} keys in {len(sampler.population)} strata ({', '.join(args.strata)})")
+    print(f"🎯 Target: ±{args.margin:.0%} at {args.confidence:.0%} confidence, at most {args.max_sample} checks")
+
+    run_id = new_run_id()
+    history = StatusHistory()
+    browser = supervised_browser()
+    estimate = None
+    checked = 0
+    try:
+        browser.driver.get(STEAMWORKS_URL)
+        print("\n🌐 Browser opened. Please log in to Steamworks...")
+        input("⏸️  Once logged in, press Enter to start the audit...")
+        browser.save_login()
+
+        while checked < args.max_sample:
+            drawn = sampler.draw()
+            if drawn is None:
+                print("\nℹ️  Every key has been sampled")
+                break
+            label, (index, column, steam_key) = drawn
+            status, _ = split_status(browser.check(check_steam_key, steam_key))
+            history.record(steam_key, status, run_id)
+            sampler.record(label, status)
+            checked += 1
+
+            estimate = sampler.estimate(args.confidence)
+            if estimate:
+                rate, low, high = estimate
+                print(f"[{checked}] {label}: {status} | activation rate {rate:.1%} [{low:.1%} - {high:.1%}]")
+                if (sampler.sample_size() >= MIN_SAMPLE and sampler.represented()
+                        and (high - low) / 2 <= args.margin):
+                    print("\n✅ Interval narrow enough, stopping")
+                    break
+            time.sleep(random.uniform(MIN_DELAY, MAX_DELAY))
+
+    except KeyboardInterrupt:
+        print("\n⏹️  Audit interrupted by user")
+
+    finally:
+        browser.quit()
+        history.close()
+
+    if not estimate:
+        print("❌ No definitive answer collected, no estimate")
+        return
+    rate, low, high = estimate
+    report = {
+        "source": args.path,
+        "run_id": run_id,
+        "strata": args.strata,
+        "confidence": args.confidence,
+        "checked": checked,
+        "decided": sampler.sample_size(),
+        "population": sampler.total,
+        "activation_rate": rate,
+        "interval": [low, high],
+        "unrepresented_weight": sampler.unrepresented_weight(),
+        "per_stratum": sampler.per_stratum(),
+    }
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    report_path = os.path.join(OUTPUT_DIR, f"audit_{run_id}.json")
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+    print(f"\n📊 Estimated activation rate: {rate:.1%} "
+          f"({args.confidence:.0%} CI {low:.1%} - {high:.1%}) from {checked} checks out of {sampler.total} keys")
+    print(f"💾 Report saved in: {report_path}")
+    logger.info(f"Audit {run_id}: {rate:.3f} [{low:.3f}, {high:.3f}] after {checked} checks")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Steam Keys Checker - Priority scheduler
+Order the work queue by a scoring function over row metadata, and stop a
+run once its request budget is spent.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+# Row metadata used by the default score - CUSTOMIZE THESE FOR YOUR CSV
+SENT_STATUS_COLUMN = "status"
+SENT_STATUS_VALUE = "Distributed"
+CREATION_DATE_COLUMN = "date creation"
+FOLLOWERS_COLUMN = "nb_followers"
+RECENT_DAYS = 90  # Keys created within this many days get a recency bonus
+
+
+def default_score(df):
+    """
+    Score every row (higher = checked first), vectorized over the sheet.
+
+    Favours keys that were actually sent, were created recently and went to
+    creators with a large audience: those are the most likely to change.
+    """
+    score = pd.Series(0.0, index=df.index)
+
+    if SENT_STATUS_COLUMN in df.columns:
+        sent = df[SENT_STATUS_COLUMN].astype(str).str.strip().str.lower() == SENT_STATUS_VALUE.lower()
+        score += sent * 3.0
+
+    if CREATION_DATE_COLUMN in df.columns:
+        created = pd.to_datetime(df[CREATION_DATE_COLUMN], dayfirst=True, errors="coerce")
+        age_days = (pd.Timestamp.now() - created).dt.days
+        recency = (1 - age_days / RECENT_DAYS).clip(lower=0, upper=1)
+        score += recency.fillna(0) * 2.0
+
+    if FOLLOWERS_COLUMN in df.columns:
+        followers = pd.to_numeric(df[FOLLOWERS_COLUMN], errors="coerce").clip(lower=0).fillna(0)
+        score += np.log10(followers + 1)
+
+    return score
+
+
+# Named scoring functions; any callable taking the DataFrame and returning a
+# Series of scores indexed like it can be passed instead.
+SCORERS = {
+    "default": default_score,
+}
+
+
+def prioritize(keys_to_verify, df, scorer="default"):
+    """
+    Reorder (index, column, key) work items by descending row score.
+
+    `scorer` is a SCORERS name, a callable, or None to keep the CSV order.
+    Ties keep their original order.
+    """
+    if scorer is None or not keys_to_verify:
+        return list(keys_to_verify)
+    if isinstance(scorer, str):
+        scorer = SCORERS[scorer]
+    scores = scorer(df)
+    return sorted(keys_to_verify, key=lambda item: -scores.get(item[0], 0.0))
+
+
+class RunBudget:
+    """Stop a run after N checks or T minutes, whichever comes first."""
+
+    def __init__(self, max_checks=None, max_minutes=None):
+        self.max_checks = max_checks
+        self.max_minutes = max_minutes
+        self.started_at = time.monotonic()
+
+    def exhausted(self, checked_count):
+        if self.max_checks is not None and checked_count >= self.max_checks:
+            return True
+        if self.max_minutes is not None and time.monotonic() - self.started_at >= self.max_minutes * 60:
+            return True
+        return False
+
+    def describe(self):
+        limits = []
+        if self.max_checks is not None:
+            limits.append(f"{self.max_checks} checks")
+        if self.max_minutes is not None:
+            limits.append(f"{self.max_minutes} minutes")
+        return " / ".join(limits) if limits else "unlimited"
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Steam Keys Checker - Row selection rules
+Declarative column predicates, combined with all/any/not, compiled once
+into a function returning a vectorized boolean mask over the sheet. Rows
+outside the mask never reach the work list (nor the network).
+
+Rules are plain JSON:
+    {"all": [
+        {"column": "to check", "truthy": true},
+        {"column": "status", "eq": "Distributed"},
+        {"column": "date creation", "newer_than_days": 90},
+        {"column": "email", "not_empty": true},
+        {"any": [
+            {"column": "lang", "in": ["english", "french"]},
+            {"column": "nb_followers", "gte": 1000}
+        ]},
+        {"not": {"column": "user name", "matches": "^test"}}
+    ]}
+
+Usage:
+    python selection_rules.py rules.json data/steam-keys.csv   # How many rows each rule keeps
+"""
+
+import argparse
+import json
+
+import pandas as pd
+
+TRUE_VALUES = ["true", "1", "yes", "oui"]
+
+
+def _raw_text(series):
+    """Cell values as str; missing values are the empty string, not "nan"."""
+    return series.astype(object).where(series.notna(), "").astype(str)
+
+
+def _text(series):
+    return _raw_text(series).str.strip().str.lower()
+
+
+def _numbers(series):
+    return pd.to_numeric(series, errors="coerce")
+
+
+def _age_days(series):
+    created = pd.to_datetime(series, dayfirst=True, errors="coerce")
+    return (pd.Timestamp.now() - created).dt.days
+
+
+def _truthy(series):
+    """
+    Same values as the former should_check_key: text cells in TRUE_VALUES
+    ('2' or '1.0' are not), non-zero numbers and True; missing cells are false.
+    """
+    if pd.api.types.is_bool_dtype(series) or pd.api.types.is_numeric_dtype(series):
+        return series.notna() & (series != 0)
+    values = series.astype(object)
+    is_text = values.map(lambda value: isinstance(value, str)).astype(bool)
+    numeric = pd.to_numeric(values.where(~is_text), errors="coerce")
+    return (is_text & _text(values).isin(TRUE_VALUES)) | (~is_text & numeric.notna() & (numeric != 0))
+
+
+def _empty(series):
+    return series.isna() | (series.astype(str).str.strip() == "")
+
+
+# Operator -> function(column Series, rule value) -> boolean Series
+OPERATORS = {
+    "eq": lambda s, v: _text(s) == str(v).strip().lower(),
+    "ne": lambda s, v: _text(s) != str(v).strip().lower(),
+    "in": lambda s, v: _text(s).isin([str(x).strip().lower() for x in v]),
+    "not_in": lambda s, v: ~_text(s).isin([str(x).strip().lower() for x in v]),
+    "contains": lambda s, v: _text(s).str.contains(str(v).lower(), regex=False),
+    "matches": lambda s, v: _raw_text(s).str.contains(v, regex=True),
+    "gt": lambda s, v: _numbers(s) > v,
+    "gte": lambda s, v: _numbers(s) >= v,
+    "lt": lambda s, v: _numbers(s) < v,
+    "lte": lambda s, v: _numbers(s) <= v,
+    "empty": lambda s, v: _empty(s) if v else ~_empty(s),
+    "not_empty": lambda s, v: ~_empty(s) if v else _empty(s),
+    "truthy": lambda s, v: _truthy(s) if v else ~_truthy(s),
+    "newer_than_days": lambda s, v: _age_days(s) <= v,
+    "older_than_days": lambda s, v: _age_days(s) > v,
+}
+
+
+def compile_rule(rule):
+    """
+    Compile a rule into a function df -> boolean Series.
+
+    Unknown operators raise ValueError here, before any file is read.
+    """
+    if rule is None:
+        return lambda df: pd.Series(True, index=df.index)
+    if "all" in rule or "any" in rule:
+        combine = "all" if "all" in rule else "any"
+        parts = [compile_rule(part) for part in rule[combine]]
+
+        def evaluate(df):
+            mask = pd.Series(combine == "all", index=df.index)
+            for part in parts:
+                mask = (mask & part(df)) if combine == "all" else (mask | part(df))
+            return mask
+        return evaluate
+    if "not" in rule:
+        inner = compile_rule(rule["not"])
+        return lambda df: ~inner(df)
+
+    column = rule.get("column")
+    operators = [name for name in rule if name != "column"]
+    if column is None or len(operators) != 1 or operators[0] not in OPERATORS:
+        raise ValueError(f"Invalid selection rule: {rule}")
+    operator, value = operators[0], rule[operators[0]]
+    predicate = OPERATORS[operator]
+
+    def evaluate(df):
+        if column not in df.columns:
+            raise ValueError(f"Selection rule column not found: '{column}'")
+        return predicate(df[column], value).fillna(False).astype(bool)
+    return evaluate
+
+
+def rule_columns(rule):
+    """Every column a rule reads, in order of appearance."""
+    if rule is None:
+        return []
+    if "all" in rule or "any" in rule:
+        return [column for part in rule["all" if "all" in rule else "any"] for column in rule_columns(part)]
+    if "not" in rule:
+        return rule_columns(rule["not"])
+    return [rule["column"]] if "column" in rule else []
+
+
+def check_rule(rule, df):
+    """
+    Raise ValueError, naming the rule, if it is invalid or reads a column
+    missing from `df` (the historical "to check" rule may be absent).
+    """
+    compile_rule(rule)
+    if rule and set(rule) == {"column", "truthy"}:
+        return
+    missing = [column for column in dict.fromkeys(rule_columns(rule)) if column not in df.columns]
+    if missing:
+        raise ValueError(f"selection rule {json.dumps(rule, ensure_ascii=False)} reads missing column(s): "
+                         + ", ".join(f"'{column}'" for column in missing))
+
+
+def load_rules(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def to_check_rule(column):
+    """The historical selection: a single "to check" column, ignored when absent."""
+    return {"column": column, "truthy": True}
+
+
+def selection_mask(df, rule):
+    """Mask of the selectable rows; a `truthy` rule on a missing column selects everything."""
+    if rule and set(rule) == {"column", "truthy"} and rule["column"] not in df.columns:
+        return pd.Series(True, index=df.index)
+    return compile_rule(rule)(df)
+
+
+def select_keys(df, key_columns, rule):
+    """
+    Work items (index, column, key) for the unchecked keys of the selected rows.
+
+    The rule is evaluated once over the whole sheet; only the matching keys
+    are materialized.
+    """
+    selected = selection_mask(df, rule)
+    items = []
+    for column in key_columns:
+        keys = df[column]
+        mask = selected & keys.notna() & (keys.astype(str).str.strip() != "") & df[f"{column}_status"].isna()
+        items.extend((index, column, key) for index, key in keys[mask].items())
+    return items
+
+
+def main():
+    from results_io import load_keys_file
+
+    parser = argparse.ArgumentParser(description="Steam Keys Checker - row selection rules")
+    parser.add_argument("rules", help="JSON rules file")
+    parser.add_argument("path", help="Key sheet to evaluate the rules on")
+    args = parser.parse_args()
+
+    rule = load_rules(args.rules)
+    df = load_keys_file(args.path)
+    parts = rule.get("all") or rule.get("any") or [rule]
+    for part in parts:
+        print(f"  {compile_rule(part)(df).sum():>6} rows  {json.dumps(part, ensure_ascii=False)}")
+    print(f"\n✅ {selection_mask(df, rule).sum()} / {len(df)} rows selected")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Steam Keys Checker - Status classifier
+Classify a querycdkey result page from its HTML, whatever the language of
+the Steamworks account. Only the visible table cells are read, like the
+Selenium lookups this replaced: a colored status span first (the colors do
+not depend on the language), then the per-language markers of
+LOCALE_MARKERS in the cell texts. A page without a result cell (login page,
+key form, error page) is STATUS_NOT_FOUND.
+
+The language is read from <html lang> once per browser session; for a
+language missing from the table, the markers of every language are tried.
+Same table as chrome-extension/status-classifier.js.
+
+Usage:
+    python status_classifier.py page.html [page2.html ...]   # Classify saved result pages
+"""
+
+import argparse
+import html
+import re
+from urllib.parse import urlparse
+
+from status_model import ACTIVATED, INVALID, NOT_ACTIVATED, OWNERSHIP_ISSUE, STATUS_NOT_FOUND, UNKNOWN_STATUS
+
+ACTIVATED_COLORS = ("#67c1f5", "rgb(103, 193, 245)")
+NOT_ACTIVATED_COLORS = ("#e24044", "rgb(226, 64, 68)")
+
+# Lowercase substrings. "not_activated" is always tested before "activated",
+# which it usually contains. French is the reference UI; colors remain the
+# primary signal for the other languages.
+LOCALE_MARKERS = {
+    "fr": {
+        "not_activated": ["non activée"],
+        "activated": ["activée"],
+        "invalid": ["invalide"],
+        "not_found": ["introuvable"],
+        "ownership_header": ["détails de la plage de clés cd"],
+    },
+    "en": {
+        "not_activated": ["not activated"],
+        "activated": ["activated"],
+        "invalid": ["invalid"],
+        "not_found": ["not found"],
+        "ownership_header": ["cd key range details", "details of cd key range"],
+    },
+    "de": {
+        "not_activated": ["nicht aktiviert"],
+        "activated": ["aktiviert"],
+        "invalid": ["ungültig"],
+        "not_found": ["nicht gefunden"],
+        "ownership_header": ["details zum cd-key-bereich"],
+    },
+    "es": {
+        "not_activated": ["no activada", "sin activar"],
+        "activated": ["activada"],
+        "invalid": ["no válida", "inválida"],
+        "not_found": ["no encontrada"],
+        "ownership_header": ["detalles del rango de claves"],
+    },
+    "it": {
+        "not_activated": ["non attivata"],
+        "activated": ["attivata"],
+        "invalid": ["non valida"],
+        "not_found": ["non trovata"],
+        "ownership_header": ["dettagli dell'intervallo di chiavi"],
+    },
+    "pt": {
+        "not_activated": ["não ativada"],
+        "activated": ["ativada"],
+        "invalid": ["inválida"],
+        "not_found": ["não encontrada"],
+        "ownership_header": ["detalhes do intervalo de chaves"],
+    },
+    "ru": {
+        "not_activated": ["не активирован"],
+        "activated": ["активирован"],
+        "invalid": ["недействител"],
+        "not_found": ["не найден"],
+        "ownership_header": ["сведения о диапазоне"],
+    },
+}
+
+# Union of every language, for pages whose language is unknown
+ALL_MARKERS = {kind: [marker for markers in LOCALE_MARKERS.values() for marker in markers[kind]]
+               for kind in LOCALE_MARKERS["fr"]}
+
+RESULT_PATH = "/querycdkey/cdkey"  # Where the key form posts (GET) and where its result is shown
+
+HTML_LANG_RE = re.compile(r"""<html\b[^>]*?\blang\s*=\s*["']?([a-z]{2,3})""", re.I)
+SPAN_RE = re.compile(r"<span\b([^>]*)>(.*?)</span>", re.I | re.S)
+STYLE_RE = re.compile(r"""\bstyle\s*=\s*("([^"]*)"|'([^']*)')""", re.I)
+H2_RE = re.compile(r"<h2\b[^>]*>(.*?)</h2>", re.I | re.S)
+CELL_RE = re.compile(r"<td\b[^>]*>(.*?)</td>", re.I | re.S)
+# Never displayed: their text must not match a marker
+HIDDEN_RE = re.compile(r"<head\b.*?</head>|<script\b.*?</script>|<style\b.*?</style>|<!--.*?-->", re.I | re.S)
+TAG_RE = re.compile(r"<[^>]*>")
+
+# Browser session id -> detected language (None: unknown, try every language)
+_session_locales = {}
+
+
+def detect_locale(page):
+    """Language of a Steamworks page from <html lang="..">, if it is in LOCALE_MARKERS."""
+    match = HTML_LANG_RE.search(page)
+    locale = match.group(1).lower() if match else None
+    return locale if locale in LOCALE_MARKERS else None
+
+
+def markers_for(locale):
+    return LOCALE_MARKERS.get(locale, ALL_MARKERS)
+
+
+def fragment_text(fragment):
+    return html.unescape(TAG_RE.sub("", fragment)).strip().lower()
+
+
+def contains_any(text, needles):
+    return any(needle in text for needle in needles)
+
+
+def is_ownership_issue(page, headers):
+    """Empty data row in the table after the key range details header."""
+    for match in H2_RE.finditer(page):
+        if not contains_any(fragment_text(match.group(1)), headers):
+            continue
+        after = page[match.end():]
+        table_start = re.search(r"<table\b", after, re.I)
+        if not table_start:
+            return False
+        table_end = after.find("</table", table_start.start())
+        table = after[table_start.start():table_end if table_end != -1 else None]
+        rows = re.split(r"<tr\b", table, flags=re.I)[1:]
+        if len(rows) < 2:
+            return True
+        cells = re.split(r"<td\b", rows[1], flags=re.I)[1:]
+        return all(fragment_text(re.sub(r"^[^>]*>", "", cell)) == "" for cell in cells)
+    return False
+
+
+def classify_page(page, locale=None):
+    """Status of a result page, as a (status, detail) pair."""
+    markers = markers_for(locale)
+    page = HIDDEN_RE.sub("", page)
+    cells = CELL_RE.findall(page)
+
+    def not_activated():
+        return OWNERSHIP_ISSUE if is_ownership_issue(page, markers["ownership_header"]) else NOT_ACTIVATED
+
+    # 1) Colored status span in a cell: color first, then the span text
+    for match in (span for cell in cells for span in SPAN_RE.finditer(cell)):
+        style_match = STYLE_RE.search(match.group(1))
+        if not style_match:
+            continue
+        style = (style_match.group(2) if style_match.group(2) is not None else style_match.group(3)).lower()
+        if "color" not in style:
+            continue
+        if contains_any(style, NOT_ACTIVATED_COLORS):
+            return not_activated(), None
+        if contains_any(style, ACTIVATED_COLORS):
+            return ACTIVATED, None
+        text = fragment_text(match.group(2))
+        if contains_any(text, markers["not_activated"]):
+            return not_activated(), None
+        if contains_any(text, markers["activated"]):
+            return ACTIVATED, None
+
+    # 2) Cell texts, first matching cell wins
+    for text in map(fragment_text, cells):
+        if contains_any(text, markers["not_activated"]):
+            return not_activated(), None
+        if contains_any(text, markers["activated"]):
+            return ACTIVATED, None
+        if contains_any(text, markers["invalid"]):
+            return INVALID, None
+        if contains_any(text, markers["not_found"]):
+            return UNKNOWN_STATUS, "Key not found"
+    return STATUS_NOT_FOUND, None
+
+
+def is_result_url(url):
+    """querycdkey result URL, not a redirect (login page, Steamworks home)."""
+    return urlparse(url or "").path.rstrip("/").endswith(RESULT_PATH)
+
+
+def classify_driver_page(driver, result_only=False):
+    """
+    Classify the page open in a Selenium driver with a single WebDriver call.
+
+    With `result_only`, a page that is not a querycdkey result URL is
+    STATUS_NOT_FOUND without being read (one more WebDriver call). The
+    language is detected on the first page of each browser session.
+    """
+    if result_only and not is_result_url(driver.current_url):
+        return STATUS_NOT_FOUND, None
+    page = driver.page_source
+    session = getattr(driver, "session_id", None)
+    if session not in _session_locales:
+        _session_locales[session] = detect_locale(page)
+    return classify_page(page, _session_locales[session])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Steam Keys Checker - status classifier")
+    parser.add_argument("pages", nargs="+", help="Saved querycdkey result pages (.html)")
+    args = parser.parse_args()
+
+    for path in args.pages:
+        with open(path, encoding="utf-8") as f:
+            page = f.read()
+        locale = detect_locale(page)
+        status, detail = classify_page(page, locale)
+        print(f"  {path}: {status}" + (f" ({detail})" if detail else "") + f"  [{locale or 'language unknown'}]")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Steam Keys Checker - Status history
+Persistent, indexed history of every status observation (SQLite).
+
+Usage:
+    python status_history.py key AAAAA-BBBBB-CCCCC
+    python status_history.py became AAAAA-BBBBB-CCCCC Activated
+    python status_history.py transitions --to Activated --since 2025-07-21
+    python status_history.py scan --since 2025-07-21 --until 2025-07-28 --status Activated
+    python status_history.py import output/*.csv
+"""
+
+import argparse
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime
+
+HISTORY_DB = os.path.join("output", "status_history.sqlite3")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS observations (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL,
+    status TEXT NOT NULL,
+    observed_at TEXT NOT NULL,
+    run_id TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_observations_key_time ON observations (key, observed_at);
+CREATE INDEX IF NOT EXISTS idx_observations_time ON observations (observed_at);
+CREATE INDEX IF NOT EXISTS idx_observations_status_time ON observations (status, observed_at);
+"""
+
+
+def non_key_statuses():
+    """status_model.NON_KEY_STATUSES, imported late: status_model imports pandas."""
+    from status_model import NON_KEY_STATUSES
+    return sorted(NON_KEY_STATUSES)
+
+
+def normalize_key(steam_key):
+    return str(steam_key).strip().upper()
+
+
+def new_run_id():
+    """Identify a run by its start time."""
+    return datetime.now().strftime('%Y%m%d_%H%M%S')
+
+
+def now_iso():
+    return datetime.now().isoformat(timespec='seconds')
+
+
+class StatusHistory:
+    """Thin wrapper around the SQLite history database (safe to share between threads)."""
+
+    def __init__(self, path=HISTORY_DB):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.lock = threading.RLock()
+        self.conn.executescript(SCHEMA)
+
+    def query(self, sql, params=()):
+        with self.lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def record(self, steam_key, status, run_id, observed_at=None):
+        """Store one status observation produced by check_steam_key."""
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT INTO observations (key, status, observed_at, run_id) VALUES (?, ?, ?, ?)",
+                (normalize_key(steam_key), status, observed_at or now_iso(), run_id),
+            )
+
+    def record_many(self, observations):
+        """Bulk insert (key, status, observed_at, run_id) tuples."""
+        with self.lock, self.conn:
+            self.conn.executemany(
+                "INSERT INTO observations (key, status, observed_at, run_id) VALUES (?, ?, ?, ?)",
+                ((normalize_key(k), s, t, r) for k, s, t, r in observations),
+            )
+
+    # --- Queries ---
+
+    def key_history(self, steam_key):
+        """All observations of a key, oldest first."""
+        return self.query(
+            "SELECT key, status, observed_at, run_id FROM observations "
+            "WHERE key = ? ORDER BY observed_at, id",
+            (normalize_key(steam_key),),
+        )
+
+    def latest_status(self, steam_key):
+        rows = self.query(
+            "SELECT status, observed_at FROM observations "
+            "WHERE key = ? ORDER BY observed_at DESC, id DESC LIMIT 1",
+            (normalize_key(steam_key),),
+        )
+        return rows[0] if rows else None
+
+    def first_seen(self, steam_key, status):
+        """When a key was first observed with a given status ("when did X become Activated?")."""
+        rows = self.query(
+            "SELECT MIN(observed_at) AS observed_at FROM observations WHERE key = ? AND status = ?",
+            (normalize_key(steam_key), status),
+        )
+        return rows[0]["observed_at"] if rows else None
+
+    def transitions(self, since=None, until=None, to_status=None, steam_key=None):
+        """
+        Status changes between two consecutive observations of the same key.
+
+        Error/Stopped observations are ignored so a transient failure never
+        shows up as a change.
+        """
+        ignored = non_key_statuses()
+        conditions = [f"status NOT IN ({', '.join('?' * len(ignored))})"]
+        params = list(ignored)
+        if steam_key:
+            conditions.append("key = ?")
+            params.append(normalize_key(steam_key))
+        query = f"""
+            SELECT key, previous_status, status, observed_at, run_id FROM (
+                SELECT key, status, observed_at, run_id,
+                       LAG(status) OVER (PARTITION BY key ORDER BY observed_at, id) AS previous_status
+                FROM observations
+                WHERE {' AND '.join(conditions)}
+            )
+            WHERE (previous_status IS NULL OR previous_status != status)
+        """
+        if since:
+            query += " AND observed_at >= ?"
+            params.append(since)
+        if until:
+            query += " AND observed_at < ?"
+            params.append(until)
+        if to_status:
+            query += " AND status = ?"
+            params.append(to_status)
+        query += " ORDER BY observed_at"
+        return self.query(query, params)
+
+    def scan(self, since=None, until=None, status=None):
+        """Observations in a time window, optionally for a single status."""
+        query = "SELECT key, status, observed_at, run_id FROM observations WHERE 1 = 1"
+        params = []
+        if status:
+            query += " AND status = ?"
+            params.append(status)
+        if since:
+            query += " AND observed_at >= ?"
+            params.append(since)
+        if until:
+            query += " AND observed_at < ?"
+            params.append(until)
+        query += " ORDER BY observed_at"
+        return self.query(query, params)
+
+    def streaks(self, status, ignored=None):
+        """
+        Keys whose latest status is `status`, with when that streak started.
+
+        Returns rows of (key, last_observed_at, streak_started_at); `ignored`
+        observations (default: NON_KEY_STATUSES, i.e. Error and Stopped)
+        neither end nor extend a streak.
+        """
+        ignored = non_key_statuses() if ignored is None else sorted(ignored)
+        return self.query(
+            f"""
+            WITH valid AS (
+                SELECT id, key, status, observed_at FROM observations
+                WHERE status NOT IN ({", ".join("?" * len(ignored))})
+            ),
+            ranked AS (
+                SELECT key, status, observed_at,
+                       ROW_NUMBER() OVER (PARTITION BY key ORDER BY observed_at DESC, id DESC) AS rn
+                FROM valid
+            ),
+            latest AS (
+                SELECT key, observed_at FROM ranked WHERE rn = 1 AND status = ?
+            ),
+            breaks AS (
+                SELECT v.key, MAX(v.observed_at) AS last_other
+                FROM valid v JOIN latest l ON v.key = l.key
+                WHERE v.status != ?
+                GROUP BY v.key
+            )
+            SELECT l.key, l.observed_at AS last_observed_at,
+                   (SELECT MIN(v.observed_at) FROM valid v
+                    WHERE v.key = l.key AND v.status = ? AND v.observed_at > COALESCE(b.last_other, '')
+                   ) AS streak_started_at
+            FROM latest l LEFT JOIN breaks b ON b.key = l.key
+            """,
+            (*ignored, status, status, status),
+        )
+
+    def import_results_file(self, path):
+        """
+        Backfill the history from a previous steam_keys_with_status_*.csv.
+
+        The observation time is taken from the file name timestamp, or the
+        file modification time when the name has none. Observations already
+        in the history (same key, status and time) are skipped, so importing
+        a file twice adds nothing; returns the number of rows added.
+        """
+        from results_io import load_keys_file, status_columns
+
+        match = re.search(r"(\d{8}_\d{6})", os.path.basename(path))
+        if match:
+            run_id = match.group(1)
+            observed_at = datetime.strptime(run_id, '%Y%m%d_%H%M%S').isoformat(timespec='seconds')
+        else:
+            observed_at = datetime.fromtimestamp(os.path.getmtime(path)).isoformat(timespec='seconds')
+            run_id = os.path.basename(path)
+
+        df = load_keys_file(path)
+        seen = {(row["key"], row["status"]) for row in self.query(
+            "SELECT key, status FROM observations WHERE observed_at = ?", (observed_at,))}
+        observations = []
+        for status_column in status_columns(df):
+            key_column = status_column[:-len("_status")]
+            if key_column not in df.columns:
+                continue
+            pairs = df[[key_column, status_column]].dropna()
+            for key, status in pairs.itertuples(index=False, name=None):
+                if (normalize_key(key), status) not in seen:
+                    seen.add((normalize_key(key), status))
+                    observations.append((key, status, observed_at, run_id))
+        self.record_many(observations)
+        return len(observations)
+
+
+def print_rows(rows, columns):
+    if not rows:
+        print("ℹ️  No matching observation")
+        return
+    for row in rows:
+        print("  " + " | ".join(str(row[col]) if row[col] is not None else "-" for col in columns))
+    print(f"\n{len(rows)} row(s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Steam Keys Checker - status history")
+    parser.add_argument("--db", default=HISTORY_DB, help="History database path")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    key_parser = subparsers.add_parser("key", help="Full history of a key")
+    key_parser.add_argument("key")
+
+    became_parser = subparsers.add_parser("became", help="When a key first had a status")
+    became_parser.add_argument("key")
+    became_parser.add_argument("status")
+
+    transitions_parser = subparsers.add_parser("transitions", help="Status changes in a time window")
+    transitions_parser.add_argument("--since")
+    transitions_parser.add_argument("--until")
+    transitions_parser.add_argument("--to", dest="to_status")
+    transitions_parser.add_argument("--key")
+
+    scan_parser = subparsers.add_parser("scan", help="Observations in a time window")
+    scan_parser.add_argument("--since")
+    scan_parser.add_argument("--until")
+    scan_parser.add_argument("--status")
+
+    import_parser = subparsers.add_parser("import", help="Backfill from previous result files")
+    import_parser.add_argument("files", nargs="+")
+
+    args = parser.parse_args()
+
+    with StatusHistory(args.db) as history:
+        if args.command == "key":
+            print_rows(history.key_history(args.key), ["observed_at", "status", "run_id"])
+        elif args.command == "became":
+            observed_at = history.first_seen(args.key, args.status)
+            if observed_at:
+                print(f"{normalize_key(args.key)} first seen as '{args.status}' at {observed_at}")
+            else:
+                print(f"ℹ️  {normalize_key(args.key)} never observed as '{args.status}'")
+        elif args.command == "transitions":
+            rows = history.transitions(args.since, args.until, args.to_status, args.key)
+            print_rows(rows, ["observed_at", "key", "previous_status", "status"])
+        elif args.command == "scan":
+            print_rows(history.scan(args.since, args.until, args.status), ["observed_at", "key", "status", "run_id"])
+        elif args.command == "import":
+            for path in args.files:
+                count = history.import_results_file(path)
+                print(f"✅ {path}: {count} observations imported")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Steam Keys Checker - Status model
+A fixed set of statuses stored as a pandas Categorical, with the free-form
+part of errors ("Error: ...", "Unknown status: ...") kept in a separate
+`<key column>_status_detail` column.
+"""
+
+import pandas as pd
+
+ACTIVATED = "Activated"
+NOT_ACTIVATED = "Not activated"
+OWNERSHIP_ISSUE = "Ownership issue"
+INVALID = "Invalid"
+INVALID_FORMAT = "Invalid format"
+STATUS_NOT_FOUND = "Status not found"
+UNKNOWN_STATUS = "Unknown status"
+ERROR = "Error"
+STOPPED = "Stopped"
+
+STATUSES = [ACTIVATED, NOT_ACTIVATED, OWNERSHIP_ISSUE, INVALID, INVALID_FORMAT,
+            STATUS_NOT_FOUND, UNKNOWN_STATUS, ERROR, STOPPED]
+STATUS_DTYPE = pd.CategoricalDtype(STATUSES)
+
+# Statuses that describe the checker rather than the key
+NON_KEY_STATUSES = {ERROR, STOPPED}
+
+STATUS_SUFFIX = "_status"
+DETAIL_SUFFIX = "_status_detail"
+
+
+def detail_column(status_column):
+    """`key_1_status` -> `key_1_status_detail`."""
+    return status_column[:-len(STATUS_SUFFIX)] + DETAIL_SUFFIX
+
+
+def split_status(raw_status):
+    """
+    Split a status string returned by check_steam_key into (status, detail).
+
+    "Error: cdkey field not found" -> ("Error", "cdkey field not found");
+    anything outside STATUSES becomes "Unknown status" with the text as detail.
+    """
+    if raw_status is None or (not isinstance(raw_status, str) and pd.isna(raw_status)):
+        return None, None
+    raw_status = str(raw_status).strip()
+    if raw_status in STATUSES:
+        return raw_status, None
+    for status in (ERROR, UNKNOWN_STATUS):
+        if raw_status.startswith(status):
+            detail = raw_status[len(status):].lstrip(" :")
+            return status, detail or None
+    return UNKNOWN_STATUS, raw_status
+
+
+def join_status(status, detail=None):
+    """Inverse of split_status: ("Unknown status", "Key not found") -> "Unknown status: Key not found"."""
+    return f"{status}: {detail}" if detail else status
+
+
+def normalize_status_columns(df):
+    """
+    Convert every `_status` column to STATUS_DTYPE in place.
+
+    Legacy free-form values are split once per distinct value; their detail
+    goes to the matching `_status_detail` column (created when needed).
+    """
+    for column in [col for col in df.columns if str(col).endswith(STATUS_SUFFIX)]:
+        values = df[column]
+        if values.dtype == STATUS_DTYPE:
+            continue
+        distinct = values.dropna().unique()
+        split = {value: split_status(value) for value in distinct}
+        details = {value: detail for value, (_, detail) in split.items() if detail}
+        if details:
+            detail_values = values.map(details)
+            target = detail_column(column)
+            if target in df.columns:
+                df[target] = detail_values.where(detail_values.notna(), df[target])
+            else:
+                df[target] = detail_values
+        df[column] = values.map({value: status for value, (status, _) in split.items()}).astype(STATUS_DTYPE)
+    return df
+
+
+def write_status(df, index, status_column, status, detail=None):
+    """Store one (status, detail) pair in its cells and return the previous status."""
+    old_status = df.loc[index, status_column]
+    df.loc[index, status_column] = status
+    target = detail_column(status_column)
+    if detail is not None or target in df.columns:
+        if target not in df.columns:
+            df[target] = None
+        df.loc[index, target] = detail
+    return old_status
@@ -2,29 +2,83 @@
 """
 Steam Keys Checker - Application Desktop
 Interface graphique moderne pour la vérification des clés Steam via Steamworks.
+
+La fenêtre s'affiche avant le chargement de pandas / selenium, qui sont
+importés en arrière-plan. `--startup-profile` affiche où passe le temps
+de démarrage.
 """
 
+import time
+
+STARTUP_T0 = time.perf_counter()
+
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
-import pandas as pd
+import sys
 import threading
-import time
 import os
 import random
 import logging
 import re
+import importlib
+import queue
 from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
+from status_history import StatusHistory, new_run_id
+from run_logging import KEY_LOGGER, start_logging
+
+# Modules lourds, importés en arrière-plan après l'affichage de la fenêtre
+HEAVY_MODULES = [
+    "pandas",
+    "selenium.webdriver",
+    "selenium.webdriver.support.ui",
+    "selenium.webdriver.support.expected_conditions",
+    "webdriver_manager.chrome",
+    "results_io",
+    "run_stats",
+    "scheduler",
+    "key_codec",
+    "selection_rules",
+    "status_classifier",
+]
+
+LOG_REFRESH_MS = 100  # Intervalle de vidage de la file des messages vers le journal
+
+# Mêmes formats que results_io.FORMAT_EXTENSIONS (sans importer pandas au démarrage)
+OUTPUT_FORMATS = ["csv", "parquet", "feather"]
+
+
+class StartupProfiler:
+    """Mesure les étapes du démarrage (mode --startup-profile)."""
+
+    def __init__(self, enabled=False, ready_file=None):
+        self.enabled = enabled
+        self.ready_file = ready_file  # --startup-bench: signale la fenêtre prête puis quitte
+        self.marks = []
+
+    def mark(self, label):
+        self.marks.append((label, time.perf_counter() - STARTUP_T0))
+
+    def report(self):
+        if not self.enabled:
+            return
+        print("\n⏱️  Profil de démarrage (depuis le lancement du processus):")
+        for label, elapsed in self.marks:
+            print(f"   {elapsed * 1000:8.1f} ms  {label}")
+        print("   Détail par module : python -X importtime steam_keys_gui.py")
+
+
+def load_heavy_modules(profiler=None):
+    """Importe pandas / selenium / webdriver_manager (une seule fois)."""
+    for name in HEAVY_MODULES:
+        started = time.perf_counter()
+        importlib.import_module(name)
+        if profiler:
+            profiler.mark(f"import {name} ({(time.perf_counter() - started) * 1000:.0f} ms)")
 
 class SteamKeysCheckerApp:
-    def __init__(self, root):
+    def __init__(self, root, profiler=None):
         self.root = root
+        self.profiler = profiler or StartupProfiler()
         self.root.title("🔑 Steam Keys Status Checker")
         self.root.geometry("800x600")
         self.root.configure(bg='#f0f0f0')
@@ -33,33 +87,143 @@ class SteamKeysCheckerApp:
         self.STEAMWORKS_URL = "https://partner.steamgames.com/querycdkey/"
         self.MIN_DELAY = 1
         self.MAX_DELAY = 10
+        self.NAVIGATION_MODE = "url"  # "url": ouvrir directement querycdkey/cdkey?cdkey=<clé> ; "form": saisir la clé dans le formulaire
+        self.METRICS_PORT = None  # Métriques live sur http://127.0.0.1:<port>/metrics (Prometheus), None = désactivé
+        self.METRICS_FILE = None  # Fichier JSON de métriques réécrit régulièrement, None = désactivé
+        self.SELECTION_RULES = None  # Fichier JSON de règles de sélection des lignes (selection_rules.py), None = colonne de filtrage
+        self.ARCHIVE_PAGES = False  # Archiver les pages de résultat pour les re-analyser hors ligne (page_archive.py)
+        self.KEY_LOG_LEVEL = "INFO"  # Niveau des traces par clé dans le fichier de log ("WARNING" = erreurs seulement)
+        self.RECYCLE_BROWSER_EVERY = 500  # Redémarrer Chrome (en gardant la connexion) toutes les N clés, None = jamais
+        self.MAX_BROWSER_MB = 1500  # Redémarrer Chrome au-delà de cette mémoire, None = jamais
+        self.CHECK_TIMEOUT = 90  # Secondes avant d'abandonner une vérification bloquée et de redémarrer Chrome
+        self.PREWARM_BROWSER = True  # Ouvrir Chrome en arrière-plan dès le démarrage et le garder ouvert entre les vérifications
         
         # Variables
         self.uploaded_df = None
+        self.csv_path = None
         self.config = {
             'has_two_columns': False,
             'key1_column': 'key_1',
             'key2_column': 'key_2',
-            'filter_column': 'to check'
+            'filter_column': 'to check',
+            'output_format': 'csv',
+            'delta_output': False,
+            'prioritize': False,
+            'deduplicate_keys': False,
+            'max_checks': None,
+            'max_minutes': None,
+            'lean_browser': False
         }
         self.driver = None
+        self.browser = None  # BrowserSupervisor, gardé ouvert (et connecté) d'une vérification à l'autre
+        self.browser_lean = None  # Valeur de 'lean_browser' au lancement de Chrome
+        self.browser_lock = threading.Lock()
+        self.metrics_exporter = None
         self.is_processing = False
-        
+        self.worker = None  # Thread de la vérification en cours (ou de la dernière)
+        self.run_token = 0  # Numéro de la vérification en cours, pour ignorer la fin d'un thread périmé
+        self.closing = False
+        # --startup-bench : ni historique ni fichier de log, rien n'est écrit dans le dossier courant
+        self.history = None if self.profiler.ready_file else StatusHistory()
+        self.ui_messages = queue.Queue()  # Messages du journal, affichés par la boucle Tk
+        
+        self.setup_menu()
         self.setup_ui()
-        self.setup_logging()
+        self.profiler.mark("interface construite")
+        if not self.profiler.ready_file:
+            self.setup_logging()
+        self.root.after(LOG_REFRESH_MS, self.flush_log_messages)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
+        # Charger les modules lourds une fois la fenêtre affichée
+        self.modules_ready = threading.Event()
+        self.root.after_idle(self.start_preloading)
+    
+    def start_preloading(self):
+        """Lance l'import des modules lourds dans un thread."""
+        self.profiler.mark("fenêtre affichée")
+        if self.profiler.ready_file:
+            with open(self.profiler.ready_file, 'w') as f:
+                f.write(f"{self.profiler.marks[-1][1]:.4f}\n")
+            self.root.destroy()
+            return
+        threading.Thread(target=self.preload_modules, daemon=True).start()
+    
+    def preload_modules(self):
+        try:
+            load_heavy_modules(self.profiler)
+        except Exception as e:
+            self.logger.error(f"Erreur lors du chargement des modules: {e}")
+            return
+        finally:
+            self.modules_ready.set()
+            self.profiler.mark("modules chargés")
+            self.profiler.report()
+        
+        # Chrome démarre pendant que l'utilisateur choisit son fichier
+        if self.PREWARM_BROWSER:
+            try:
+                self.open_browser()
+                self.log_message("🌐 Chrome ouvert en arrière-plan : vous pouvez déjà vous connecter à Steamworks")
+            except Exception as e:
+                self.log_message(f"⚠️ Pré-lancement de Chrome impossible: {e}")
+    
+    def open_browser(self):
+        """Lance Chrome sur la page Steamworks, sauf s'il est déjà ouvert (pré-lancement ou vérification précédente)."""
+        # selenium est importé par preload_modules : ne pas l'importer une seconde fois en parallèle
+        self.modules_ready.wait()
+        from browser_supervisor import BrowserSupervisor
+        
+        # Le verrou fait attendre un démarrage lancé depuis l'autre thread
+        with self.browser_lock:
+            if self.closing:
+                raise RuntimeError("fenêtre en cours de fermeture")
+            if self.browser is None:
+                self.browser_lean = self.config['lean_browser']
+                browser = BrowserSupervisor(self.setup_driver, self.STEAMWORKS_URL, self.RECYCLE_BROWSER_EVERY,
+                                            self.MAX_BROWSER_MB, self.CHECK_TIMEOUT,
+                                            on_restart=self.on_browser_restart, on_login_lost=self.ask_relogin)
+                self.driver = browser.driver
+                self.browser = browser
+                self.driver.get(self.STEAMWORKS_URL)
+            return self.browser
+    
+    def on_close(self):
+        """Fermeture de la fenêtre : arrête la vérification et ferme Chrome."""
+        self.closing = True
+        self.is_processing = False
+        # Chrome en cours de démarrage (pré-lancement ou vérification) : attendre qu'il soit
+        # enregistré dans self.browser pour le fermer, sinon il resterait ouvert sans propriétaire
+        if not self.browser_lock.acquire(blocking=False):
+            self.root.withdraw()
+            self.root.after(200, self.on_close)
+            return
+        try:
+            if self.browser:
+                try:
+                    self.browser.quit()
+                except Exception:
+                    pass
+                self.browser = None
+        finally:
+            self.browser_lock.release()
+        self.root.destroy()
     
     def setup_logging(self):
-        """Configure le système de logging."""
-        log_filename = f"steam_keys_checker_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_filename, encoding='utf-8'),
-                logging.StreamHandler()
-            ]
-        )
+        """Configure le système de logging (écrit par un thread de fond, voir run_logging.py)."""
+        start_logging(key_level=self.KEY_LOG_LEVEL)
         self.logger = logging.getLogger(__name__)
+        self.key_logger = logging.getLogger(KEY_LOGGER)
+    
+    def setup_menu(self):
+        """Barre de menus (outils de diagnostic)."""
+        menubar = tk.Menu(self.root)
+        tools_menu = tk.Menu(menubar, tearoff=0)
+        self.profile_run_var = tk.BooleanVar(value=False)
+        tools_menu.add_checkbutton(label="Profiler la vérification (CPU + mémoire)",
+                                   variable=self.profile_run_var)
+        menubar.add_cascade(label="Outils", menu=tools_menu)
+        self.root.config(menu=menubar)
     
     def setup_ui(self):
         """Configure l'interface utilisateur."""
@@ -116,6 +280,42 @@ class SteamKeysCheckerApp:
         self.filter_entry.insert(0, "to check")
         self.filter_entry.grid(row=2, column=1, sticky=tk.W, pady=(10, 0))
         
+        ttk.Label(config_frame, text="Format de sortie:").grid(row=2, column=2, sticky=tk.W, padx=(0, 5), pady=(10, 0))
+        self.output_format_var = tk.StringVar(value="csv")
+        self.output_format_combo = ttk.Combobox(config_frame, textvariable=self.output_format_var,
+                                                values=OUTPUT_FORMATS, width=12, state='readonly')
+        self.output_format_combo.grid(row=2, column=3, sticky=tk.W, pady=(10, 0))
+        
+        self.delta_output_var = tk.BooleanVar()
+        ttk.Checkbutton(config_frame,
+                        text="Sauvegarder uniquement les statuts modifiés (delta)",
+                        variable=self.delta_output_var).grid(row=3, column=0, columnspan=2, sticky=tk.W, pady=(10, 0))
+        
+        self.lean_browser_var = tk.BooleanVar()
+        ttk.Checkbutton(config_frame,
+                        text="Navigateur allégé (sans images, polices ni CSS)",
+                        variable=self.lean_browser_var).grid(row=3, column=2, columnspan=2, sticky=tk.W, pady=(10, 0))
+        
+        # Ordre de vérification et budget de la session
+        self.prioritize_var = tk.BooleanVar()
+        ttk.Checkbutton(config_frame,
+                        text="Vérifier d'abord les clés prioritaires",
+                        variable=self.prioritize_var).grid(row=4, column=0, columnspan=2, sticky=tk.W, pady=(10, 0))
+        
+        self.deduplicate_var = tk.BooleanVar()
+        ttk.Checkbutton(config_frame,
+                        text="Vérifier une seule fois les clés en double",
+                        variable=self.deduplicate_var).grid(row=5, column=0, columnspan=2, sticky=tk.W, pady=(10, 0))
+        
+        budget_frame = ttk.Frame(config_frame)
+        budget_frame.grid(row=4, column=2, columnspan=2, sticky=tk.W, pady=(10, 0))
+        ttk.Label(budget_frame, text="Max clés:").grid(row=0, column=0, padx=(0, 5))
+        self.max_checks_entry = ttk.Entry(budget_frame, width=6)
+        self.max_checks_entry.grid(row=0, column=1, padx=(0, 10))
+        ttk.Label(budget_frame, text="Max minutes:").grid(row=0, column=2, padx=(0, 5))
+        self.max_minutes_entry = ttk.Entry(budget_frame, width=6)
+        self.max_minutes_entry.grid(row=0, column=3)
+        
         # Section 3: Informations CSV
         info_frame = ttk.LabelFrame(main_frame, text="📊 Informations CSV", padding="10")
         info_frame.grid(row=3, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(0, 10))
@@ -147,6 +347,11 @@ class SteamKeysCheckerApp:
         self.progress_bar = ttk.Progressbar(progress_frame, mode='determinate')
         self.progress_bar.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=(5, 0))
         
+        # Compteurs en direct (statuts, clés/min, temps restant)
+        self.stats_var = tk.StringVar(value="")
+        self.stats_label = ttk.Label(progress_frame, textvariable=self.stats_var, foreground="gray")
+        self.stats_label.grid(row=2, column=0, sticky=tk.W, pady=(5, 0))
+        
         # Section 6: Log
         log_frame = ttk.LabelFrame(main_frame, text="📝 Journal", padding="10")
         log_frame.grid(row=6, column=0, columnspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 10))
@@ -166,22 +371,38 @@ class SteamKeysCheckerApp:
         log_frame.rowconfigure(0, weight=1)
     
     def log_message(self, message):
-        """Ajoute un message au journal."""
+        """Ajoute un message au journal (depuis n'importe quel thread, sans attendre Tk)."""
         timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_text.insert(tk.END, f"[{timestamp}] {message}\n")
-        self.log_text.see(tk.END)
-        self.root.update_idletasks()
+        self.ui_messages.put(f"[{timestamp}] {message}\n")
+    
+    def flush_log_messages(self):
+        """Affiche les messages en attente en une seule insertion, depuis la boucle Tk."""
+        lines = []
+        while True:
+            try:
+                lines.append(self.ui_messages.get_nowait())
+            except queue.Empty:
+                break
+        if lines:
+            self.log_text.insert(tk.END, "".join(lines))
+            self.log_text.see(tk.END)
+        self.root.after(LOG_REFRESH_MS, self.flush_log_messages)
     
     def select_csv_file(self):
         """Sélectionne et charge un fichier CSV."""
         file_path = filedialog.askopenfilename(
             title="Sélectionner un fichier CSV",
-            filetypes=[("Fichiers CSV", "*.csv"), ("Tous les fichiers", "*.*")]
+            filetypes=[("Fichiers CSV", "*.csv"),
+                       ("Fichiers Parquet / Feather", "*.parquet *.feather *.arrow"),
+                       ("Tous les fichiers", "*.*")]
         )
         
         if file_path:
             try:
-                self.uploaded_df = pd.read_csv(file_path)
+                self.wait_for_modules()
+                from results_io import load_keys_file
+                self.uploaded_df = load_keys_file(file_path)
+                self.csv_path = file_path
                 filename = os.path.basename(file_path)
                 
                 self.file_label.config(text=f"✅ {filename} - {len(self.uploaded_df)} lignes, {len(self.uploaded_df.columns)} colonnes", 
@@ -231,41 +452,86 @@ class SteamKeysCheckerApp:
         self.config['key1_column'] = self.key1_entry.get()
         self.config['key2_column'] = self.key2_entry.get()
         self.config['filter_column'] = self.filter_entry.get()
+        self.config['output_format'] = self.output_format_var.get()
+        self.config['delta_output'] = self.delta_output_var.get()
+        self.config['prioritize'] = self.prioritize_var.get()
+        self.config['deduplicate_keys'] = self.deduplicate_var.get()
+        self.config['max_checks'] = self.parse_limit(self.max_checks_entry.get(), int)
+        self.config['max_minutes'] = self.parse_limit(self.max_minutes_entry.get(), float)
+        self.config['lean_browser'] = self.lean_browser_var.get()
+    
+    def parse_limit(self, value, cast):
+        """Convertit une limite saisie (vide = pas de limite)."""
+        value = value.strip()
+        if not value:
+            return None
+        try:
+            return cast(value)
+        except ValueError:
+            self.log_message(f"⚠️ Limite ignorée (valeur invalide): {value}")
+            return None
+    
+    def wait_for_modules(self):
+        """Attend la fin de preload_modules (pandas est nécessaire pour lire le fichier)."""
+        if not self.modules_ready.is_set():
+            self.progress_var.set("Chargement des modules...")
+            self.root.update_idletasks()
+            self.modules_ready.wait()
+            self.progress_var.set("Prêt")
     
     def start_verification(self):
         """Lance la vérification dans un thread séparé."""
         if self.uploaded_df is None:
             messagebox.showerror("Erreur", "Aucun fichier CSV chargé!")
             return
+        # La vérification précédente n'a pas fini sa clé en cours : un seul thread pilote Chrome
+        if self.worker and self.worker.is_alive():
+            self.log_message("⏳ La vérification précédente se termine, réessayez dans un instant")
+            return
         
+        self.run_token += 1
         self.is_processing = True
         self.start_button.config(state='disabled')
         self.stop_button.config(state='normal')
         
         # Lancer dans un thread pour ne pas bloquer l'interface
-        thread = threading.Thread(target=self.verification_process)
-        thread.daemon = True
-        thread.start()
+        target = self.profiled_verification if self.profile_run_var.get() else self.verification_process
+        self.worker = threading.Thread(target=target, args=(self.run_token,))
+        self.worker.daemon = True
+        self.worker.start()
+    
+    def profiled_verification(self, run_token):
+        """Vérification sous cProfile + tracemalloc, rapport dans output/."""
+        from run_profiler import RunProfiler
+        
+        with RunProfiler(label="gui") as profiler:
+            self.verification_process(run_token)
+        self.log_message(f"🔬 Rapport de profilage: {profiler.report_path}")
     
     def stop_verification(self):
         """Arrête la vérification."""
         self.log_message("🛑 Arrêt de la vérification demandé...")
+        # Chrome reste ouvert et connecté : la vérification s'arrête au prochain point de contrôle
+        # Démarrer reste désactivé jusqu'à la fin du thread (la clé en cours peut prendre jusqu'à CHECK_TIMEOUT)
         self.is_processing = False
         
-        if self.driver:
-            try:
-                self.driver.quit()
-                self.log_message("🌐 Navigateur fermé")
-            except Exception as e:
-                self.log_message(f"⚠️ Erreur lors de la fermeture du navigateur: {e}")
-        
-        self.start_button.config(state='normal')
         self.stop_button.config(state='disabled')
-        self.progress_var.set("Arrêté")
-        self.log_message("✅ Vérification arrêtée par l'utilisateur")
+        self.progress_var.set("Arrêt en cours...")
+        self.log_message("⏳ Arrêt après la clé en cours")
     
-    def verification_process(self):
-        """Processus principal de vérification."""
+    def verification_process(self, run_token):
+        """Processus principal de vérification (run_token : numéro donné par start_verification)."""
+        self.modules_ready.wait()
+        from results_io import merge_deltas, status_change
+        from run_stats import RunStats
+        from scheduler import RunBudget, prioritize
+        from key_codec import group_duplicates
+        from status_model import normalize_status_columns, split_status, write_status
+        from page_archive import PageArchive, should_archive
+        from run_metrics import MetricsExporter, RunMetrics
+        
+        checked_count = 0
+        keys_to_verify = []
         try:
             self.update_config()
             
@@ -273,7 +539,11 @@ class SteamKeysCheckerApp:
             self.progress_var.set("Préparation...")
             
             # Vérification des colonnes
-            df = self.uploaded_df.copy()
+            if self.config['delta_output']:
+                # Appliquer les deltas précédents pour ignorer les clés déjà vérifiées
+                df = merge_deltas(self.csv_path)
+            else:
+                df = self.uploaded_df.copy()
             
             if self.config['key1_column'] not in df.columns:
                 messagebox.showerror("Erreur", f"Colonne '{self.config['key1_column']}' non trouvée!")
@@ -292,8 +562,20 @@ class SteamKeysCheckerApp:
                 if key2_status_column not in df.columns:
                     df[key2_status_column] = None
             
+            normalize_status_columns(df)
+            
             # Préparer la liste des clés à vérifier
             keys_to_verify = self.prepare_keys_list(df)
+            if self.config['prioritize']:
+                keys_to_verify = prioritize(keys_to_verify, df)
+            
+            # Une clé présente dans plusieurs cellules n'est vérifiée qu'une fois (option)
+            duplicates = {}
+            if self.config['deduplicate_keys']:
+                keys_to_verify, duplicates = group_duplicates(keys_to_verify)
+            duplicate_count = sum(len(cells) for cells in duplicates.values())
+            if duplicate_count:
+                self.log_message(f"ℹ️ {duplicate_count} clés en double reprendront le statut de leur première occurrence")
             
             if len(keys_to_verify) == 0:
                 self.log_message("ℹ️ Toutes les clés ont déjà été vérifiées ou aucune clé valide trouvée")
@@ -310,56 +592,97 @@ class SteamKeysCheckerApp:
             # Configuration de la barre de progression
             self.progress_bar.config(maximum=len(keys_to_verify))
             
-            # Demander à l'utilisateur de se connecter
-            response = messagebox.askokcancel(
-                "Connexion Steamworks",
-                "Chrome va s'ouvrir pour vous connecter à Steamworks.\n\n"
-                "1. Connectez-vous à votre compte Steamworks\n"
-                "2. Cliquez OK quand vous êtes connecté\n"
-                "3. La vérification commencera automatiquement"
-            )
-            
-            if not response:
-                return
-            
-            # Initialiser le driver
+            # Réutiliser Chrome s'il est déjà ouvert (pré-lancé ou gardé depuis la vérification précédente).
+            # Le superviseur le redémarre s'il grossit, ralentit, se bloque ou plante.
             self.progress_var.set("Ouverture de Chrome...")
-            self.driver = self.setup_driver()
-            
-            # Première visite pour la connexion
-            self.driver.get(self.STEAMWORKS_URL)
-            self.log_message("🌐 Chrome ouvert. Connectez-vous à Steamworks...")
-            
-            # Attendre la confirmation de connexion
-            messagebox.showinfo(
-                "Connexion",
-                "Connectez-vous à Steamworks dans la fenêtre Chrome qui s'est ouverte, puis cliquez OK pour continuer."
-            )
+            self.open_browser()
+            self.browser.ensure_alive()
+            if self.browser_lean != self.config['lean_browser']:
+                self.browser_lean = self.config['lean_browser']
+                self.browser.restart("lean browser option changed")
+            restarts_before = self.browser.restarts
+            
+            # Demander la connexion seulement si la session n'est pas (encore) authentifiée
+            if self.browser.is_logged_in():
+                self.log_message("🌐 Chrome déjà connecté à Steamworks")
+            else:
+                self.log_message("🌐 Chrome ouvert. Connectez-vous à Steamworks...")
+                response = messagebox.askokcancel(
+                    "Connexion Steamworks",
+                    "Connectez-vous à Steamworks dans la fenêtre Chrome.\n\n"
+                    "1. Connectez-vous à votre compte Steamworks\n"
+                    "2. Cliquez OK quand vous êtes connecté\n"
+                    "3. La vérification commencera automatiquement"
+                )
+                if not response:
+                    return
+            self.browser.save_login()
             
             # Vérification des clés
             checked_count = 0
+            changes = []
+            run_id = new_run_id()
+            
+            # Compteurs incrémentaux, initialisés une seule fois avec les statuts existants
+            max_checks = self.config['max_checks']
+            stats = RunStats(min(len(keys_to_verify), max_checks or len(keys_to_verify)))
+            budget = RunBudget(max_checks, self.config['max_minutes'])
+            for status_column in (key1_status_column, f"{self.config['key2_column']}_status"):
+                if status_column in df.columns and status_column not in stats.counts:
+                    if status_column == key1_status_column or self.config['has_two_columns']:
+                        stats.seed(status_column, df[status_column])
+            
+            # Métriques live optionnelles pour la supervision (voir run_metrics.py)
+            metrics = RunMetrics(stats.total_keys)
+            self.metrics_exporter = MetricsExporter(metrics, self.METRICS_PORT, self.METRICS_FILE).start()
+            archive = PageArchive() if self.ARCHIVE_PAGES else None
             
             for index, column_name, steam_key in keys_to_verify:
                 if not self.is_processing:
                     self.log_message("🛑 Arrêt détecté dans la boucle principale")
                     break
                 
+                if budget.exhausted(checked_count):
+                    self.log_message(f"⏱️ Budget atteint après {checked_count} clés ({budget.describe()})")
+                    break
+                
                 self.progress_var.set(f"Vérification {checked_count + 1}/{len(keys_to_verify)}")
                 self.log_message(f"[{checked_count + 1}/{len(keys_to_verify)}] Vérification {column_name}: {steam_key[:10]}...")
                 
                 # Vérifier la clé
-                status = self.check_steam_key(steam_key)
+                check_started = time.monotonic()
+                metrics.start_check()
+                raw_status = self.browser.check(lambda driver, key: self.check_steam_key(key), steam_key)
+                latency = time.monotonic() - check_started
+                metrics.finish_check(split_status(raw_status)[0], latency,
+                                     queue_depth=len(keys_to_verify) - checked_count - 1)
                 
                 # Si la vérification a été arrêtée, sortir de la boucle
-                if status == "Stopped":
+                if raw_status == "Stopped":
                     self.log_message("🛑 Vérification arrêtée pendant le traitement de la clé")
                     break
                 
-                # Mettre à jour le DataFrame
-                status_column = f"{column_name}_status"
-                df.loc[index, status_column] = status
+                # Statut normalisé + détail de l'erreur dans une colonne séparée
+                status, detail = split_status(raw_status)
+                
+                # Mettre à jour le DataFrame (et les cellules contenant la même clé)
+                for cell_index, cell_column in [(index, column_name)] + duplicates.get((index, column_name), []):
+                    status_column = f"{cell_column}_status"
+                    old_status = write_status(df, cell_index, status_column, status, detail)
+                    changes.append(status_change(cell_index, status_column, old_status, status, detail,
+                                                 key=df.at[cell_index, cell_column]))
+                    if cell_index == index and cell_column == column_name:
+                        stats.record(status_column, status, latency, old_status)
+                    else:
+                        stats.recount(status_column, status, old_status)
+                self.history.record(steam_key, status, run_id)
+                if archive and should_archive(status):
+                    archive.store(steam_key, self.driver.page_source, status, run_id)
                 
-                self.log_message(f"   Statut: {status}")
+                self.log_message(f"   Statut: {raw_status}")
+                self.key_logger.info("Key %s... - Status: %s", steam_key[:10], raw_status,
+                                     extra={"status": status, "column": column_name, "latency": round(latency, 3)})
+                self.stats_var.set(stats.summary_line())
                 
                 checked_count += 1
                 self.progress_bar['value'] = checked_count
@@ -381,10 +704,13 @@ class SteamKeysCheckerApp:
                     if not self.is_processing:
                         break
             
+            if archive:
+                archive.close()
+            
             # Sauvegarder les résultats
             if checked_count > 0:
-                self.save_results(df)
-                self.display_summary(df)
+                self.save_results(df, changes)
+                self.display_summary(stats)
             
             # Message final selon le cas
             if not self.is_processing and checked_count < len(keys_to_verify):
@@ -399,16 +725,19 @@ class SteamKeysCheckerApp:
             messagebox.showerror("Erreur", f"Erreur pendant la vérification:\n{str(e)}")
         
         finally:
-            if self.driver:
-                try:
-                    self.driver.quit()
-                    self.log_message("🌐 Chrome fermé")
-                except Exception as e:
-                    self.log_message(f"⚠️ Erreur lors de la fermeture de Chrome: {e}")
+            # Chrome reste ouvert et connecté pour la prochaine vérification (fermé avec la fenêtre)
+            if self.browser and checked_count and self.browser.restarts > restarts_before:
+                self.log_message(f"♻️ Chrome redémarré {self.browser.restarts - restarts_before} fois pendant la vérification")
+            
+            if self.metrics_exporter:
+                self.metrics_exporter.stop()
+                self.metrics_exporter = None
             
-            self.is_processing = False
-            self.start_button.config(state='normal')
-            self.stop_button.config(state='disabled')
+            # Une vérification plus récente a pu démarrer entre-temps : ne pas toucher à son état
+            if run_token == self.run_token:
+                self.is_processing = False
+                self.start_button.config(state='normal')
+                self.stop_button.config(state='disabled')
             
             # Message final dans la barre de progression
             if checked_count < len(keys_to_verify):
@@ -416,8 +745,29 @@ class SteamKeysCheckerApp:
             else:
                 self.progress_var.set("Terminé")
     
+    def on_browser_restart(self, driver):
+        """Chrome a été remplacé par le superviseur (browser_supervisor.py)."""
+        self.driver = driver
+        self.log_message("♻️ Chrome redémarré, session Steamworks restaurée")
+    
+    def ask_relogin(self, driver):
+        """Les cookies n'ont pas suffi à restaurer la connexion après un redémarrage."""
+        self.driver = driver
+        messagebox.showinfo(
+            "Connexion",
+            "Chrome a été redémarré et n'est plus connecté.\n\n"
+            "Reconnectez-vous à Steamworks dans la nouvelle fenêtre, puis cliquez OK pour continuer."
+        )
+        self.browser.save_login()
+    
     def setup_driver(self):
         """Configure et initialise le driver Chrome."""
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service
+        from selenium.webdriver.chrome.options import Options
+        from webdriver_manager.chrome import ChromeDriverManager
+        from browser_profile import apply_lean_options, enable_resource_blocking, set_timeouts
+        
         chrome_options = Options()
         
         # Options pour une meilleure stabilité
@@ -427,8 +777,16 @@ class SteamKeysCheckerApp:
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
         
+        # Profil allégé : chargement "eager", ressources inutiles bloquées
+        if self.config['lean_browser']:
+            apply_lean_options(chrome_options)
+        
         service = Service(ChromeDriverManager().install())
         driver = webdriver.Chrome(service=service, options=chrome_options)
+        set_timeouts(driver)
+        if self.config['lean_browser']:
+            enable_resource_blocking(driver)
+            self.log_message("🪶 Navigateur allégé activé")
         
         # Masquer l'automatisation
         driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
@@ -437,6 +795,10 @@ class SteamKeysCheckerApp:
     
     def check_steam_key(self, steam_key):
         """Vérifie le statut d'une clé Steam."""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        
         # 1) Validation du format AVANT toute action réseau / navigateur
         def is_valid_format(k: str) -> bool:
             k = k.strip().upper()
@@ -446,11 +808,23 @@ class SteamKeysCheckerApp:
             return all(len(p) == 5 and p.isalnum() for p in parts)
 
         if not is_valid_format(steam_key):
-            self.logger.info(f"Key {steam_key[:10]}... - Invalid format")
+            self.key_logger.info("Key %s... - Invalid format", steam_key[:10], extra={"status": "Invalid format"})
             return "Invalid format"
 
         try:
             # 2) Poursuite de la vérification si le format est valide
+            if self.NAVIGATION_MODE == "url":
+                # Page de résultat ouverte directement : une navigation, sans saisie ni attente fixe
+                from urllib.parse import quote
+                self.driver.get(f"{self.STEAMWORKS_URL}cdkey?cdkey={quote(steam_key.strip())}")
+                if not self.is_processing:
+                    return "Stopped"
+                status = self.parse_status(result_only=True)
+                if status != "Status not found":
+                    return status
+                # Pas sur une page de résultat avec un statut (déconnexion, redirection, URL modifiée) : repli sur le formulaire
+                self.logger.warning("Key %s... - Result page not recognized, falling back to the form", steam_key[:10])
+            
             # Aller à la page de vérification
             self.driver.get(self.STEAMWORKS_URL)
             
@@ -552,130 +926,42 @@ class SteamKeysCheckerApp:
         except Exception as e:
             return f"Error: {str(e)}"
     
-    def parse_status(self):
-        """Analyse le statut retourné par Steamworks."""
-        status = "Status not found"
-
-        # 0) Ownership issue detection : table "Détails de la plage de clés CD" vide
-        try:
-            header_el = self.driver.find_element(By.XPATH, "//h2[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'détails de la plage de clés cd')]")
-            table_el = header_el.find_element(By.XPATH, "following-sibling::table[1]")
-            rows = table_el.find_elements(By.XPATH, './/tr')
-            if len(rows) >= 2:
-                data_cells = rows[1].find_elements(By.TAG_NAME, 'td')
-                if data_cells and all(c.text.strip() == '' for c in data_cells):
-                    return "Ownership issue"
-        except Exception:
-            pass
-        
-        try:
-            # Chercher le span avec couleur
-            status_span = self.driver.find_element(By.XPATH, "//td/span[contains(@style, 'color')]")
-            status_text = status_span.text.strip()
-            status_color = status_span.get_attribute('style')
-            
-            # Analyser la couleur
-            if ("#67c1f5" in status_color or 
-                "rgb(103, 193, 245)" in status_color or 
-                status_text.lower() == "activée"):
-                status = "Activated"
-            elif ("#e24044" in status_color or 
-                  "rgb(226, 64, 68)" in status_color or 
-                  status_text.lower() == "non activée"):
-                status = "Not activated"
-            else:
-                status = f"Unknown status: {status_text}"
-                
-        except:
-            # Méthodes alternatives de détection
-            try:
-                # Chercher par couleur exacte
-                activated_spans = self.driver.find_elements(By.XPATH, "//span[@style='color: #67c1f5']")
-                for span in activated_spans:
-                    if "activée" in span.text.lower():
-                        status = "Activated"
-                        break
-                
-                if status == "Status not found":
-                    not_activated_spans = self.driver.find_elements(By.XPATH, "//span[@style='color: #e24044']")
-                    for span in not_activated_spans:
-                        if "non activée" in span.text.lower():
-                            status = "Not activated"
-                            break
-                
-                # Recherche dans les cellules de tableau
-                if status == "Status not found":
-                    status_cells = self.driver.find_elements(By.TAG_NAME, "td")
-                    for cell in status_cells:
-                        cell_text = cell.text.strip().lower()
-                        if "non activée" in cell_text:
-                            status = "Not activated"
-                            break
-                        elif "activée" in cell_text:
-                            status = "Activated"
-                            break
-                        elif "invalid" in cell_text or "invalide" in cell_text:
-                            status = "Invalid"
-                            break
-                            
-            except Exception as inner_e:
-                status = f"Error during detection: {str(inner_e)}"
+    def parse_status(self, result_only=False):
+        """Analyse le statut retourné par Steamworks (result_only : "Status not found" hors d'une page de résultat)."""
+        from status_classifier import classify_driver_page
+        from status_model import join_status
         
-        return status
+        return join_status(*classify_driver_page(self.driver, result_only))
     
     def prepare_keys_list(self, df):
         """Prépare la liste des clés à vérifier."""
-        keys_to_verify = []
-        
-        # Clés de la première colonne
-        key1_status_column = f"{self.config['key1_column']}_status"
-        key1_to_check = df[(df[self.config['key1_column']].notna()) & 
-                          (df[self.config['key1_column']] != '') & 
-                          (df[key1_status_column].isna())]
+        from selection_rules import load_rules, select_keys, to_check_rule
         
-        for index, row in key1_to_check.iterrows():
-            if self.should_check_key(row):
-                keys_to_verify.append((index, self.config['key1_column'], row[self.config['key1_column']]))
-        
-        # Clés de la deuxième colonne si configurée
+        key_columns = [self.config['key1_column']]
         if self.config['has_two_columns'] and self.config['key2_column'] in df.columns:
-            key2_status_column = f"{self.config['key2_column']}_status"
-            if key2_status_column in df.columns:
-                key2_to_check = df[(df[self.config['key2_column']].notna()) & 
-                                  (df[self.config['key2_column']] != '') & 
-                                  (df[key2_status_column].isna())]
-                
-                for index, row in key2_to_check.iterrows():
-                    if self.should_check_key(row):
-                        keys_to_verify.append((index, self.config['key2_column'], row[self.config['key2_column']]))
+            key_columns.append(self.config['key2_column'])
         
-        return keys_to_verify
+        # Règles de sélection (fichier JSON) ou simple colonne de filtrage, évaluées en une passe vectorisée
+        if self.SELECTION_RULES:
+            rule = load_rules(self.SELECTION_RULES)
+        else:
+            rule = to_check_rule(self.config['filter_column'])
+        return select_keys(df, key_columns, rule)
     
-    def should_check_key(self, row):
-        """Détermine si une clé doit être vérifiée."""
-        if self.config['filter_column'] not in row:
-            return True
-        
-        to_check_value = row[self.config['filter_column']]
-        
-        if pd.isna(to_check_value):
-            return False
-        
-        if isinstance(to_check_value, str):
-            to_check_value = to_check_value.strip().lower()
-            return to_check_value in ['true', '1', 'yes', 'oui']
-        
-        if isinstance(to_check_value, (int, float)):
-            return bool(to_check_value)
+    def save_results(self, df, changes):
+        """Sauvegarde les résultats (CSV, Parquet, Feather ou delta)."""
+        from results_io import has_arrow, save_results as write_results, write_delta
+        
+        if self.config['delta_output']:
+            output_filename = write_delta(changes, self.csv_path)
+            self.log_message(f"💾 {len(changes)} statuts modifiés sauvegardés dans: {output_filename}")
+            self.log_message(f"   Vue complète : python results_io.py merge \"{self.csv_path}\"")
+            return
         
-        return bool(to_check_value)
-    
-    def save_results(self, df):
-        """Sauvegarde les résultats dans un fichier CSV."""
-        os.makedirs('output', exist_ok=True)
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        output_filename = f'output/steam_keys_with_status_{timestamp}.csv'
-        df.to_csv(output_filename, index=False)
+        output_format = self.config['output_format']
+        if output_format != 'csv' and not has_arrow():
+            self.log_message(f"⚠️ pyarrow non installé : sauvegarde en CSV au lieu de {output_format}")
+        output_filename = write_results(df, output_format)
         
         self.log_message(f"💾 Résultats sauvegardés dans: {output_filename}")
         
@@ -691,40 +977,30 @@ class SteamKeysCheckerApp:
             else:  # Linux
                 subprocess.run(["xdg-open", os.path.dirname(output_filename)])
     
-    def display_summary(self, df):
-        """Affiche le résumé des résultats."""
+    def display_summary(self, stats):
+        """Affiche le résumé des résultats à partir des compteurs incrémentaux."""
         self.log_message("\n📊 Résumé des statuts:")
         
-        key1_status_column = f"{self.config['key1_column']}_status"
-        if key1_status_column in df.columns:
-            key1_counts = df[key1_status_column].value_counts()
-            self.log_message(f"  {self.config['key1_column']}:")
-            for status, count in key1_counts.items():
-                if pd.notna(status):
-                    self.log_message(f"    {status}: {count}")
-        
-        if self.config['has_two_columns']:
-            key2_status_column = f"{self.config['key2_column']}_status"
-            if key2_status_column in df.columns:
-                key2_counts = df[key2_status_column].value_counts()
-                self.log_message(f"  {self.config['key2_column']}:")
-                for status, count in key2_counts.items():
-                    if pd.notna(status):
-                        self.log_message(f"    {status}: {count}")
-        
-        # Total
         total_verified = 0
-        if key1_status_column in df.columns:
-            total_verified += df[key1_status_column].notna().sum()
-        if self.config['has_two_columns'] and f"{self.config['key2_column']}_status" in df.columns:
-            total_verified += df[f"{self.config['key2_column']}_status"].notna().sum()
+        for status_column, counts in stats.counts.items():
+            self.log_message(f"  {status_column[:-len('_status')]}:")
+            for status, count in counts.most_common():
+                if count:
+                    self.log_message(f"    {status}: {count}")
+            total_verified += stats.status_total(status_column)
         
         self.log_message(f"\n🎯 Total de clés vérifiées: {total_verified}")
         self.log_message("✅ Traitement terminé !")
 
 def main():
+    ready_file = None
+    if "--startup-bench" in sys.argv[:-1]:
+        ready_file = sys.argv[sys.argv.index("--startup-bench") + 1]
+    profiler = StartupProfiler(enabled="--startup-profile" in sys.argv, ready_file=ready_file)
+    profiler.mark("imports de base")
     root = tk.Tk()
-    app = SteamKeysCheckerApp(root)
+    profiler.mark("Tk initialisé")
+    app = SteamKeysCheckerApp(root, profiler)
     root.mainloop()
 
 if __name__ == "__main__":
@@ -0,0 +1,37 @@
+from key_codec import KeySet, decode_keys, dedup_positions, encode_keys, group_duplicates
+
+
+def test_round_trip_15_and_25_characters():
+    keys = ["ABCDE-FGHIJ-KLMNO", "12345-67890-ABCDE-FGHIJ-KLMNO"]
+    codes, valid = encode_keys(keys)
+    assert codes.shape == (2, 3) and valid.all()
+    assert decode_keys(encode_keys(keys[:1])[0]) == keys[:1]
+    assert decode_keys(codes[1:]) == keys[1:]
+
+
+def test_invalid_keys_are_flagged():
+    codes, valid = encode_keys(["abcde-fghij-klmno", "ABCDE-FGHIJ", None, "ÀBCDE-FGHIJ-KLMNO", "ABCDE-FGHIJ-KLMN_"])
+    assert valid.tolist() == [True, False, False, False, False]
+    assert not codes[1:].any()
+
+
+def test_dedup_positions_ignores_case_and_dashes_but_not_invalid_keys():
+    keys = ["AAAAA-BBBBB-CCCCC", "", "aaaaabbbbbccccc", "", "DDDDD-EEEEE-FFFFF"]
+    assert dedup_positions(keys).tolist() == [0, 1, 0, 3, 4]
+
+
+def test_group_duplicates_keeps_first_occurrence_order():
+    items = [(0, "key_1", "BBBBB-BBBBB-BBBBB"), (1, "key_1", "AAAAA-AAAAA-AAAAA"),
+             (2, "key_2", "bbbbb-bbbbb-bbbbb"), (3, "key_1", "AAAAA-AAAAA-AAAAA")]
+    unique_items, duplicates = group_duplicates(items)
+    assert unique_items == items[:2]
+    assert duplicates == {(0, "key_1"): [(2, "key_2")], (1, "key_1"): [(3, "key_1")]}
+
+
+def test_key_set_membership():
+    key_set = KeySet(["AAAAA-BBBBB-CCCCC", "AAAAA-BBBBB-CCCCC", "DDDDD-EEEEE-FFFFF", "bad"])
+    assert len(key_set) == 2
+    assert "dddddeeeeefffff" in key_set
+    assert key_set.contains(["AAAAA-BBBBB-CCCCD", "AAAAA-BBBBB-CCCCC", None]).tolist() == [False, True, False]
+    assert KeySet().contains(["AAAAA-BBBBB-CCCCC"]).tolist() == [False]
+    assert key_set.codes.dtype.kind == "V" and key_set.nbytes == 2 * 16
@@ -0,0 +1,50 @@
+import pandas as pd
+
+from results_io import delta_prefix, list_deltas, merge_deltas, status_change, write_delta
+from status_model import ACTIVATED, INVALID, NOT_ACTIVATED
+
+
+def write_sheet(path, keys):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pd.DataFrame({"key_1": keys, "key_1_status": [None] * len(keys)}).to_csv(path, index=False)
+    return str(path)
+
+
+def test_merge_applies_the_latest_delta(tmp_path):
+    sheet = write_sheet(tmp_path / "keys.csv", ["AAAAA-BBBBB-CCCCC", "DDDDD-EEEEE-FFFFF"])
+    deltas = str(tmp_path / "deltas")
+    first = status_change(0, "key_1_status", None, NOT_ACTIVATED, key="AAAAA-BBBBB-CCCCC")
+    second = status_change(0, "key_1_status", NOT_ACTIVATED, ACTIVATED, key="aaaaa-bbbbb-ccccc")
+    second["timestamp"] = "9999-01-01T00:00:00"
+    write_delta([first, second, status_change(1, "key_1_status", None, INVALID, key="DDDDD-EEEEE-FFFFF")],
+                sheet, deltas)
+
+    df = merge_deltas(sheet, delta_dir=deltas)
+    assert df["key_1_status"].tolist() == [ACTIVATED, INVALID]
+
+
+def test_empty_run_writes_no_delta(tmp_path):
+    sheet = write_sheet(tmp_path / "keys.csv", ["AAAAA-BBBBB-CCCCC"])
+    assert write_delta([], sheet, str(tmp_path / "deltas")) is None
+
+
+def test_same_name_sheets_keep_their_own_deltas(tmp_path):
+    deltas = str(tmp_path / "deltas")
+    first = write_sheet(tmp_path / "a" / "keys.csv", ["AAAAA-BBBBB-CCCCC"])
+    second = write_sheet(tmp_path / "b" / "keys.csv", ["AAAAA-BBBBB-CCCCC"])
+    assert delta_prefix(first) != delta_prefix(second)
+
+    path = write_delta([status_change(0, "key_1_status", None, ACTIVATED, key="AAAAA-BBBBB-CCCCC")], first, deltas)
+    assert list_deltas(first, deltas) == [path]
+    assert list_deltas(second, deltas) == []
+    assert merge_deltas(second, delta_dir=deltas)["key_1_status"].isna().all()
+
+
+def test_rows_that_no_longer_hold_the_key_are_skipped(tmp_path):
+    deltas = str(tmp_path / "deltas")
+    sheet = write_sheet(tmp_path / "keys.csv", ["AAAAA-BBBBB-CCCCC", "DDDDD-EEEEE-FFFFF"])
+    write_delta([status_change(0, "key_1_status", None, ACTIVATED, key="AAAAA-BBBBB-CCCCC")], sheet, deltas)
+
+    # The sheet is re-sorted after the run
+    write_sheet(tmp_path / "keys.csv", ["DDDDD-EEEEE-FFFFF", "AAAAA-BBBBB-CCCCC"])
+    assert merge_deltas(sheet, delta_dir=deltas)["key_1_status"].isna().all()
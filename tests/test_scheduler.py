@@ -0,0 +1,34 @@
+import pandas as pd
+
+from scheduler import RunBudget, default_score, prioritize
+
+ITEMS = [(0, "key_1", "AAAAA-AAAAA-AAAAA"), (1, "key_1", "BBBBB-BBBBB-BBBBB"),
+         (1, "key_2", "CCCCC-CCCCC-CCCCC"), (2, "key_1", "DDDDD-DDDDD-DDDDD")]
+
+
+def test_no_scorer_keeps_file_order():
+    assert prioritize(ITEMS, pd.DataFrame(index=range(3)), None) == ITEMS
+
+
+def test_callable_scorer_orders_by_descending_score_and_keeps_ties_stable():
+    df = pd.DataFrame({"score": [1.0, 5.0, 1.0]})
+    ordered = prioritize(ITEMS, df, lambda frame: frame["score"])
+    assert ordered == [ITEMS[1], ITEMS[2], ITEMS[0], ITEMS[3]]
+
+
+def test_default_score_favours_sent_recent_and_followed_rows():
+    today = pd.Timestamp.now().strftime("%d/%m/%Y")
+    df = pd.DataFrame({"status": ["Distributed", "distributed ", "Draft"],
+                       "date creation": ["01/01/2000", today, today],
+                       "nb_followers": [0, 999, "n/a"]})
+    scores = default_score(df)
+    assert scores.round(3).tolist() == [3.0, 3.0 + 2.0 + 3.0, 2.0]
+    assert prioritize(ITEMS, df) == [ITEMS[1], ITEMS[2], ITEMS[0], ITEMS[3]]
+
+
+def test_run_budget():
+    assert not RunBudget().exhausted(10 ** 6)
+    assert RunBudget(max_checks=3).exhausted(3)
+    assert not RunBudget(max_checks=3).exhausted(2)
+    assert RunBudget(max_minutes=0).exhausted(0)
+    assert RunBudget(max_checks=3, max_minutes=5).describe() == "3 checks / 5 minutes"
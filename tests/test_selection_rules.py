@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from selection_rules import check_rule, compile_rule, select_keys, selection_mask, to_check_rule
+
+
+def mask(rule, df):
+    return compile_rule(rule)(df).tolist()
+
+
+def test_truthy_matches_the_former_to_check_values():
+    df = pd.DataFrame({"to check": ["true", " Yes ", "oui", "1", "2", "1.0", "false", "", None]})
+    assert mask(to_check_rule("to check"), df) == [True, True, True, True, False, False, False, False, False]
+
+
+@pytest.mark.parametrize("values, expected", [
+    ([1, 0, 2], [True, False, True]),
+    ([1.0, 0.0, np.nan], [True, False, False]),
+    ([True, False, True], [True, False, True]),
+])
+def test_truthy_numbers_and_booleans(values, expected):
+    assert mask(to_check_rule("to check"), pd.DataFrame({"to check": values})) == expected
+
+
+def test_missing_cells_are_empty_text():
+    df = pd.DataFrame({"status": ["Distributed", None, "nan"]})
+    assert mask({"column": "status", "eq": "nan"}, df) == [False, False, True]
+    assert mask({"column": "status", "ne": "Distributed"}, df) == [False, True, True]
+    assert mask({"column": "status", "matches": "^n"}, df) == [False, False, True]
+
+
+def test_combinators():
+    df = pd.DataFrame({"lang": ["english", "french", "german"], "nb_followers": [10, 5000, 5000]})
+    rule = {"all": [{"any": [{"column": "lang", "in": ["english", "french"]}, {"column": "nb_followers", "gte": 1000}]},
+                    {"not": {"column": "lang", "eq": "english"}}]}
+    assert mask(rule, df) == [False, True, True]
+
+
+def test_missing_to_check_column_selects_every_row():
+    df = pd.DataFrame({"key_1": ["AAAAA-BBBBB-CCCCC"]})
+    assert selection_mask(df, to_check_rule("to check")).tolist() == [True]
+    check_rule(to_check_rule("to check"), df)
+
+
+def test_check_rule_names_the_missing_column():
+    df = pd.DataFrame({"type": ["press"]})
+    with pytest.raises(ValueError, match="'lang'"):
+        check_rule({"all": [{"column": "type", "eq": "press"}, {"column": "lang", "eq": "fr"}]}, df)
+    with pytest.raises(ValueError):
+        check_rule({"column": "type", "unknown": 1}, df)
+
+
+def test_select_keys_skips_checked_and_empty_keys():
+    df = pd.DataFrame({"key_1": ["AAAAA-BBBBB-CCCCC", "DDDDD-EEEEE-FFFFF", " ", None],
+                       "key_1_status": [None, "Activated", None, None],
+                       "to check": ["yes", "yes", "yes", "yes"]})
+    assert select_keys(df, ["key_1"], to_check_rule("to check")) == [(0, "key_1", "AAAAA-BBBBB-CCCCC")]
@@ -0,0 +1,93 @@
+import os
+
+import pytest
+
+from status_classifier import classify_driver_page, classify_page, detect_locale
+from status_model import ACTIVATED, INVALID, NOT_ACTIVATED, OWNERSHIP_ISSUE, STATUS_NOT_FOUND
+
+BENCH_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                         "chrome-extension", "bench", "responses")
+
+LOGIN_PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head><title>Sign In</title><script>var messages = {activated: "Activated", invalid: "Invalid"};</script></head>
+<body>
+<div id="global_header"><span style="color: #67c1f5">Store</span></div>
+<script>if (!window.ok) { console.log("not activated / not found"); }</script>
+<style>.activated { color: #67c1f5; }</style>
+<form name="logon"><input type="text" name="username"><input type="password" name="password"></form>
+<p>Your session has expired or the account is not activated for this page. Invalid credentials?</p>
+<div id="footer">Page not found? Contact support.</div>
+</body>
+</html>"""
+
+FORM_PAGE = """<!DOCTYPE html>
+<html lang="fr">
+<head><title>Steamworks - Vérifier une clé CD</title></head>
+<body>
+<div id="content">
+<form id="queryForm" action="cdkey" method="get"><input type="text" name="cdkey" value=""></form>
+<p>Saisissez une clé CD activée ou non activée.</p>
+</div>
+</body>
+</html>"""
+
+
+def result_page(cell, lang="en"):
+    return (f'<html lang="{lang}"><body><h2>CD Key Details</h2><table>'
+            f'<tr><th>CD Key</th><th>Status</th></tr><tr><td>AAAAA-BBBBB-CCCCC</td><td>{cell}</td></tr>'
+            f'</table></body></html>')
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("activated.html", ACTIVATED),
+    ("not-activated.html", NOT_ACTIVATED),
+    ("ownership-issue.html", OWNERSHIP_ISSUE),
+])
+def test_bench_fixtures(name, expected):
+    with open(os.path.join(BENCH_DIR, name), encoding="utf-8") as f:
+        page = f.read()
+    assert detect_locale(page) == "fr"
+    assert classify_page(page, detect_locale(page)) == (expected, None)
+
+
+@pytest.mark.parametrize("page", [LOGIN_PAGE, FORM_PAGE])
+def test_page_without_result_is_not_found(page):
+    assert classify_page(page, detect_locale(page)) == (STATUS_NOT_FOUND, None)
+    assert classify_page(page, None) == (STATUS_NOT_FOUND, None)
+
+
+def test_color_wins_over_text():
+    page = result_page('<span style="color: rgb(226, 64, 68)">Activated</span>')
+    assert classify_page(page, "en") == (NOT_ACTIVATED, None)
+
+
+@pytest.mark.parametrize("cell, lang, expected", [
+    ("Nicht aktiviert", "de", NOT_ACTIVATED),
+    ("Activated", "en", ACTIVATED),
+    ("Invalid", "en", INVALID),
+])
+def test_cell_text_fallback(cell, lang, expected):
+    assert classify_page(result_page(cell, lang), lang) == (expected, None)
+
+
+def test_unknown_language_tries_every_language():
+    assert classify_page(result_page("Non attivata", "nl"), None) == (NOT_ACTIVATED, None)
+
+
+class FakeDriver:
+    session_id = "test-session"
+
+    def __init__(self, url, page):
+        self.current_url = url
+        self.page_source = page
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("https://partner.steamgames.com/querycdkey/cdkey?cdkey=AAAAA-BBBBB-CCCCC", ACTIVATED),
+    ("https://partner.steamgames.com/login/?redir=querycdkey%2Fcdkey", STATUS_NOT_FOUND),
+    ("https://partner.steamgames.com/", STATUS_NOT_FOUND),
+])
+def test_result_only_checks_the_url(url, expected):
+    driver = FakeDriver(url, result_page('<span style="color: #67c1f5">Activated</span>'))
+    assert classify_driver_page(driver, result_only=True) == (expected, None)
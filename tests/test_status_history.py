@@ -0,0 +1,46 @@
+import pandas as pd
+import pytest
+
+from status_history import StatusHistory
+from status_model import ACTIVATED, ERROR, NOT_ACTIVATED, STATUS_NOT_FOUND, STOPPED
+
+KEY = "AAAAA-BBBBB-CCCCC"
+
+
+@pytest.fixture
+def history(tmp_path):
+    with StatusHistory(str(tmp_path / "history.sqlite3")) as history:
+        yield history
+
+
+def test_transitions_ignore_non_key_statuses(history):
+    history.record(KEY, NOT_ACTIVATED, "r1", "2025-01-01T00:00:00")
+    history.record(KEY, ERROR, "r2", "2025-01-02T00:00:00")
+    history.record(KEY, STOPPED, "r3", "2025-01-03T00:00:00")
+    history.record(KEY, NOT_ACTIVATED, "r4", "2025-01-04T00:00:00")
+    history.record(KEY, ACTIVATED, "r5", "2025-01-05T00:00:00")
+
+    rows = history.transitions()
+    assert [(row["previous_status"], row["status"]) for row in rows] == [(None, NOT_ACTIVATED),
+                                                                       (NOT_ACTIVATED, ACTIVATED)]
+
+
+def test_streaks_skip_ignored_statuses(history):
+    history.record(KEY, NOT_ACTIVATED, "r1", "2025-01-01T00:00:00")
+    history.record(KEY, ERROR, "r2", "2025-01-02T00:00:00")
+    history.record(KEY, STATUS_NOT_FOUND, "r3", "2025-01-03T00:00:00")
+
+    assert history.streaks(NOT_ACTIVATED) == []
+    rows = history.streaks(NOT_ACTIVATED, ignored={ERROR, STOPPED, STATUS_NOT_FOUND})
+    assert [(row["key"], row["streak_started_at"]) for row in rows] == [(KEY, "2025-01-01T00:00:00")]
+
+
+def test_import_twice_adds_nothing(history, tmp_path):
+    path = tmp_path / "steam_keys_with_status_20250729_171028.csv"
+    pd.DataFrame({"key_1": [KEY, "DDDDD-EEEEE-FFFFF"],
+                  "key_1_status": [ACTIVATED, "Error: timeout"]}).to_csv(path, index=False)
+
+    assert history.import_results_file(str(path)) == 2
+    assert history.import_results_file(str(path)) == 0
+    assert [(row["status"], row["observed_at"]) for row in history.key_history(KEY)] == [
+        (ACTIVATED, "2025-07-29T17:10:28")]
@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from status_model import (ACTIVATED, ERROR, NOT_ACTIVATED, STATUS_DTYPE, UNKNOWN_STATUS, join_status,
+                          normalize_status_columns, split_status, write_status)
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("Activated", (ACTIVATED, None)),
+    (" Not activated ", (NOT_ACTIVATED, None)),
+    ("Error: cdkey field not found", (ERROR, "cdkey field not found")),
+    ("Error", (ERROR, None)),
+    ("Unknown status: Key not found", (UNKNOWN_STATUS, "Key not found")),
+    ("Clé activée", (UNKNOWN_STATUS, "Clé activée")),
+    (None, (None, None)),
+    (np.nan, (None, None)),
+])
+def test_split_status(raw, expected):
+    assert split_status(raw) == expected
+
+
+@pytest.mark.parametrize("raw", ["Activated", "Error: timeout", "Unknown status: Key not found"])
+def test_join_is_the_inverse_of_split(raw):
+    assert join_status(*split_status(raw)) == raw
+
+
+def test_normalize_moves_details_to_their_own_column():
+    df = pd.DataFrame({"key_1_status": ["Activated", "Error: timeout", None],
+                       "key_2_status": ["Not activated", None, None]})
+    normalize_status_columns(df)
+    assert df["key_1_status"].dtype == STATUS_DTYPE and df["key_2_status"].dtype == STATUS_DTYPE
+    assert df["key_1_status"].tolist()[:2] == [ACTIVATED, ERROR]
+    assert df["key_1_status_detail"].tolist()[1] == "timeout"
+    assert "key_2_status_detail" not in df.columns
+
+
+def test_normalize_keeps_existing_details():
+    df = pd.DataFrame({"key_1_status": ["Error: timeout", "Activated"],
+                       "key_1_status_detail": [None, "kept"]})
+    normalize_status_columns(df)
+    assert df["key_1_status_detail"].tolist() == ["timeout", "kept"]
+
+
+def test_write_status_returns_the_previous_status():
+    df = normalize_status_columns(pd.DataFrame({"key_1_status": [None, "Activated"]}))
+    assert pd.isna(write_status(df, 0, "key_1_status", ERROR, "timeout"))
+    assert write_status(df, 1, "key_1_status", NOT_ACTIVATED) == ACTIVATED
+    assert df["key_1_status"].tolist() == [ERROR, NOT_ACTIVATED]
+    assert df["key_1_status_detail"].tolist()[0] == "timeout"
+    assert pd.isna(df["key_1_status_detail"].tolist()[1])
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Steam Keys Checker - Watch mode
+Continuously re-check "Not activated" keys, each on its own adaptive
+schedule, and emit an event as soon as a status flips.
+
+Keys to watch come from the status history (see status_history.py); a key
+that stays unactivated is re-checked less and less often (exponential
+back-off), so the request rate stays low and is spent where it matters.
+
+Usage:
+    python watch_mode.py [--events stdout] [--events file:output/events.ndjson]
+                         [--events webhook:http://127.0.0.1:9000/steam-keys]
+"""
+
+import argparse
+import heapq
+import json
+import logging
+import time
+import urllib.request
+from datetime import datetime
+
+from checker_service import RateLimiter
+from main import STEAMWORKS_URL, check_steam_key, setup_logging, supervised_browser
+from status_history import StatusHistory, new_run_id, normalize_key
+from status_model import (ACTIVATED, INVALID, NON_KEY_STATUSES, NOT_ACTIVATED, OWNERSHIP_ISSUE, STATUS_NOT_FOUND,
+                          UNKNOWN_STATUS, split_status)
+
+WATCHED_STATUS = NOT_ACTIVATED
+# Real key statuses a watched key can flip to: emitted as an event, then the key is dropped
+CHANGED_STATUSES = {ACTIVATED, INVALID, OWNERSHIP_ISSUE}
+# Failed checks and pages that were not a readable result (logged out, markup change):
+# retried at the same pace, and ignored when the watch list is rebuilt from the history
+TRANSIENT_STATUSES = NON_KEY_STATUSES | {STATUS_NOT_FOUND, UNKNOWN_STATUS}
+BASE_INTERVAL = 3600  # Seconds between checks of a freshly sent key
+MAX_INTERVAL = 7 * 24 * 3600  # Back-off ceiling for keys unactivated for weeks
+REFRESH_INTERVAL = 600  # Seconds between reloads of the watch list from the history
+IDLE_POLL = 30  # Longest sleep while waiting for the next due key
+
+
+def initial_interval(last_observed_at, streak_started_at):
+    """Keys that have been unactivated for a long time start with a long interval."""
+    streak = (last_observed_at - streak_started_at).total_seconds()
+    return min(MAX_INTERVAL, max(BASE_INTERVAL, streak / 4))
+
+
+class EventSink:
+    """Fan a status-change event out to stdout, an NDJSON file and/or a local webhook."""
+
+    def __init__(self, targets):
+        self.targets = targets or ["stdout"]
+        self.logger = logging.getLogger(__name__)
+
+    def emit(self, event):
+        line = json.dumps(event)
+        for target in self.targets:
+            try:
+                if target == "stdout":
+                    print(line, flush=True)
+                elif target.startswith("file:"):
+                    with open(target[len("file:"):], "a", encoding="utf-8") as f:
+                        f.write(line + "\n")
+                elif target.startswith("webhook:"):
+                    request = urllib.request.Request(
+                        target[len("webhook:"):], data=line.encode("utf-8"),
+                        headers={"Content-Type": "application/json"}, method="POST")
+                    urllib.request.urlopen(request, timeout=10).close()
+            except Exception as e:
+                self.logger.error(f"Event delivery to {target} failed: {e}")
+
+
+class WatchScheduler:
+    """Min-heap of (due time, key) with a per-key back-off interval."""
+
+    def __init__(self):
+        self.heap = []
+        self.intervals = {}
+
+    def __len__(self):
+        return len(self.intervals)
+
+    def add(self, steam_key, due, interval):
+        key = normalize_key(steam_key)
+        if key in self.intervals:
+            return
+        self.intervals[key] = interval
+        heapq.heappush(self.heap, (due, key))
+
+    def load(self, history):
+        """Pick up keys whose latest status is the watched one (new keys only)."""
+        added = 0
+        for row in history.streaks(WATCHED_STATUS, ignored=TRANSIENT_STATUSES):
+            if row["key"] in self.intervals:
+                continue
+            last = datetime.fromisoformat(row["last_observed_at"])
+            started = datetime.fromisoformat(row["streak_started_at"] or row["last_observed_at"])
+            interval = initial_interval(last, started)
+            self.add(row["key"], last.timestamp() + interval, interval)
+            added += 1
+        return added
+
+    def next_due(self):
+        return self.heap[0][0] if self.heap else None
+
+    def pop(self):
+        _, key = heapq.heappop(self.heap)
+        return key, self.intervals[key]
+
+    def reschedule(self, steam_key, interval):
+        self.intervals[steam_key] = interval
+        heapq.heappush(self.heap, (time.time() + interval, steam_key))
+
+    def drop(self, steam_key):
+        self.intervals.pop(steam_key, None)
+
+
+def watch(browser, history, sink):
+    logger = logging.getLogger(__name__)
+    run_id = new_run_id()
+    rate_limiter = RateLimiter()
+    scheduler = WatchScheduler()
+    scheduler.load(history)
+    last_refresh = time.monotonic()
+    logger.info(f"Watch mode started: {len(scheduler)} keys watched")
+    print(f"👀 Watching {len(scheduler)} '{WATCHED_STATUS}' keys")
+
+    while True:
+        if time.monotonic() - last_refresh >= REFRESH_INTERVAL:
+            added = scheduler.load(history)
+            last_refresh = time.monotonic()
+            if added:
+                logger.info(f"Watch list refreshed: +{added} keys ({len(scheduler)} watched)")
+
+        due = scheduler.next_due()
+        if due is None or due > time.time():
+            wait = IDLE_POLL if due is None else min(IDLE_POLL, due - time.time())
+            time.sleep(max(wait, 0.1))
+            continue
+
+        steam_key, interval = scheduler.pop()
+        rate_limiter.wait()
+        status, detail = split_status(browser.check(check_steam_key, steam_key))
+        history.record(steam_key, status, run_id)
+
+        if status == WATCHED_STATUS:
+            # Still unactivated: back off
+            scheduler.reschedule(steam_key, min(interval * 2, MAX_INTERVAL))
+        elif status in CHANGED_STATUSES:
+            scheduler.drop(steam_key)
+            sink.emit({
+                "event": "status_changed",
+                "key": steam_key,
+                "old_status": WATCHED_STATUS,
+                "new_status": status,
+                "observed_at": datetime.now().isoformat(timespec='seconds'),
+                "run_id": run_id,
+            })
+            logger.info(f"Key {steam_key[:10]}... - {WATCHED_STATUS} -> {status}")
+        else:
+            # Transient failure or unreadable page (TRANSIENT_STATUSES): retry at the same pace
+            if status not in NON_KEY_STATUSES:
+                logger.warning(f"Key {steam_key[:10]}... - {status}" + (f" ({detail})" if detail else "") + ", will retry")
+            scheduler.reschedule(steam_key, interval)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Steam Keys Checker - watch mode")
+    parser.add_argument("--events", action="append",
+                        help="stdout, file:<path> or webhook:<url> (repeatable, default: stdout)")
+    args = parser.parse_args()
+
+    logger = setup_logging()
+    print("🚀 Steam Keys Checker - watch mode")
+    print("=" * 50)
+
+    browser = supervised_browser()  # Unattended: a lost login is only logged
+    browser.driver.get(STEAMWORKS_URL)
+    print("\n🌐 Browser opened. Please log in to Steamworks...")
+    input("⏸️  Once logged in, press Enter to start watching...")
+    browser.save_login()
+
+    history = StatusHistory()
+    try:
+        watch(browser, history, EventSink(args.events))
+    except KeyboardInterrupt:
+        print("\n⏹️  Watch mode stopped")
+    finally:
+        browser.quit()
+        history.close()
+        logger.info("Watch mode stopped, browser closed")
+
+
+if __name__ == "__main__":
+    main()